@@ -2,6 +2,7 @@
 # 📌 lorcarte.py — Commande /lorcarte et !lorcarte
 # Objectif : Affiche une carte Disney Lorcana via Lorcana-api.com
 #           Peut afficher une carte aléatoire si aucun nom n’est fourni
+#           Les cartes sont servies par le catalogue local (utils/lorcana_db.py)
 # Catégorie : LorcanaTCG
 # Accès : Tous
 # Cooldown : 1 utilisation / 5 secondes / utilisateur
@@ -14,21 +15,9 @@ import discord
 import aiohttp
 from discord import app_commands
 from discord.ext import commands
-import random
-import urllib.parse
 
 from utils.discord_utils import safe_send, safe_respond
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Constantes Lorcana
-# ────────────────────────────────────────────────────────────────────────────────
-LORCANA_API_FETCH = "https://api.lorcana-api.com/cards/fetch"
-LORCANA_API_ALL = "https://api.lorcana-api.com/cards/all"
-
-HEADERS = {
-    "User-Agent": "VaactLorcanaBot/1.0",
-    "Accept": "application/json"
-}
+from utils.lorcana_db import lorcana_db
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -45,28 +34,19 @@ class Lorcarte(commands.Cog):
     # ────────────────────────────────────────────────────────────────────────────
     async def fetch_card(self, name: str | None = None) -> dict | None:
         """Récupère une carte Lorcana par nom (fuzzy) ou aléatoire si name=None."""
-        session = self.bot.aiohttp_session
+        try:
+            await lorcana_db.ensure_loaded(self.bot.aiohttp_session)
+        except Exception as e:
+            print(f"[lorcarte] Catalogue indisponible : {e}")
+            return None
 
         if name:
-            # Recherche fuzzy
-            params = {"search": f"Name~{name}", "pagesize": 1, "page": 1}
-            url = f"{LORCANA_API_FETCH}?{urllib.parse.urlencode(params)}"
-            async with session.get(url, headers=HEADERS) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-                if data:
-                    return data[0]
+            card = lorcana_db.find(name)
+            if card:
+                return card
 
         # Fallback aléatoire
-        # On récupère 1000 cartes max et on choisit une aléatoire
-        params = {"pagesize": 1000, "page": 1}
-        url = f"{LORCANA_API_ALL}?{urllib.parse.urlencode(params)}"
-        async with session.get(url, headers=HEADERS) as resp:
-            if resp.status != 200:
-                return None
-            data = await resp.json()
-            return random.choice(data) if data else None
+        return lorcana_db.random_card()
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Création de l'embed carte
@@ -2,6 +2,8 @@
 # 📌 mtgcarte.py — Commande /mtgcarte et !mtgcarte
 # Objectif : Afficher une carte Magic: The Gathering via Scryfall
 #           Peut afficher une carte aléatoire si aucun nom n’est fourni
+#           Les cartes sont servies par le miroir local (utils/mtg_db.py) ;
+#           l'API n'est appelée que tant que le miroir n'est pas chargé
 # Catégorie : MagicTCG
 # Accès : Tous
 # Cooldown : 1 utilisation / 5 secondes / utilisateur
@@ -15,6 +17,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from utils.discord_utils import safe_send, safe_respond
+from utils.mtg_db import mtg_db
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🌐 Constantes Scryfall
@@ -41,9 +44,13 @@ class MTGCarte(commands.Cog):
     # ────────────────────────────────────────────────────────────────────────────
     async def fetch_card(self, name: str | None = None) -> dict | None:
         """
-        Récupère une carte Magic depuis Scryfall en réutilisant la session aiohttp du bot.
+        Récupère une carte Magic depuis le miroir local, ou depuis Scryfall en
+        réutilisant la session aiohttp du bot si le miroir n'est pas encore prêt.
         Si name=None, renvoie une carte aléatoire.
         """
+        if mtg_db.ready:
+            return mtg_db.find(name) if name else mtg_db.random_card()
+
         session = self.bot.aiohttp_session  # ✅ Session globale du bot
 
         if name:
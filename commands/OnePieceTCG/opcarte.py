@@ -2,6 +2,7 @@
 # 📌 opcarte.py — Commande /opcarte et !opcarte
 # Objectif : Affiche une carte One Piece TCG via OPTCG API
 #           Peut afficher une carte aléatoire si aucun nom n’est fourni
+#           Les cartes sont servies par le catalogue local (utils/op_db.py)
 # Catégorie : OnePieceTCG
 # Accès : Tous
 # Cooldown : 1 utilisation / 5 secondes / utilisateur
@@ -14,19 +15,9 @@ import discord
 import aiohttp
 from discord import app_commands
 from discord.ext import commands
-import random
 
 from utils.discord_utils import safe_send, safe_respond
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 🌐 Constantes API
-# ────────────────────────────────────────────────────────────────────────────────
-OPTCG_API_ALL = "https://www.optcgapi.com/api/allSetCards"
-
-HEADERS = {
-    "User-Agent": "VaactOPTCGBot/1.0",
-    "Accept": "application/json"
-}
+from utils.op_db import op_db
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -42,22 +33,19 @@ class OPCarte(commands.Cog):
     # ────────────────────────────────────────────────────────────────────────────
     async def fetch_card(self, name: str | None = None) -> dict | None:
         """Récupère une carte One Piece par nom ou aléatoire si name=None."""
-        session = self.bot.aiohttp_session
-
-        async with session.get(OPTCG_API_ALL, headers=HEADERS) as resp:
-            if resp.status != 200:
-                return None
-            data = await resp.json()
-            if not data:
-                return None
-
-            if name:
-                # Recherche fuzzy (contient)
-                matches = [c for c in data if name.lower() in c.get("card_name", "").lower()]
-                if matches:
-                    return random.choice(matches)
-                # fallback aléatoire si nom non trouvé
-            return random.choice(data)
+        try:
+            await op_db.ensure_loaded(self.bot.aiohttp_session)
+        except Exception as e:
+            print(f"[opcarte] Catalogue indisponible : {e}")
+        if not op_db.ready:
+            return None
+
+        if name:
+            card = op_db.find(name)
+            if card:
+                return card
+            # fallback aléatoire si nom non trouvé
+        return op_db.random_card()
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Création de l'embed carte
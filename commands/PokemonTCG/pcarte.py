@@ -1,6 +1,7 @@
 # ─────────────────────────────────────────────────────────────
 # 📌 pcarte.py — Commande Pokémon TCG
 # Objectif : Afficher une carte Pokémon (ou random)
+#            Recherche dans l'index local (utils/pokemon_db.py), fiches en cache
 # Catégorie : 🃏 Pokémon TCG
 # Accès : Public
 # Cooldown : 1 / 3 sec
@@ -12,12 +13,9 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import aiohttp
-import random
 
 from utils.discord_utils import safe_send
-
-BASE_URL = "https://api.tcgdex.net/v2/en"
+from utils.pokemon_db import pokemon_db
 
 # ─────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -30,30 +28,25 @@ class PokemonCarte(commands.Cog):
     # 🔹 Fonction interne pour afficher une carte
     # ─────────────────────────────────────────────────────────
     async def _show_card(self, channel, query: str | None):
-        async with aiohttp.ClientSession() as session:
-            # 🔀 Random
-            if not query or query.lower() == "random":
-                async with session.get(f"{BASE_URL}/cards") as r:
-                    if r.status != 200:
-                        await safe_send(channel, "❌ Impossible de récupérer une carte.")
-                        return
-                    data = await r.json()
-                    card = random.choice(data) if data else None
-            # 🆔 ID direct
-            elif "-" in query:
-                async with session.get(f"{BASE_URL}/cards/{query}") as r:
-                    if r.status != 200:
-                        await safe_send(channel, "❌ Carte introuvable.")
-                        return
-                    card = await r.json()
-            # 🔍 Recherche par nom
-            else:
-                async with session.get(f"{BASE_URL}/cards", params={"name": query}) as r:
-                    if r.status != 200:
-                        await safe_send(channel, "❌ Carte introuvable.")
-                        return
-                    data = await r.json()
-                    card = random.choice(data) if data else None
+        session = self.bot.aiohttp_session
+        try:
+            await pokemon_db.ensure_loaded(session)
+        except Exception as e:
+            print(f"[pcarte] Index indisponible : {e}")
+
+        # 🔀 Random
+        if not query or query.lower() == "random":
+            brief = pokemon_db.random_card()
+            card_id = brief["id"] if brief else None
+        # 🆔 ID direct
+        elif "-" in query and (query in pokemon_db.by_id or not pokemon_db.ready):
+            card_id = query
+        # 🔍 Recherche par nom
+        else:
+            brief = pokemon_db.find(query)
+            card_id = brief["id"] if brief else None
+
+        card = await pokemon_db.get_detail(session, card_id) if card_id else None
 
         if not card:
             await safe_send(channel, "❌ Carte introuvable.")
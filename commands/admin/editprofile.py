@@ -16,6 +16,7 @@ from discord.ui import View, Button, Modal, TextInput
 import sqlite3
 
 from utils.vaact_utils import get_or_create_profile, DB_PATH
+from utils.vaact_pseudos import NO_PSEUDO, PseudoClaims, pseudo_claims
 from utils.discord_utils import safe_send, safe_edit
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -68,6 +69,8 @@ class ProfileEditView(View):
     async def modify_field(self, interaction: discord.Interaction, field_name: str, new_value):
         if interaction.user.id != self.admin_user.id:
             return await interaction.response.send_message("❌ Ce panel n’est pas pour toi.", ephemeral=True)
+        if field_name == "vaact_name":
+            return await self.modify_vaact_name(interaction, new_value.strip())
         try:
             conn = sqlite3.connect(DB_PATH)
             cursor = conn.cursor()
@@ -80,6 +83,21 @@ class ProfileEditView(View):
         except Exception as e:
             await interaction.response.send_message(f"❌ Erreur : {e}", ephemeral=True)
 
+    async def modify_vaact_name(self, interaction: discord.Interaction, pseudo: str):
+        # Passe par vaact_claims pour garder la liste des pseudos libres cohérente
+        if pseudo in ("", NO_PSEUDO):
+            pseudo_claims.release(self.user_id)
+            result = PseudoClaims.CLAIMED
+        else:
+            result = pseudo_claims.claim(self.user_id, pseudo)
+        if result == PseudoClaims.UNKNOWN:
+            return await interaction.response.send_message(f"❌ `{pseudo}` n'est pas un pseudo VAACT officiel.", ephemeral=True)
+        if result == PseudoClaims.TAKEN:
+            return await interaction.response.send_message(f"❌ `{pseudo}` est déjà pris par un autre joueur.", ephemeral=True)
+        self.profile = await get_or_create_profile(self.user_id)
+        await self.refresh_embed()
+        await interaction.response.send_message("✅ `vaact_name` mis à jour !", ephemeral=True)
+
     async def on_timeout(self):
         for child in self.children:
             child.disabled = True
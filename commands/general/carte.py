@@ -0,0 +1,150 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 carte.py — Commande /carte et !carte
+# Objectif : Chercher un nom de carte dans tous les TCG à la fois (Yu-Gi-Oh!,
+#            Magic, One Piece, Lorcana, Pokémon) et afficher les meilleures
+#            correspondances, quel que soit le jeu
+# Catégorie : Général
+# Accès : Tous
+# Cooldown : 1 utilisation / 3 secondes / utilisateur
+# Remarques : Les catalogues sont interrogés en parallèle, chacun avec son propre
+#             délai ; au-delà du budget global, les plus lents sont annulés.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.card_provider import CardProvider, load_providers
+from utils.discord_utils import safe_send, safe_followup
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+LATENCY_BUDGET = 0.8      # secondes pour l'ensemble de la recherche
+PROVIDER_TIMEOUT = 0.6    # secondes par catalogue
+MATCHES_PER_PROVIDER = 3
+MAX_RESULTS = 5
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔍 Recherche multi-catalogues
+# ────────────────────────────────────────────────────────────────────────────────
+async def _search_provider(provider: CardProvider, query: str) -> list[tuple[float, CardProvider, dict]]:
+    """Meilleures correspondances d'un catalogue, notées de 0 à 1."""
+    if not provider.ready:
+        # Jamais de chargement ici : tasks/card_providers_refresh.py s'en charge
+        return []
+    cards = await asyncio.to_thread(provider.search, query, MATCHES_PER_PROVIDER)
+    return [(provider.score(query, card), provider, card) for card in cards]
+
+
+async def search_all(query: str, providers: list[CardProvider]) -> tuple[list[tuple[float, CardProvider, dict]], list[str]]:
+    """
+    Interroge tous les catalogues en parallèle.
+    Retourne (résultats triés par score, libellés des catalogues hors délai).
+    """
+    tasks = {
+        asyncio.create_task(asyncio.wait_for(_search_provider(p, query), PROVIDER_TIMEOUT)): p
+        for p in providers
+    }
+    done, pending = await asyncio.wait(tasks, timeout=LATENCY_BUDGET)
+    for task in pending:
+        task.cancel()
+
+    results = []
+    skipped = [tasks[t].label for t in pending]
+    for task in done:
+        try:
+            results += task.result()
+        except asyncio.TimeoutError:
+            skipped.append(tasks[task].label)
+        except Exception as e:
+            print(f"[carte] Erreur recherche {tasks[task].key} : {e}")
+    results.sort(key=lambda r: r[0], reverse=True)
+    return results[:MAX_RESULTS], skipped
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class CarteMultiTCG(commands.Cog):
+    """
+    Commande /carte et !carte — Recherche d'une carte dans tous les TCG
+    """
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.providers = load_providers()
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Création de l'embed résultats
+    # ────────────────────────────────────────────────────────────────────────────
+    def build_results_embed(self, query: str, results: list, skipped: list[str]) -> discord.Embed:
+        embed = discord.Embed(
+            title=f"🔎 Résultats pour « {query} »",
+            color=discord.Color.gold()
+        )
+        prefix = self.bot.command_prefix(self.bot, None) if callable(self.bot.command_prefix) else self.bot.command_prefix
+        for score, provider, card in results:
+            embed.add_field(
+                name=f"{provider.label} — {provider.card_name(card)}",
+                value=f"Correspondance : **{round(score * 100)} %**\n`{prefix}{provider.command} {provider.card_name(card)}`",
+                inline=False
+            )
+        if results:
+            image = results[0][1].card_image(results[0][2])
+            if image:
+                embed.set_thumbnail(url=image)
+        if skipped:
+            embed.set_footer(text=f"⏱️ Trop lents, ignorés : {', '.join(skipped)}")
+        return embed
+
+    async def _run(self, query: str) -> tuple[discord.Embed | None, str]:
+        results, skipped = await search_all(query, list(self.providers.values()))
+        if not results:
+            return None, f"❌ Aucune carte trouvée pour `{query}`."
+        return self.build_results_embed(query, results, skipped), ""
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande SLASH
+    # ────────────────────────────────────────────────────────────────────────────
+    @app_commands.command(
+        name="carte",
+        description="Cherche une carte dans tous les jeux (Yu-Gi-Oh!, Magic, One Piece, Lorcana, Pokémon)"
+    )
+    @app_commands.describe(nom="Nom (même approximatif) de la carte")
+    @app_commands.checks.cooldown(1, 3.0, key=lambda i: i.user.id)
+    async def slash_carte(self, interaction: discord.Interaction, nom: str):
+        await interaction.response.defer()
+        embed, message = await self._run(nom)
+        if message:
+            await safe_followup(interaction, message)
+            return
+        await safe_followup(interaction, embed=embed)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande PREFIX
+    # ────────────────────────────────────────────────────────────────────────────
+    @commands.command(name="carte", help="Cherche une carte dans tous les jeux (Yu-Gi-Oh!, Magic, One Piece, Lorcana, Pokémon)")
+    @commands.cooldown(1, 3.0, commands.BucketType.user)
+    async def prefix_carte(self, ctx: commands.Context, *, nom: str = None):
+        if not nom:
+            await safe_send(ctx.channel, "❌ Indique un nom de carte.")
+            return
+        embed, message = await self._run(nom)
+        if message:
+            await safe_send(ctx.channel, message)
+            return
+        await safe_send(ctx.channel, embed=embed)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    cog = CarteMultiTCG(bot)
+    for command in cog.get_commands():
+        if not hasattr(command, "category"):
+            command.category = "Général"
+    await bot.add_cog(cog)
@@ -21,6 +21,7 @@ import random
 import unicodedata
 
 from utils.discord_utils import safe_send, safe_edit
+from utils.mtg_db import mtg_db
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🌐 Constantes Scryfall
@@ -137,22 +138,29 @@ class MTGPendu(commands.Cog):
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Tirage aléatoire d’un mot
     # ────────────────────────────────────────────────────────────────────────────
+    async def _random_card(self) -> dict:
+        """Carte aléatoire du miroir local, ou de Scryfall tant qu'il n'est pas chargé."""
+        if mtg_db.ready:
+            return mtg_db.random_card()
+        session = self.bot.aiohttp_session
+        async with session.get(f"{SCRYFALL_API}/cards/random", headers=HEADERS) as resp:
+            if resp.status != 200:
+                raise ValueError("Carte introuvable")
+            return await resp.json()
+
     async def _fetch_random_word(self):
         try:
-            session = self.bot.aiohttp_session
-            async with session.get(f"{SCRYFALL_API}/cards/random", headers=HEADERS) as resp:
-                if resp.status != 200:
-                    raise ValueError("Carte introuvable")
-                data = await resp.json()
-                nom = data.get("name", "").strip()
-                couleur = ", ".join(data.get("colors", [])) or "Incolore"
-                type_line = data.get("type_line", "Inconnu")
-                set_name = data.get("set_name", "Inconnu")
-                indice = f"{type_line} / {couleur} / {set_name}"
-                mot_normalise = normaliser_texte(nom)
-                if len(mot_normalise) < 3:
-                    raise ValueError("Nom trop court")
-                return nom, mot_normalise, indice
+            data = await self._random_card()
+            # Cartes double face : seule la première face sert de mot
+            nom = data.get("name", "").split(" // ")[0].strip()
+            couleur = ", ".join(data.get("colors", [])) or "Incolore"
+            type_line = data.get("type_line", "Inconnu")
+            set_name = data.get("set_name", "Inconnu")
+            indice = f"{type_line} / {couleur} / {set_name}"
+            mot_normalise = normaliser_texte(nom)
+            if len(mot_normalise) < 3:
+                raise ValueError("Nom trop court")
+            return nom, mot_normalise, indice
         except Exception:
             fallback = [
                 ("Black Lotus", "black lotus", "Artefact / Incolore / Alpha"),
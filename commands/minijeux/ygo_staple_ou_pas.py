@@ -13,10 +13,11 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View
-import aiohttp
 import random
 
 from utils.discord_utils import safe_send, safe_respond, safe_followup
+from utils.ygo_db import card_db, card_fr
+from utils.ygo_staples import staple_index
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ View — Boutons de réponse
@@ -65,25 +66,15 @@ class StapleOuPas(commands.Cog):
         self.bot = bot
 
     # ────────────────────────────────────────────────────────────
-    # 🔹 Helpers pour récupérer les cartes
+    # 🔹 Helpers pour tirer les cartes (liste partagée en mémoire, 0 requête)
     # ────────────────────────────────────────────────────────────
-    async def get_random_staple(self):
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://db.ygoprodeck.com/api/v7/cardinfo.php?staple=yes&language=fr") as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-                cards = data.get("data", [])
-                return random.choice(cards) if cards else None
-
-    async def get_random_card(self):
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://db.ygoprodeck.com/api/v7/cardinfo.php?random=yes&language=fr") as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-                cards = data.get("data", [])
-                return random.choice(cards) if cards else None
+    def get_random_staple(self):
+        card_id = staple_index.random_staple()
+        return card_fr(card_db.get(card_id)) if card_id else None
+
+    def get_random_card(self):
+        card_id = staple_index.random_non_staple()
+        return card_fr(card_db.get(card_id)) if card_id else None
 
     async def build_embed(self, card: dict) -> discord.Embed:
         name = card.get("name", "Carte inconnue")
@@ -103,7 +94,7 @@ class StapleOuPas(commands.Cog):
     # ────────────────────────────────────────────────────────────
     async def play_round(self, ctx_or_inter, is_slash: bool):
         is_staple = random.choice([True, False])
-        card = await (self.get_random_staple() if is_staple else self.get_random_card())
+        card = self.get_random_staple() if is_staple else self.get_random_card()
         if not card:
             msg = "❌ Impossible de tirer une carte."
             return await (safe_followup(ctx_or_inter, msg) if is_slash else safe_send(ctx_or_inter, msg))
@@ -16,6 +16,7 @@ from discord.ui import View, Button
 import aiohttp
 import random
 
+from utils.card_utils import fetch_all_cards_fr
 from utils.discord_utils import safe_send, safe_edit
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -26,31 +27,23 @@ def card_value(level: int) -> int:
     return level if level and level > 0 else 1
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 🔧 Fetch 50 cartes monstres de niveau 1+ via YGOPRODeck (API v7 OK)
+# 🔧 50 cartes monstres de niveau 1+ (base locale, sinon API YGOPRODeck)
 # ────────────────────────────────────────────────────────────────────────────────
 async def fetch_monsters(session: aiohttp.ClientSession):
-    url = "https://db.ygoprodeck.com/api/v7/cardinfo.php?language=fr"
-
-    async with session.get(url) as resp:
-        if resp.status != 200:
-            print("[YGO BJ] HTTP error:", resp.status)
-            return []
-
-        data = await resp.json()
-
-        if "data" not in data:
-            print("[YGO BJ] API error:", data)
-            return []
-
-        monsters = [
-            c for c in data["data"]
-            if "Monster" in c.get("type", "")
-            and c.get("level") is not None
-            and c["level"] >= 1
-        ]
-
-        random.shuffle(monsters)
-        return monsters[:50]
+    all_cards = await fetch_all_cards_fr(session)
+    if not all_cards:
+        print("[YGO BJ] Aucune carte disponible")
+        return []
+
+    monsters = [
+        c for c in all_cards
+        if "Monster" in c.get("type", "")
+        and c.get("level") is not None
+        and c["level"] >= 1
+    ]
+
+    random.shuffle(monsters)
+    return monsters[:50]
 
 
 # ────────────────────────────────────────────────────────────────────────────────
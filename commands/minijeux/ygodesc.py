@@ -17,10 +17,12 @@ import random
 import re
 import sqlite3
 from difflib import SequenceMatcher
-import aiohttp
 
+from utils.card_utils import fetch_all_cards_fr
 from utils.discord_utils import safe_send, safe_reply, safe_edit
 from utils.vaact_utils import add_exp_for_streak, DB_PATH
+from utils.ygo_db import card_db, card_fr
+from utils.ygo_similar import card_similarity
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔒 Empêcher l'utilisation en MP
@@ -152,11 +154,8 @@ class YGODescription(commands.Cog):
         self.active_sessions[guild_id] = True
 
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://db.ygoprodeck.com/api/v7/cardinfo.php?language=fr"
-                async with session.get(url) as resp:
-                    data = await resp.json()
-                    cards = random.sample(data.get("data", []), min(100, len(data.get("data", []))))
+            all_cards = await fetch_all_cards_fr(self.bot.aiohttp_session)
+            cards = random.sample(all_cards, min(100, len(all_cards)))
 
             main_card = next((c for c in cards if "desc" in c and is_clean_card(c)), None)
             if not main_card:
@@ -168,16 +167,21 @@ class YGODescription(commands.Cog):
             archetype = main_card.get("archetype")
             type_group = get_type_group(main_type)
 
-            if archetype:
-                group = [c for c in cards if c.get("name") != main_name and "desc" in c]
-            else:
-                group = [c for c in cards if c.get("name") != main_name and "desc" in c and get_type_group(c.get("type",""))==type_group and is_clean_card(c)]
-                group.sort(key=lambda c: common_word_score(main_name,c["name"])+similarity_ratio(main_name,c["name"]), reverse=True)
-
-            if len(group) < 3:
-                return await safe_send(ctx_or_inter,"❌ Pas assez de fausses cartes valides.")
-
-            wrongs = random.sample(group,3)
+            # Leurres : voisins les plus proches dans la table de similarité, sinon tirage dans l'échantillon
+            wrongs = []
+            if card_similarity.ready and main_card.get("id"):
+                wrongs = [card_fr(card_db.get(i)) for i in card_similarity.distractors(main_card["id"], 3)]
+            if len(wrongs) < 3:
+                if archetype:
+                    group = [c for c in cards if c.get("name") != main_name and "desc" in c]
+                else:
+                    group = [c for c in cards if c.get("name") != main_name and "desc" in c and get_type_group(c.get("type",""))==type_group and is_clean_card(c)]
+                    group.sort(key=lambda c: common_word_score(main_name,c["name"])+similarity_ratio(main_name,c["name"]), reverse=True)
+
+                if len(group) < 3:
+                    return await safe_send(ctx_or_inter,"❌ Pas assez de fausses cartes valides.")
+
+                wrongs = random.sample(group,3)
             choices = [main_name]+[c["name"] for c in wrongs]
             random.shuffle(choices)
 
@@ -16,8 +16,11 @@ from discord.ui import View, Button
 import random
 import traceback
 
+from utils.card_utils import fetch_all_cards_fr
 from utils.discord_utils import safe_send, safe_edit
 from utils.vaact_utils import add_exp_for_streak
+from utils.ygo_db import card_db, card_fr
+from utils.ygo_similar import card_similarity
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔒 Empêcher l'utilisation en MP
@@ -45,21 +48,17 @@ class YGOIllustration(commands.Cog):
     # 🔹 Fonctions utilitaires
     # ────────────────────────────────────────────────────────────────────────────
     async def fetch_all_cards(self):
-        url = "https://db.ygoprodeck.com/api/v7/cardinfo.php?language=fr"
         session = getattr(self.bot, "aiohttp_session", None)
-        if not session or session.closed:
-            return []
-        try:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
-            return data.get("data", [])
-        except Exception as e:
-            print(f"[fetch_all_cards ERROR] {e}")
+        if not card_db.ready and (not session or session.closed):
             return []
+        return await fetch_all_cards_fr(session)
 
     async def get_similar_cards(self, all_cards, true_card):
+        # Voisins les plus proches (effet, archétype, stats) quand la table est prête
+        if card_similarity.ready and true_card.get("id"):
+            similar = [card_fr(card_db.get(i)) for i in card_similarity.distractors(true_card["id"], 3)]
+            if len(similar) == 3:
+                return similar
         archetype = true_card.get("archetype")
         card_type = true_card.get("type", "")
         if archetype:
@@ -16,6 +16,8 @@ import aiohttp
 import random
 
 from utils.discord_utils import safe_send, safe_edit
+from utils.ygo_db import card_fr
+from utils.ygo_random import random_buckets
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎰 Roulette : types + poids
@@ -32,9 +34,11 @@ def spin_roulette():
     return random.choices(types, weights=weights, k=1)[0]
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 🔹 Récupération carte aléatoire via YGOPRODeck
+# 🔹 Récupération carte aléatoire (base locale, sinon YGOPRODeck)
 # ────────────────────────────────────────────────────────────────────────────────
 async def fetch_random_card(card_type: str):
+    if random_buckets.ready:
+        return card_fr(random_buckets.draw(type=card_type))
     url_type_map = {
         "monster": "Monster",
         "spell": "Spell%20Card",
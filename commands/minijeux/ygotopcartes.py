@@ -13,9 +13,9 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
-import aiohttp
 import random
 
+from utils.card_utils import fetch_all_cards_fr
 from utils.discord_utils import safe_send, safe_edit
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -157,25 +157,19 @@ class TopCarte(commands.Cog):
     # 🔹 Récupération des cartes aléatoires
     # ────────────────────────────────────────────────────────────────────────────
     async def _get_random_cards(self):
-        url = "https://db.ygoprodeck.com/api/v7/cardinfo.php?language=fr"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    return None
-
-                data = await resp.json()
-                all_cards = data.get("data", [])
-                sample = random.sample(all_cards, 5)
-
-                return [
-                    {
-                        "name": c["name"],
-                        "desc": c["desc"],
-                        "image": c.get("card_images", [{}])[0].get("image_url")
-                    }
-                    for c in sample
-                ]
+        all_cards = await fetch_all_cards_fr(self.bot.aiohttp_session)
+        if len(all_cards) < 5:
+            return None
+        sample = random.sample(all_cards, 5)
+
+        return [
+            {
+                "name": c["name"],
+                "desc": c["desc"],
+                "image": c.get("card_images", [{}])[0].get("image_url")
+            }
+            for c in sample
+        ]
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Fonction interne commune
@@ -2,9 +2,13 @@
 # 📌 classement.py — Commande interactive !classement
 # Objectif :
 #   - Afficher le classement paginé du tournoi depuis Google Sheets
+#   - Flèches de progression depuis le classement précédent
+#   - Historique de rang et de points d'un joueur (joueur:<nom>)
 # Catégorie : VAACT
 # Accès : Public
 # Cooldown : 1 utilisation / 5 sec / utilisateur
+# Remarques : Classement servi par utils/vaact_classement.py (cache mémoire,
+#             revalidation en arrière-plan, copie disque de secours).
 # ────────────────────────────────────────────────────────────────────────────────
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -14,21 +18,25 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
-import aiohttp
-import csv
-import io
-import os
+import asyncio
+from datetime import datetime
 
 from utils.discord_utils import safe_send, safe_edit
+from utils.text_utils import normaliser_nom
+from utils.vaact_classement import classement_store
+from utils.vaact_history import find_player, player_history, player_on_sheet, rank_changes
+
+HISTORY_LINES = 15  # dernières évolutions affichées pour un joueur
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ View — Pagination interactive
 # ────────────────────────────────────────────────────────────────────────────────
 class ClassementView(View):
-    def __init__(self, bot, classement: list[tuple], user_id: int, page: int = 0, page_size: int = 10, parent=None):
+    def __init__(self, bot, classement: list[tuple], user_id: int, page: int = 0, page_size: int = 10, parent=None, arrows=None):
         super().__init__(timeout=120)
         self.bot = bot
         self.classement = classement
+        self.arrows = arrows or {}
         self.user_id = user_id
         self.page = page
         self.page_size = page_size
@@ -51,7 +59,7 @@ class ClassementView(View):
     async def prev_button(self, interaction: discord.Interaction, button: Button):
         if self.page > 0:
             self.page -= 1
-            embed = self.parent.create_embed(self.classement, self.page, self.page_size)
+            embed = self.parent.create_embed(self.classement, self.page, self.page_size, self.arrows)
             self.prev_button.disabled = (self.page == 0)
             self.next_button.disabled = False
             await safe_edit(interaction.message, embed=embed, view=self)
@@ -61,7 +69,7 @@ class ClassementView(View):
         max_page = (len(self.classement) - 1) // self.page_size
         if self.page < max_page:
             self.page += 1
-            embed = self.parent.create_embed(self.classement, self.page, self.page_size)
+            embed = self.parent.create_embed(self.classement, self.page, self.page_size, self.arrows)
             self.next_button.disabled = (self.page == max_page)
             self.prev_button.disabled = False
             await safe_edit(interaction.message, embed=embed, view=self)
@@ -74,17 +82,22 @@ class Classement(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.sheet_csv_url = os.getenv("VAACT_CLASSEMENT_SHEET")
-
-    async def fetch_csv(self):
-        async with aiohttp.ClientSession() as session:
-            resp = await session.get(self.sheet_csv_url)
-            if resp.status != 200:
-                return None
-            text = await resp.text()
-            return list(csv.reader(io.StringIO(text)))
 
-    def create_embed(self, classement, page, page_size=10):
+    @staticmethod
+    def rank_arrow(rank: int, previous: int | None, known: bool) -> str:
+        """▲n / ▼n depuis le classement précédent, 🆕 pour un joueur qui vient d'apparaître."""
+        if not known:
+            return ""
+        if previous is None:
+            return " 🆕"
+        if previous > rank:
+            return f" ▲{previous - rank}"
+        if previous < rank:
+            return f" ▼{rank - previous}"
+        return ""
+
+    def create_embed(self, classement, page, page_size=10, arrows=None):
+        arrows = arrows or {}
         total_pages = (len(classement) - 1) // page_size + 1
         embed = discord.Embed(
             title=f"🏆 Classement VAACT — Page {page+1}/{total_pages}",
@@ -96,33 +109,64 @@ class Classement(commands.Cog):
         lignes = []
         for i, (joueur, pts) in enumerate(classement[start:end], start=start):
             prefix = medals[i] if i < 3 else f"{i+1}ᵉ"
-            lignes.append(f"**{prefix}** {joueur} — {pts} pts")
+            norm = normaliser_nom(joueur)
+            arrow = self.rank_arrow(i + 1, arrows.get(norm), bool(arrows) and norm in arrows)
+            lignes.append(f"**{prefix}** {joueur} — {pts} pts{arrow}")
         embed.add_field(name="Joueurs", value="\n".join(lignes), inline=False)
         return embed
 
     async def _show_classement(self, channel, user_id):
-        rows = await self.fetch_csv()
-        if not rows or len(rows) < 3:
-            await safe_send(channel, "❌ Impossible de récupérer le classement.")
-            return
-
-        classement = []
-        for row in rows[2:]:  # on saute les 2 premières lignes
-            if len(row) < 6 or not row[2].strip():
-                break
-            joueur = row[2].strip()
-            pts = row[5].strip() or "0"
-            classement.append((joueur, pts))
-
+        classement = await classement_store.get(self.bot.aiohttp_session)
         if not classement:
-            await safe_send(channel, "❌ Aucun joueur trouvé dans le classement.")
+            await safe_send(channel, "❌ Impossible de récupérer le classement.")
             return
 
+        arrows = await asyncio.to_thread(rank_changes)
         page_size = 10
-        view = ClassementView(self.bot, classement, user_id, page=0, page_size=page_size, parent=self)
-        embed = self.create_embed(classement, 0, page_size)
+        view = ClassementView(self.bot, classement, user_id, page=0, page_size=page_size, parent=self, arrows=arrows)
+        embed = self.create_embed(classement, 0, page_size, arrows)
         view.message = await safe_send(channel, embed=embed, view=view)
 
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Historique d'un joueur
+    # ────────────────────────────────────────────────────────────────────────────
+    def create_history_embed(self, name: str, history: list[tuple[float, int, float]], on_sheet: bool = True) -> discord.Embed:
+        _, rank, points = history[-1]
+        best = min(r for _, r, _ in history)
+        if on_sheet:
+            current = f"Rang actuel : **{rank}ᵉ** — **{points:g} pts**"
+        else:
+            current = f"🚪 Ne figure plus au classement (dernier rang connu : **{rank}ᵉ** — **{points:g} pts**)"
+        embed = discord.Embed(
+            title=f"📈 Historique VAACT — {name}",
+            description=f"{current}\nMeilleur rang : **{best}ᵉ**",
+            color=discord.Color.gold() if on_sheet else discord.Color.light_grey()
+        )
+        lignes = []
+        previous = None
+        for taken_at, r, pts in history[-HISTORY_LINES:]:
+            date = datetime.fromtimestamp(taken_at).strftime("%d/%m/%Y")
+            arrow = self.rank_arrow(r, previous, previous is not None)
+            lignes.append(f"`{date}` — {r}ᵉ, {pts:g} pts{arrow}")
+            previous = r
+        embed.add_field(name="Évolutions", value="\n".join(lignes), inline=False)
+        return embed
+
+    async def _show_joueur(self, channel, joueur: str):
+        # Le classement courant est historisé au passage s'il vient d'être téléchargé
+        await classement_store.get(self.bot.aiohttp_session)
+        player = await asyncio.to_thread(find_player, joueur)
+        if not player:
+            await safe_send(channel, f"❌ Aucun joueur trouvé pour `{joueur}`.")
+            return
+        player_id, name = player
+        history = await asyncio.to_thread(player_history, player_id)
+        if not history:
+            await safe_send(channel, f"❌ Pas encore d'historique pour **{name}**.")
+            return
+        on_sheet = await asyncio.to_thread(player_on_sheet, player_id)
+        await safe_send(channel, embed=self.create_history_embed(name, history, on_sheet))
+
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande SLASH
     # ────────────────────────────────────────────────────────────────────────────
@@ -130,10 +174,14 @@ class Classement(commands.Cog):
         name="classement",
         description="Affiche le classement du tournoi avec pagination interactive."
     )
+    @app_commands.describe(joueur="Nom d'un joueur pour afficher son historique de rang et de points")
     @app_commands.checks.cooldown(rate=1, per=5.0, key=lambda i: i.user.id)
-    async def slash_classement(self, interaction: discord.Interaction):
+    async def slash_classement(self, interaction: discord.Interaction, joueur: str = None):
         await interaction.response.defer()
-        await self._show_classement(interaction.channel, interaction.user.id)
+        if joueur:
+            await self._show_joueur(interaction.channel, joueur)
+        else:
+            await self._show_classement(interaction.channel, interaction.user.id)
         await interaction.delete_original_response()
 
     # ────────────────────────────────────────────────────────────────────────────
@@ -142,11 +190,14 @@ class Classement(commands.Cog):
     @commands.command(
         name="vaact_classement",
         aliases=["vaact_top", "topvaact"],
-        help="🏆 Affiche le classement du tournoi avec pagination interactive."
+        help="🏆 Affiche le classement du tournoi avec pagination interactive, ou l'historique d'un joueur."
     )
     @commands.cooldown(1, 5.0, commands.BucketType.user)
-    async def prefix_classement(self, ctx: commands.Context):
-        await self._show_classement(ctx.channel, ctx.author.id)
+    async def prefix_classement(self, ctx: commands.Context, *, joueur: str = None):
+        if joueur:
+            await self._show_joueur(ctx.channel, joueur)
+        else:
+            await self._show_classement(ctx.channel, ctx.author.id)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔌 Setup du Cog
@@ -1,6 +1,7 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📌 deck.py — Commande interactive !deck et /deck
 # Objectif : Choisir une saison + un duelliste et afficher ses decks (sans astuces)
+#            et les statistiques précalculées de ses listes (data/decks/)
 # Catégorie : VAACT
 # Accès : Tous
 # Cooldown : 1 utilisation / 3 secondes / utilisateur
@@ -9,8 +10,6 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
-import os
-import json
 import sqlite3
 
 import discord
@@ -20,23 +19,14 @@ from discord.ui import View, Select, Button
 
 from utils.vaact_utils import DB_PATH, get_or_create_profile
 from utils.discord_utils import safe_send, safe_respond
+from utils.vaact_deck_stats import deck_stats
+from utils.vaact_decks import deck_catalogue
+from utils.ygo_banlist import STATUS_FR, display_name
+from utils.ygo_db import card_db
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 📂 Chargement du fichier JSON deck_data.json
+# 🔧 Mise en forme
 # ────────────────────────────────────────────────────────────────────────────────
-DECK_JSON_PATH = os.path.join("data", "deck_data.json")
-
-
-def load_deck_data() -> dict:
-    """Charge deck_data.json une seule fois au démarrage. Retourne {} en cas d'erreur."""
-    try:
-        with open(DECK_JSON_PATH, encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[deck] Erreur chargement JSON : {e}")
-        return {}
-
-
 def format_deck(deck_data) -> str:
     """
     Formate les données d'un deck pour l'affichage dans un embed Discord.
@@ -62,16 +52,35 @@ def format_deck(deck_data) -> str:
 
     return "❌ Format de deck non reconnu."
 
+
+def format_stats(stats: dict) -> str:
+    """Résumé des statistiques précalculées d'une liste (vaact_deck_stats)."""
+    counts = stats["counts"]
+    lines = [f"📦 Main **{counts['deck']}** · Extra **{counts['extra']}** · Side **{counts['side']}**"]
+    if stats["kinds"]:
+        lines.append("🃏 " + " · ".join(f"{k} {n}" for k, n in stats["kinds"].items()))
+    if stats["attributes"]:
+        lines.append("✨ " + " · ".join(f"{a} {n}" for a, n in stats["attributes"].items()))
+    if stats["levels"]:
+        lines.append("⭐ " + " · ".join(f"Niv.{lvl} ×{n}" for lvl, n in stats["levels"].items()))
+    if stats["price"]:
+        lines.append(f"💶 Prix total : **{stats['price']:.2f} €** (Cardmarket)")
+    for v in stats["violations"]:
+        lines.append(f"⛔ {display_name(card_db.get(v['id']))} ×{v['copies']} — {STATUS_FR.get(v['status'], v['status'])} (TCG)")
+    if stats["unresolved"]:
+        # Ni comptées ni vérifiées : le nom de la liste ne correspond exactement à aucune carte
+        unresolved = stats["unresolved"]
+        more = f" (+{len(unresolved) - 5})" if len(unresolved) > 5 else ""
+        lines.append(f"❔ Non reconnues, hors statistiques : {', '.join(unresolved[:5])}{more}")
+    return "\n".join(lines)
+
 # ────────────────────────────────────────────────────────────────────────────────
 # 📅 Select Saison
 # ────────────────────────────────────────────────────────────────────────────────
 class SaisonSelect(Select):
     def __init__(self, parent: "DeckView"):
         self.parent = parent
-        options = [
-            discord.SelectOption(label=s, value=s, default=(s == parent.saison))
-            for s in parent.deck_data
-        ]
+        options = deck_catalogue.saison_options(parent.saison)
         super().__init__(placeholder="📅 Choisis une saison", options=options)
 
     async def callback(self, interaction: discord.Interaction):
@@ -85,7 +94,7 @@ class SaisonSelect(Select):
 class DuellisteSelect(Select):
     def __init__(self, parent: "DeckView"):
         self.parent = parent
-        options = self._build_options(parent)
+        options = deck_catalogue.duelliste_options(parent.saison, parent.duelliste)
         disabled = not options
         placeholder = "👤 Choisis un duelliste" if options else "Aucun duelliste disponible"
         # Discord exige au moins 1 option même si le select est désactivé
@@ -95,14 +104,6 @@ class DuellisteSelect(Select):
             disabled=disabled,
         )
 
-    @staticmethod
-    def _build_options(parent: "DeckView") -> list[discord.SelectOption]:
-        duellistes = sorted(parent.deck_data.get(parent.saison, {}).keys())
-        return [
-            discord.SelectOption(label=d, value=d, default=(d == parent.duelliste))
-            for d in duellistes
-        ]
-
     async def callback(self, interaction: discord.Interaction):
         self.parent.duelliste = self.values[0]
         await self.parent.refresh(interaction)
@@ -155,11 +156,10 @@ class DeckView(View):
       - un bouton pour sauvegarder le deck favori
     """
 
-    def __init__(self, deck_data: dict, author_id: int):
+    def __init__(self, author_id: int):
         super().__init__(timeout=300)
-        self.deck_data = deck_data
         self.author_id = author_id
-        self.saison: str = list(deck_data.keys())[0]
+        self.saison: str = deck_catalogue.saisons[0]
         self.duelliste: str | None = None
         self._rebuild_components()
 
@@ -176,8 +176,7 @@ class DeckView(View):
 
     def _build_embed(self) -> discord.Embed:
         """Construit l'embed avec les infos du duelliste sélectionné."""
-        infos = self.deck_data.get(self.saison, {}).get(self.duelliste, {})
-        deck_text = format_deck(infos.get("deck", {}))
+        deck_text = format_deck(deck_catalogue.deck(self.saison, self.duelliste))
 
         embed = discord.Embed(
             title=f"🎴 Deck de {self.duelliste}",
@@ -185,6 +184,19 @@ class DeckView(View):
             color=discord.Color.gold(),
         )
         embed.add_field(name="📘 Deck(s)", value=deck_text, inline=False)
+
+        # Statistiques précalculées des listes data/decks/ de ce duelliste
+        deck = deck_catalogue.deck(self.saison, self.duelliste)
+        niveaux = list(deck) if isinstance(deck, dict) and deck else [None]
+        seen = set()
+        for niveau in niveaux:
+            file = deck_stats.deck_file(self.duelliste, niveau)
+            if file is None or file in seen:
+                continue
+            seen.add(file)
+            stats = deck_stats.stats(file)
+            if stats:
+                embed.add_field(name=f"📊 Liste « {file.removesuffix('.json')} »", value=format_stats(stats)[:1024], inline=False)
         return embed
 
     async def refresh(self, interaction: discord.Interaction):
@@ -212,7 +224,6 @@ class Deck(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.deck_data: dict = load_deck_data()  # chargé une fois au démarrage du bot
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande SLASH
@@ -220,10 +231,12 @@ class Deck(commands.Cog):
     @app_commands.command(name="vaact_deck", description="Choisis une saison et un duelliste pour voir ses decks")
     @app_commands.checks.cooldown(1, 3.0, key=lambda i: i.user.id)
     async def slash_deck(self, interaction: discord.Interaction):
-        if not self.deck_data:
+        if not deck_catalogue.ensure_fresh():
             return await safe_respond(interaction, "❌ Impossible de charger les decks.")
-        view = DeckView(self.deck_data, author_id=interaction.user.id)
+        view = DeckView(author_id=interaction.user.id)
         await interaction.response.send_message("📦 Choisis une saison :", view=view, ephemeral=True)
+        # Listes ajoutées ou modifiées : recalculées hors boucle pendant que l'utilisateur choisit
+        await deck_stats.refresh()
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande PREFIX
@@ -231,10 +244,11 @@ class Deck(commands.Cog):
     @commands.command(name="vaact_deck", aliases=["vaaactdeck"], help="Choisis une saison et un duelliste pour voir ses decks")
     @commands.cooldown(1, 3.0, commands.BucketType.user)
     async def prefix_deck(self, ctx: commands.Context):
-        if not self.deck_data:
+        if not deck_catalogue.ensure_fresh():
             return await safe_send(ctx.channel, "❌ Impossible de charger les decks.")
-        view = DeckView(self.deck_data, author_id=ctx.author.id)
+        view = DeckView(author_id=ctx.author.id)
         await safe_send(ctx.channel, "📦 Choisis une saison :", view=view)
+        await deck_stats.refresh()
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔌 Setup du Cog
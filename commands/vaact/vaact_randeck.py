@@ -13,25 +13,9 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
-import json
-import os
-import random
 
-from utils.discord_utils import safe_send, safe_respond  
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 📂 Chargement des données JSON
-# ────────────────────────────────────────────────────────────────────────────────
-DATA_JSON_PATH = os.path.join("data", "deck_data.json")
-
-def load_data():
-    """Charge le fichier JSON contenant les decks."""
-    try:
-        with open(DATA_JSON_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[ERREUR JSON] Impossible de charger {DATA_JSON_PATH} : {e}")
-        return {}
+from utils.discord_utils import safe_send, safe_respond
+from utils.vaact_decks import deck_catalogue
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ View Boutons Deck
@@ -58,30 +42,16 @@ class VaactRandeck(commands.Cog):
     # 🔹 Fonction interne commune
     # ────────────────────────────────────────────────────────────────────────────
     async def _send_random_deck(self, channel: discord.abc.Messageable, author: discord.Member):
-        data = load_data()
-        if not data:
+        if not deck_catalogue.ensure_fresh():
             await safe_send(channel, "❌ Impossible de charger les données.")
             return
 
-        decks = []
-
-        # Construction liste exploitable
-        for saison, persos in data.items():
-            for duelliste, infos in persos.items():
-                deck_data = infos.get("deck", {})
-                if not isinstance(deck_data, dict):
-                    continue
-
-                for niveau, liens in deck_data.items():
-                    if isinstance(liens, dict) and liens:
-                        decks.append((saison, duelliste, niveau, liens))
-
-        if not decks:
+        # Tirage aléatoire dans le tableau précalculé (saison, duelliste, niveau, liens)
+        pick = deck_catalogue.random_pick()
+        if not pick:
             await safe_send(channel, "❌ Aucun deck disponible.")
             return
-
-        # Tirage aléatoire
-        saison, duelliste, niveau, liens_dict = random.choice(decks)
+        saison, duelliste, niveau, liens_dict = pick
 
         embed = discord.Embed(
             title="🎲 Deck Aléatoire Tiré !",
@@ -137,7 +107,7 @@ class VaactRandeck(commands.Cog):
 # 🔌 Setup du Cog
 # ────────────────────────────────────────────────────────────────────────────────
 async def setup(bot: commands.Bot):
-    cog = Randeck(bot)
+    cog = VaactRandeck(bot)
     for command in cog.get_commands():
         if not hasattr(command, "category"):
             command.category = "VAACT"
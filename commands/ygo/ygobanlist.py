@@ -3,6 +3,7 @@
 # Objectif :
 #   - Affiche les cartes d'une banlist (TCG, OCG, GOAT)
 #   - Pagination interactive (20 cartes par page) via boutons
+#   - Changements depuis la liste précédente (instantanés versionnés)
 # Catégorie : 🃏 Yu-Gi-Oh!
 # Accès : Tous
 # Cooldown : 1 utilisation / 5 secondes / utilisateur
@@ -11,10 +12,11 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import aiohttp
 import json
 from pathlib import Path
 from utils.discord_utils import safe_send, safe_respond
+from utils.ygo_db import card_db
+from utils.ygo_banlist import banlist_store, display_name, STATUS_FR
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📖 Chargement du dictionnaire de traduction des types
@@ -54,12 +56,12 @@ class BanlistPagination(discord.ui.View):
         end = start + self.per_page
         return self.cards[start:end]
 
-    async def update_embed(self, interaction: discord.Interaction, banlist_name: str):
+    def build_embed(self, banlist_name: str) -> discord.Embed:
         current = self.get_page_data()
         total_pages = (len(self.cards) - 1) // self.per_page + 1
 
         description = "\n".join(
-            f"**{c['name']}** — {translate_card_type(c.get('type', 'Inconnu'))}"
+            f"**{c['name']}** — {translate_card_type(c.get('type', 'Inconnu'))} — {STATUS_FR.get(c.get('status'), c.get('status'))}"
             for c in current
         )
 
@@ -68,8 +70,11 @@ class BanlistPagination(discord.ui.View):
             description=description or "Aucune carte à afficher.",
             color=discord.Color.red()
         )
-        embed.set_footer(text=f"{len(self.cards)} cartes au total • 20 par page")
-        await interaction.response.edit_message(embed=embed, view=self)
+        embed.set_footer(text=f"{len(self.cards)} cartes au total • {self.per_page} par page")
+        return embed
+
+    async def update_embed(self, interaction: discord.Interaction, banlist_name: str):
+        await interaction.response.edit_message(embed=self.build_embed(banlist_name), view=self)
 
     @discord.ui.button(label="⬅️ Précédent", style=discord.ButtonStyle.secondary)
     async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -87,22 +92,56 @@ class BanlistPagination(discord.ui.View):
 class Banlist(commands.Cog):
     """Commande /banlist et !banlist — Affiche les cartes d'une banlist (TCG, OCG, GOAT)"""
 
-    BASE_URL = "https://db.ygoprodeck.com/api/v7/cardinfo.php"
-
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    async def fetch_banlist(self, banlist_type: str):
-        """Récupère les cartes selon la banlist choisie (noms en français)."""
-        params = {"banlist": banlist_type, "sort": "name", "language": "fr"}
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.BASE_URL, params=params) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-                for c in data.get("data", []):
-                    c["banlist_name"] = banlist_type
-                return data.get("data", [])
+    def fetch_banlist(self, banlist_type: str) -> list[dict]:
+        """Lit la dernière version de la banlist en mémoire (noms en français)."""
+        cards = []
+        for card_id, status in banlist_store.sorted_entries(banlist_type):
+            card = card_db.get(card_id) or {}
+            cards.append({
+                "name": display_name(card),
+                "type": card.get("type", "Inconnu"),
+                "status": status,
+                "banlist_name": banlist_type,
+            })
+        return cards
+
+    def build_diff_embed(self, banlist_type: str) -> discord.Embed | None:
+        """Embed des changements entre les deux dernières versions connues."""
+        diff = banlist_store.diff(banlist_type)
+        if not diff:
+            return None
+
+        def lines(items) -> str:
+            text = "\n".join(items) or "—"
+            return text if len(text) <= 1024 else text[:1020] + "\n…"
+
+        def nom(card_id: int) -> str:
+            return display_name(card_db.get(card_id))
+
+        embed = discord.Embed(
+            title=f"🔁 Banlist {banlist_type.upper()} — v{diff['old']['version']} → v{diff['new']['version']}",
+            description=f"Du {diff['old']['date']} au {diff['new']['date']}",
+            color=discord.Color.orange()
+        )
+        embed.add_field(
+            name=f"🆕 Nouvelles restrictions ({len(diff['added'])})",
+            value=lines(f"**{nom(cid)}** → {STATUS_FR.get(st, st)}" for cid, st in diff["added"]),
+            inline=False
+        )
+        embed.add_field(
+            name=f"🔀 Changements ({len(diff['changed'])})",
+            value=lines(f"**{nom(cid)}** : {STATUS_FR.get(a, a)} → {STATUS_FR.get(b, b)}" for cid, a, b in diff["changed"]),
+            inline=False
+        )
+        embed.add_field(
+            name=f"✅ Libérées ({len(diff['removed'])})",
+            value=lines(f"**{nom(cid)}** (était {STATUS_FR.get(st, st)})" for cid, st in diff["removed"]),
+            inline=False
+        )
+        return embed
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande SLASH
@@ -111,52 +150,51 @@ class Banlist(commands.Cog):
         name="ygobanlist",
         description="Affiche les cartes d'une banlist (tcg, ocg ou goat) avec pagination."
     )
-    @app_commands.describe(banlist="Type de banlist: tcg, ocg, goat")
+    @app_commands.describe(
+        banlist="Type de banlist: tcg, ocg, goat",
+        changements="Afficher les changements depuis la liste précédente"
+    )
     @app_commands.checks.cooldown(1, 5.0, key=lambda i: i.user.id)
-    async def slash_banlist(self, interaction: discord.Interaction, banlist: str = "tcg"):
+    async def slash_banlist(self, interaction: discord.Interaction, banlist: str = "tcg", changements: bool = False):
         banlist_type = banlist.lower()
         if banlist_type not in ("tcg", "ocg", "goat"):
             return await safe_respond(interaction, "❌ Type de banlist invalide. Utilise `tcg`, `ocg` ou `goat`.")
 
-        await safe_respond(interaction, f"🔄 Récupération de la banlist **{banlist_type.upper()}**…")
-        cards = await self.fetch_banlist(banlist_type)
+        if changements:
+            embed = self.build_diff_embed(banlist_type)
+            if not embed:
+                return await safe_respond(interaction, "ℹ️ Une seule version de cette banlist est connue pour l'instant.")
+            return await safe_respond(interaction, embed=embed)
+
+        cards = self.fetch_banlist(banlist_type)
         if not cards:
-            return await safe_respond(interaction, "❌ Impossible de récupérer les cartes.")
+            return await safe_respond(interaction, "❌ Banlist indisponible (base de cartes en cours de chargement).")
 
         view = BanlistPagination(cards)
-        await view.update_embed(interaction, banlist_type)
+        await safe_respond(interaction, embed=view.build_embed(banlist_type), view=view)
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande PREFIX
     # ────────────────────────────────────────────────────────────────────────────
-    @commands.command(name="ygobanlist", aliases=["ybl"], help="Affiche les cartes d'une banlist (tcg, ocg ou goat) avec pagination.")
+    @commands.command(name="ygobanlist", aliases=["ybl"], help="Affiche les cartes d'une banlist (tcg, ocg ou goat) avec pagination. Ajoute `changements` pour voir les différences avec la liste précédente.")
     @commands.cooldown(1, 5.0, commands.BucketType.user)
-    async def prefix_banlist(self, ctx: commands.Context, banlist: str = "tcg"):
+    async def prefix_banlist(self, ctx: commands.Context, banlist: str = "tcg", option: str = None):
         banlist_type = banlist.lower()
         if banlist_type not in ("tcg", "ocg", "goat"):
             return await safe_send(ctx.channel, "❌ Type de banlist invalide. Utilise `tcg`, `ocg` ou `goat`.")
 
-        msg = await safe_send(ctx.channel, f"🔄 Récupération de la banlist **{banlist_type.upper()}**…")
-        cards = await self.fetch_banlist(banlist_type)
+        if option and option.lower() in ("changements", "diff"):
+            embed = self.build_diff_embed(banlist_type)
+            if not embed:
+                return await safe_send(ctx.channel, "ℹ️ Une seule version de cette banlist est connue pour l'instant.")
+            return await safe_send(ctx.channel, embed=embed)
+
+        cards = self.fetch_banlist(banlist_type)
         if not cards:
-            return await safe_send(ctx.channel, "❌ Impossible de récupérer les cartes.")
+            return await safe_send(ctx.channel, "❌ Banlist indisponible (base de cartes en cours de chargement).")
 
         view = BanlistPagination(cards)
-        current = view.get_page_data()
-        total_pages = (len(cards) - 1) // view.per_page + 1
-
-        description = "\n".join(
-            f"**{c['name']}** — {translate_card_type(c.get('type', 'Inconnu'))}"
-            for c in current
-        )
-
-        embed = discord.Embed(
-            title=f"📌 Cartes sur la banlist {banlist_type.upper()} (Page 1/{total_pages})",
-            description=description or "Aucune carte à afficher.",
-            color=discord.Color.red()
-        )
-        embed.set_footer(text=f"{len(cards)} cartes au total • 20 par page")
-        await msg.edit(content=None, embed=embed, view=view)
+        await safe_send(ctx.channel, embed=view.build_embed(banlist_type), view=view)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔌 Setup du Cog
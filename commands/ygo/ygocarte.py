@@ -2,7 +2,8 @@
 # 📌 carte.py — Commande interactive !carte
 # Objectif :
 #   - Rechercher et afficher les détails d’une carte Yu-Gi-Oh!
-#   - OU tirer une carte aléatoire avec !carte random
+#   - OU tirer une carte aléatoire avec !carte random (filtrable :
+#     !carte random attribut:LIGHT niveau:4)
 #   - Utilise utils/card_utils pour toutes les requêtes API
 # Catégorie : 🃏 Yu-Gi-Oh!
 # Accès : Public
@@ -16,38 +17,19 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
-import json
-from pathlib import Path
 import aiohttp
 import sqlite3
 
 from utils.discord_utils import safe_send
 from utils.card_utils import search_card, fetch_random_card
 from utils.vaact_utils import DB_PATH, get_or_create_profile
-
-# ────────────────────────────────────────────────────────────────────────────────
-# 🎨 Chargement décorations et couleurs
-# ────────────────────────────────────────────────────────────────────────────────
-CARDINFO_PATH = Path("data/cardinfofr.json")
-try:
-    with CARDINFO_PATH.open("r", encoding="utf-8") as f:
-        CARDINFO = json.load(f)
-except FileNotFoundError:
-    print("[ERREUR] Fichier data/cardinfofr.json introuvable.")
-    CARDINFO = {}
-
-ATTRIBUT_EMOJI = CARDINFO.get("ATTRIBUT_EMOJI", {})
-TYPE_EMOJI = CARDINFO.get("TYPE_EMOJI", {})
-TYPE_TRANSLATION = CARDINFO.get("TYPE_TRANSLATION", {})
-SPELL_RACE_TRANSLATION = CARDINFO.get("SPELL_RACE_TRANSLATION", {})
-TRAP_RACE_TRANSLATION = CARDINFO.get("TRAP_RACE_TRANSLATION", {})
-TYPE_COLOR = {}
-for key, hex_code in CARDINFO.get("TYPE_COLOR", {}).items():
-    try:
-        TYPE_COLOR[key] = discord.Color.from_str(hex_code)
-    except Exception:
-        TYPE_COLOR[key] = discord.Color.dark_grey()
-TYPE_COLOR.setdefault("default", discord.Color.dark_grey())
+from utils.ygo_db import card_db
+from utils.ygo_banlist import banlist_store
+from utils.ygo_query import QueryError
+from utils.ygo_random import parse_filters
+from utils.ygo_display import (
+    format_attribute, format_race, pick_embed_color, translate_card_type,
+)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ View — Carte favorite (SQLite local)
@@ -87,41 +69,6 @@ class CarteFavoriteButton(View):
                 "❌ Erreur lors de l’enregistrement de la carte favorite.", ephemeral=True
             )
 
-# ────────────────────────────────────────────────────────────────────────────────
-# 🔧 Helpers pour formatage
-# ────────────────────────────────────────────────────────────────────────────────
-def translate_card_type(type_str: str) -> str:
-    if not type_str:
-        return "Inconnu"
-    t = type_str.lower()
-    for eng, fr in TYPE_TRANSLATION.items():
-        if eng in t:
-            return fr
-    return type_str
-
-def pick_embed_color(type_str: str) -> discord.Color:
-    if not type_str:
-        return TYPE_COLOR.get("default")
-    priority_keys = ["fusion","ritual","synchro","xyz","link","pendulum","spell","trap","token","monster"]
-    t = type_str.lower()
-    for key in priority_keys:
-        if key in t and key in TYPE_COLOR:
-            return TYPE_COLOR[key]
-    return TYPE_COLOR.get("default")
-
-def format_attribute(attr: str) -> str:
-    return ATTRIBUT_EMOJI.get(attr.upper(), attr) if attr else "?"
-
-def format_race(race: str, type_raw: str) -> str:
-    if not race:
-        return "?"
-    t = type_raw.lower()
-    if "spell" in t:
-        return SPELL_RACE_TRANSLATION.get(race, race)
-    if "trap" in t:
-        return TRAP_RACE_TRANSLATION.get(race, race)
-    return TYPE_EMOJI.get(race, race)
-
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔧 Helper pour nom anglais STRICT (banlist)
 # ────────────────────────────────────────────────────────────────────────────────
@@ -136,17 +83,23 @@ async def fetch_english_name_by_id(card_id: int, session: aiohttp.ClientSession)
         return data["data"][0].get("name")
 
 # ────────────────────────────────────────────────────────────────────────────────
-# 🔧 Helper pour fetch banlist exacte (identique à banlist_check)
+# 🔧 Helper pour statut banlist (instantanés locaux, cf. utils/ygo_banlist)
 # ────────────────────────────────────────────────────────────────────────────────
-async def fetch_exact_banlist(card_name: str, session: aiohttp.ClientSession) -> dict:
-    url = "https://db.ygoprodeck.com/api/v7/cardinfo.php"
-    async with session.get(url, params={"name": card_name}) as resp:
-        if resp.status != 200:
-            return {}
-        data = await resp.json()
-        if "data" not in data or not data["data"]:
-            return {}
-        return data["data"][0].get("banlist_info", {})
+def get_banlist_limits(card_id: int, card: dict | None = None) -> dict:
+    """
+    Statut TCG / OCG / GOAT. Tant qu'aucun instantané n'existe pour un format
+    (premier démarrage), on retombe sur banlist_info de la carte, sinon « Inconnu ».
+    """
+    limits = {}
+    fallback = (card or {}).get("banlist_info") or {}
+    for fmt in ("tcg", "ocg", "goat"):
+        if banlist_store.latest(fmt) is not None:
+            limits[f"ban_{fmt}"] = banlist_store.status(card_id, fmt) or "Autorisé"
+        elif card is not None:
+            limits[f"ban_{fmt}"] = fallback.get(f"ban_{fmt}") or "Autorisé"
+        else:
+            limits[f"ban_{fmt}"] = "Inconnu"
+    return limits
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -160,12 +113,26 @@ class Carte(commands.Cog):
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Fonction interne commune
     # ────────────────────────────────────────────────────────────────────────────
-    async def _show_card(self, channel: discord.abc.Messageable, nom: str, user=None):
-        # Tirage aléatoire
-        if not nom or nom.lower() == "random":
-            carte, langue = await fetch_random_card(self.bot.aiohttp_session)
+    async def _show_card(self, channel: discord.abc.Messageable, nom: str, user=None, filters: dict | None = None):
+        # Tirage aléatoire, éventuellement filtré (« random attribut:LIGHT niveau:4 »)
+        mots = (nom or "").split(maxsplit=1)
+        if not mots or mots[0].lower() == "random":
+            try:
+                # Options slash non renseignées (None) : elles n'écrasent pas les filtres tapés
+                filters = {
+                    **parse_filters(mots[1] if len(mots) > 1 else ""),
+                    **{k: v for k, v in (filters or {}).items() if v is not None},
+                }
+                carte, langue = await fetch_random_card(self.bot.aiohttp_session, **filters)
+            except QueryError as e:
+                await safe_send(channel, f"❌ {e}")
+                return
             if not carte:
-                await safe_send(channel, "❌ Impossible de tirer une carte aléatoire depuis l’API.")
+                message = (
+                    "❌ Aucune carte ne correspond à ces filtres." if any(v is not None for v in filters.values())
+                    else "❌ Impossible de tirer une carte aléatoire depuis l’API."
+                )
+                await safe_send(channel, message)
                 return
         else:
             carte, langue, message = await search_card(nom, self.bot.aiohttp_session)
@@ -182,7 +149,10 @@ class Carte(commands.Cog):
             or carte.get("name")
         )
         card_id = carte.get("id")
-        card_name_en = await fetch_english_name_by_id(card_id, self.bot.aiohttp_session)
+        local_card = card_db.get(card_id) if card_id else None
+        card_name_en = local_card.get("name") if local_card else None
+        if not card_name_en:
+            card_name_en = await fetch_english_name_by_id(card_id, self.bot.aiohttp_session)
         if not card_name_en:
             card_name_en = carte.get("name")
 
@@ -198,7 +168,7 @@ class Carte(commands.Cog):
         archetype = carte.get("archetype")
         genesys_points = carte.get("genesys_points")
 
-        banlist_info = await fetch_exact_banlist(card_name_en, self.bot.aiohttp_session)
+        banlist_info = get_banlist_limits(card_id, local_card or carte)
         tcg_limit = banlist_info.get("ban_tcg", "Autorisé")
         ocg_limit = banlist_info.get("ban_ocg", "Autorisé")
         goat_limit = banlist_info.get("ban_goat", "Autorisé")
@@ -250,11 +220,28 @@ class Carte(commands.Cog):
         name="ygocarte",
         description="Rechercher ou tirer une carte Yu-Gi-Oh! (FR/EN/DE/PT/IT)."
     )
-    @app_commands.describe(nom="Nom de la carte ou 'random'")
+    @app_commands.describe(
+        nom="Nom de la carte ou 'random'",
+        type="(random) monstre, magie, piege, jeton",
+        attribut="(random) LIGHT, DARK, lumiere, tenebres…",
+        niveau="(random) Niveau ou rang",
+        archetype="(random) Archétype"
+    )
     @app_commands.checks.cooldown(rate=1, per=3.0, key=lambda i: i.user.id)
-    async def slash_carte(self, interaction: discord.Interaction, nom: str = None):
+    async def slash_carte(
+        self,
+        interaction: discord.Interaction,
+        nom: str = None,
+        type: str = None,
+        attribut: str = None,
+        niveau: int = None,
+        archetype: str = None
+    ):
         await interaction.response.defer()
-        await self._show_card(interaction.channel, nom, user=interaction.user)
+        filters = {"type": type, "attribute": attribut, "level": niveau, "archetype": archetype}
+        if any(v is not None for v in filters.values()) and not nom:
+            nom = "random"
+        await self._show_card(interaction.channel, nom, user=interaction.user, filters=filters)
         await interaction.delete_original_response()
 
     # ────────────────────────────────────────────────────────────────────────────
@@ -263,7 +250,7 @@ class Carte(commands.Cog):
     @commands.command(
         name="ygocarte",
         aliases=["ycarte", "ygocard", "ycard"],
-        help="🔍 Rechercher une carte ou tirer une carte aléatoire avec !carte random."
+        help="🔍 Rechercher une carte ou tirer une carte aléatoire avec !carte random (filtres : type:, attribut:, niveau:, archetype:)."
     )
     @commands.cooldown(1, 3.0, commands.BucketType.user)
     async def prefix_carte(self, ctx: commands.Context, *, nom: str = None):
@@ -0,0 +1,140 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygodeck.py — Commande /ygodeck et !ygodeck
+# Objectif :
+#   - Analyser un fichier .ydk joint au message
+#   - Composition (Main / Extra / Side, types, attributs), prix total
+#   - Légalité TCG / OCG / GOAT selon les dernières banlists connues
+# Catégorie : 🃏 Yu-Gi-Oh!
+# Accès : Public
+# Cooldown : 1 utilisation / 5 secondes / utilisateur
+# Remarques : Tout est résolu sur la base locale (utils/ydk.py), sans appel API par carte.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from collections import Counter
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.discord_utils import safe_send, safe_followup
+from utils.ydk import analyze_deck, read_ydk
+from utils.ygo_db import card_db
+from utils.ygo_display import format_attribute, translate_card_type
+
+MAX_PROBLEMS = 8  # lignes de problèmes affichées par format
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class YGODeck(commands.Cog):
+    """Commande /ygodeck et !ygodeck — Analyse d'un deck .ydk"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Création de l'embed
+    # ────────────────────────────────────────────────────────────────────────────
+    def build_embed(self, filename: str, report: dict) -> discord.Embed:
+        counts = report["counts"]
+        legal = all(not problems for problems in report["legality"].values())
+        embed = discord.Embed(
+            title=f"🗂️ Analyse de {filename}",
+            description=(
+                f"📦 Main **{counts['main']}** · Extra **{counts['extra']}** · Side **{counts['side']}**\n"
+                f"💶 Prix total : **{report['price']:.2f} €** (Cardmarket)"
+            ),
+            color=discord.Color.green() if legal else discord.Color.red()
+        )
+
+        cards = report["cards"]
+        main = report["ids"]["main"]
+        types = Counter(translate_card_type(cards[cid].get("type")) for cid in main)
+        attributes = Counter(cards[cid]["attribute"] for cid in main if cards[cid].get("attribute"))
+        if types:
+            embed.add_field(
+                name="🃏 Types (Main)",
+                value="\n".join(f"{t} ×{n}" for t, n in types.most_common()),
+                inline=True
+            )
+        if attributes:
+            embed.add_field(
+                name="✨ Attributs (Main)",
+                value="\n".join(f"{format_attribute(a)} ×{n}" for a, n in attributes.most_common()),
+                inline=True
+            )
+
+        for fmt, problems in report["legality"].items():
+            if not problems:
+                value = "✅ Légal"
+            else:
+                shown = problems[:MAX_PROBLEMS]
+                if len(problems) > MAX_PROBLEMS:
+                    shown.append(f"… et {len(problems) - MAX_PROBLEMS} autres")
+                value = "❌ " + "\n❌ ".join(shown)
+            embed.add_field(name=f"⚖️ {fmt.upper()}", value=value[:1024], inline=False)
+
+        if report["unknown"]:
+            embed.set_footer(text=f"Codes inconnus : {', '.join(map(str, report['unknown'][:10]))}")
+        return embed
+
+    async def _run(self, attachment: discord.Attachment | None) -> tuple[discord.Embed | None, str]:
+        if attachment is None or not attachment.filename.lower().endswith(".ydk"):
+            return None, "❌ Joins un fichier `.ydk`."
+        if not card_db.ready:
+            return None, "⏳ La base de cartes se charge encore, réessaie dans quelques instants."
+        try:
+            sections = await read_ydk(self.bot.aiohttp_session, attachment.url)
+        except Exception as e:
+            print(f"[ygodeck] Lecture impossible : {e}")
+            return None, "❌ Impossible de lire ce fichier `.ydk`."
+        if not any(sections.values()):
+            return None, "❌ Ce fichier `.ydk` ne contient aucune carte."
+        return self.build_embed(attachment.filename, analyze_deck(sections)), ""
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande SLASH
+    # ────────────────────────────────────────────────────────────────────────────
+    @app_commands.command(
+        name="ygodeck",
+        description="Analyse un deck .ydk : composition, prix et légalité TCG/OCG/GOAT."
+    )
+    @app_commands.describe(fichier="Fichier .ydk du deck")
+    @app_commands.checks.cooldown(rate=1, per=5.0, key=lambda i: i.user.id)
+    async def slash_ygodeck(self, interaction: discord.Interaction, fichier: discord.Attachment):
+        await interaction.response.defer()
+        embed, message = await self._run(fichier)
+        if message:
+            await safe_followup(interaction, message)
+            return
+        await safe_followup(interaction, embed=embed)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande PREFIX
+    # ────────────────────────────────────────────────────────────────────────────
+    @commands.command(
+        name="ygodeck",
+        aliases=["ydk"],
+        help="Analyse un deck .ydk joint au message : composition, prix et légalité."
+    )
+    @commands.cooldown(1, 5.0, commands.BucketType.user)
+    async def prefix_ygodeck(self, ctx: commands.Context):
+        attachment = ctx.message.attachments[0] if ctx.message.attachments else None
+        embed, message = await self._run(attachment)
+        if message:
+            await safe_send(ctx.channel, message)
+            return
+        await safe_send(ctx.channel, embed=embed)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    cog = YGODeck(bot)
+    for command in cog.get_commands():
+        if not hasattr(command, "category"):
+            command.category = "🃏 Yu-Gi-Oh!"
+    await bot.add_cog(cog)
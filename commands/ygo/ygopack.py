@@ -1,6 +1,6 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📌 packopening.py
-# Objectif : Ouvrir un booster Yu-Gi-Oh! aléatoire ou spécifique via l'API YGOPRODeck
+# Objectif : Ouvrir un booster Yu-Gi-Oh! aléatoire ou spécifique depuis l'index local des sets
 # Catégorie : Fun / Jeux
 # Accès : Tous
 # Cooldown : 5 secondes par utilisateur
@@ -13,10 +13,10 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View
-import aiohttp
-import random
 
 from utils.discord_utils import safe_send, safe_edit
+from utils.ygo_db import card_db
+from utils.ygo_sets import set_index
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
@@ -34,64 +34,49 @@ class PackOpening(commands.Cog):
     # ────────────────────────────────────────────────────────────────────────────
     async def _open_booster(self, set_query: str = None, num_cards: int = 5):
         """
-        Récupère les cartes depuis YGOPRODeck et retourne un embed Discord.
+        Tire les cartes depuis l'index local des sets et retourne un embed Discord.
         """
-        async with aiohttp.ClientSession() as session:
-            # Récupère tous les sets
-            async with session.get("https://db.ygoprodeck.com/api/v7/cardsets.php") as resp:
-                sets_data = await resp.json()
-
-            if not sets_data:
-                return None, "❌ Impossible de récupérer les boosters."
-
-            # Choix du set
-            if set_query:
-                set_query_lower = set_query.lower()
-                matching_sets = [
-                    s for s in sets_data
-                    if set_query_lower == s["set_code"].lower() or set_query_lower in s["set_name"].lower()
-                ]
-                if not matching_sets:
-                    return None, f"❌ Aucun set trouvé pour **{set_query}**."
-                chosen_set = matching_sets[0]
-            else:
-                chosen_set = random.choice(sets_data)
-
-            set_name = chosen_set["set_name"]
-
-            # Récupère les cartes du set en français
-            params = {"cardset": set_name, "language": "fr"}
-            async with session.get("https://db.ygoprodeck.com/api/v7/cardinfo.php", params=params) as resp:
-                cards_data = await resp.json()
-
-            cards = cards_data.get("data", [])
-            if not cards:
-                return None, f"❌ Aucun résultat pour le set **{set_name}**."
-
-            # Tirage aléatoire
-            pulled_cards = random.sample(cards, min(num_cards, len(cards)))
-
-            # Création de l'embed
-            embed = discord.Embed(
-                title=f"🎴 Booster ouvert : {set_name}",
-                description="Voici les cartes que tu as obtenues :",
-                color=discord.Color.gold()
+        if not set_index.ready:
+            return None, "⏳ La base de cartes est en cours de chargement, réessaie dans quelques instants."
+
+        # Choix du set
+        if set_query:
+            chosen_set = set_index.find(set_query)
+            if not chosen_set:
+                return None, f"❌ Aucun set trouvé pour **{set_query}**."
+        else:
+            chosen_set = set_index.random_set()
+
+        set_name = chosen_set["set_name"]
+
+        # Tirage par emplacements de rareté
+        pulled_cards = set_index.open_booster(chosen_set["set_code"], num_cards)
+        if not pulled_cards:
+            return None, f"❌ Aucun résultat pour le set **{set_name}**."
+
+        # Création de l'embed
+        embed = discord.Embed(
+            title=f"🎴 Booster ouvert : {set_name}",
+            description="Voici les cartes que tu as obtenues :",
+            color=discord.Color.gold()
+        )
+
+        for card_id, rarity in pulled_cards:
+            card = card_db.get(card_id) or {}
+            nom = card.get('name_fr') or card.get('name', 'Carte inconnue')
+            type_ = card.get('type', 'Type inconnu')
+            desc = card.get('desc_fr') or card.get('desc', 'Pas de description.')
+            image_url = (card.get("card_images") or [{}])[0].get("image_url", None)
+            embed.add_field(
+                name=f"**{nom}** — *{type_}* ({rarity})",
+                value=desc[:150] + "..." if len(desc) > 150 else desc,
+                inline=False
             )
+            if image_url:
+                embed.set_thumbnail(url=image_url)
 
-            for card in pulled_cards:
-                nom = card.get('name', 'Carte inconnue')
-                type_ = card.get('type', 'Type inconnu')
-                desc = card.get('desc', 'Pas de description.')
-                image_url = card.get("card_images", [{}])[0].get("image_url", None)
-                embed.add_field(
-                    name=f"**{nom}** — *{type_}*",
-                    value=desc[:150] + "..." if len(desc) > 150 else desc,
-                    inline=False
-                )
-                if image_url:
-                    embed.set_thumbnail(url=image_url)
-
-            return embed, None
+        embed.set_footer(text=f"Set : {chosen_set['set_code']}")
+        return embed, None
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande SLASH
@@ -1,9 +1,9 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📌 prix.py — Commande améliorée /prix et !prix
 # Objectif :
-#   - Affiche le prix d'une carte Yu-Gi-Oh! depuis l'API YGOPRODeck
-#   - Recherche multi-langue, fallback aléatoire
-#   - Utilise utils/card_utils pour la recherche
+#   - Affiche le prix d'une carte Yu-Gi-Oh! depuis l'historique local (utils/ygo_prices)
+#   - Tendances 7/30/90 jours et min/max par vendeur
+#   - Recherche locale, puis multi-langue via utils/card_utils, fallback aléatoire
 # Catégorie : 🃏 Yu-Gi-Oh!
 # Accès : Public
 # Cooldown : 1 utilisation / 5 secondes / utilisateur
@@ -18,6 +18,8 @@ from discord.ext import commands
 
 from utils.discord_utils import safe_send, safe_respond
 from utils.card_utils import search_card, fetch_random_card  # ✅ Centralisé
+from utils.ygo_db import card_db
+from utils.ygo_prices import VENDORS, TREND_WINDOWS, price_stats
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔧 Helper de formatage
@@ -28,6 +30,12 @@ def format_price(price: str, currency: str) -> str:
     except (ValueError, TypeError):
         return "N/A"
 
+def format_trend(pct: float | None) -> str:
+    if pct is None:
+        return "—"
+    arrow = "📈" if pct > 0 else "📉" if pct < 0 else "➖"
+    return f"{arrow} {pct:+.1f}%"
+
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Cog principal
 # ────────────────────────────────────────────────────────────────────────────────
@@ -37,24 +45,39 @@ class Prix(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+    # ── Résolution de la carte (locale d'abord) ─────────────────────────────────
+    async def resolve_card(self, nom: str) -> tuple[dict | None, str]:
+        card = card_db.find(nom)
+        if card:
+            return card, ""
+        card, _, message = await search_card(nom, self.bot.aiohttp_session)
+        return card, message
+
     # ── Fonction commune d'affichage ────────────────────────────────────────────
     async def send_price_embed(self, card: dict, ctx_or_interaction):
+        local = card_db.get(card["id"]) if card.get("id") else None
+        card = local or card
         prices = card.get("card_prices", [{}])[0]
-        description = (
-            f"💰 **Cardmarket** : {format_price(prices.get('cardmarket_price'), '€')}\n"
-            f"💰 **TCGPlayer** : {format_price(prices.get('tcgplayer_price'), '$')}\n"
-            f"💰 **eBay** : {format_price(prices.get('ebay_price'), '$')}\n"
-            f"💰 **Amazon** : {format_price(prices.get('amazon_price'), '$')}\n"
-            f"💰 **CoolStuffInc** : {format_price(prices.get('coolstuffinc_price'), '$')}"
-        )
+        stats = price_stats(card["id"]) if card.get("id") else {}
+
+        lines = []
+        for vendor, (key, label, currency) in enumerate(VENDORS):
+            line = f"💰 **{label}** : {format_price(prices.get(key), currency)}"
+            st = stats.get(vendor)
+            if st:
+                trends = " · ".join(f"{w}j {format_trend(st['trends'][w])}" for w in TREND_WINDOWS)
+                line += f"\n└ {trends}"
+                if st["min"] is not None:
+                    line += f" · min {format_price(st['min'] / 100, currency)} / max {format_price(st['max'] / 100, currency)}"
+            lines.append(line)
 
         embed = discord.Embed(
-            title=f"📌 Prix de {card.get('name', 'Carte inconnue')}",
-            description=description,
+            title=f"📌 Prix de {card.get('name_fr') or card.get('name', 'Carte inconnue')}",
+            description="\n".join(lines),
             color=discord.Color.gold()
         )
         embed.set_thumbnail(url=card.get("card_images", [{}])[0].get("image_url_small"))
-        embed.set_footer(text=f"ID : {card.get('id', '?')} | Konami ID : {card.get('konami_id', '?')}")
+        embed.set_footer(text=f"ID : {card.get('id', '?')} | Tendances et min/max sur {max(TREND_WINDOWS)} jours")
 
         # Envoie du message (compatibilité interaction + message classique)
         if isinstance(ctx_or_interaction, discord.Interaction):
@@ -73,7 +96,7 @@ class Prix(commands.Cog):
     async def slash_prix(self, interaction: discord.Interaction, carte: str):
         await safe_respond(interaction, f"🔄 Recherche du prix pour **{carte}**…")
     
-        card, lang, message = await search_card(carte, self.bot.aiohttp_session)
+        card, message = await self.resolve_card(carte)
         if message:
             return await safe_respond(interaction, message)
         if not card:
@@ -91,7 +114,7 @@ class Prix(commands.Cog):
     async def prefix_prix(self, ctx: commands.Context, *, carte: str):
         msg = await safe_send(ctx.channel, f"🔄 Recherche du prix pour **{carte}**…")
     
-        card, lang, message = await search_card(carte, self.bot.aiohttp_session)
+        card, message = await self.resolve_card(carte)
         if message:
             return await safe_send(ctx, message)
         if not card:
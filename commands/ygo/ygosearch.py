@@ -0,0 +1,133 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygosearch.py — Commande /ygosearch et !ygosearch
+# Objectif :
+#   - Recherche avancée multi-critères sur la base locale de cartes
+#     (ex. « attribut:DARK race:dragon atk>=2500 niveau<=8 »)
+#   - Résultats paginés (20 cartes par page) via boutons
+# Catégorie : 🃏 Yu-Gi-Oh!
+# Accès : Tous
+# Cooldown : 1 utilisation / 3 secondes / utilisateur
+# Remarques : Les filtres sont évalués sur les colonnes de utils/ygo_query.py.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.discord_utils import safe_send, safe_respond
+from utils.ygo_banlist import display_name
+from utils.ygo_db import card_db
+from utils.ygo_display import translate_card_type
+from utils.ygo_query import QueryError, card_columns
+
+PER_PAGE = 20
+SYNTAXE = (
+    "Critères : `attribut:` `race:` `type:` `archetype:` `atk` `def` `niveau` `rang` `lien` "
+    "(`:` `=` `!=` `<` `<=` `>` `>=`, ou plage `niveau:3-5`), `tcg:`/`ocg:`/`goat:` "
+    "(interdite, limitee, semi, libre), `texte:\"…\"` ; les mots seuls cherchent dans le nom."
+)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎛️ View — Pagination des résultats
+# ────────────────────────────────────────────────────────────────────────────────
+class SearchPagination(discord.ui.View):
+    def __init__(self, query: str, ids: list[int], per_page: int = PER_PAGE):
+        super().__init__(timeout=180)
+        self.query = query
+        self.ids = ids
+        self.per_page = per_page
+        self.page = 0
+
+    @property
+    def total_pages(self) -> int:
+        return (len(self.ids) - 1) // self.per_page + 1
+
+    def build_embed(self) -> discord.Embed:
+        start = self.page * self.per_page
+        lines = []
+        for card_id in self.ids[start:start + self.per_page]:
+            card = card_db.get(card_id) or {}
+            lines.append(f"**{display_name(card)}** — {translate_card_type(card.get('type'))}")
+
+        embed = discord.Embed(
+            title=f"🔎 {self.query[:200]} (Page {self.page + 1}/{self.total_pages})",
+            description="\n".join(lines),
+            color=discord.Color.blurple()
+        )
+        embed.set_footer(text=f"{len(self.ids)} cartes au total • {self.per_page} par page")
+        return embed
+
+    @discord.ui.button(label="⬅️ Précédent", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = (self.page - 1) % self.total_pages
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="➡️ Suivant", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = (self.page + 1) % self.total_pages
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class YGOSearch(commands.Cog):
+    """Commande /ygosearch et !ygosearch — Recherche avancée de cartes"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    def _run(self, requete: str) -> tuple[SearchPagination | None, str]:
+        if not card_columns.ready:
+            return None, "⏳ La base de cartes se charge encore, réessaie dans quelques instants."
+        try:
+            ids = card_columns.search(requete)
+        except QueryError as e:
+            return None, f"❌ {e}\n{SYNTAXE}"
+        if not ids:
+            return None, "🔍 Aucune carte ne correspond à cette recherche."
+        return SearchPagination(requete, ids), ""
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande SLASH
+    # ────────────────────────────────────────────────────────────────────────────
+    @app_commands.command(
+        name="ygosearch",
+        description="Recherche avancée : attribut:DARK race:dragon atk>=2500 niveau<=8…"
+    )
+    @app_commands.describe(requete="Critères de recherche (ex. attribut:DARK atk>=2500 texte:\"piochez 2\")")
+    @app_commands.checks.cooldown(rate=1, per=3.0, key=lambda i: i.user.id)
+    async def slash_ygosearch(self, interaction: discord.Interaction, requete: str):
+        view, message = self._run(requete)
+        if message:
+            await safe_respond(interaction, message, ephemeral=True)
+            return
+        await safe_respond(interaction, embed=view.build_embed(), view=view)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande PREFIX
+    # ────────────────────────────────────────────────────────────────────────────
+    @commands.command(
+        name="ygosearch",
+        aliases=["ysearch"],
+        help="Recherche avancée de cartes (ex. !ygosearch attribut:DARK race:dragon atk>=2500)."
+    )
+    @commands.cooldown(1, 3.0, commands.BucketType.user)
+    async def prefix_ygosearch(self, ctx: commands.Context, *, requete: str = ""):
+        view, message = self._run(requete)
+        if message:
+            await safe_send(ctx.channel, message)
+            return
+        await safe_send(ctx.channel, embed=view.build_embed(), view=view)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    cog = YGOSearch(bot)
+    for command in cog.get_commands():
+        if not hasattr(command, "category"):
+            command.category = "🃏 Yu-Gi-Oh!"
+    await bot.add_cog(cog)
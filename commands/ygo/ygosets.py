@@ -9,6 +9,8 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
+import re
+
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -16,16 +18,38 @@ from discord.ui import View, Button
 
 from utils.discord_utils import safe_send, safe_edit, safe_respond
 from utils.card_utils import search_card
+from utils.ygo_db import card_db
+from utils.ygo_sets import Printing, filter_printings, set_index, to_float
+
+# Options du préfixe : « rareté:ultra tri:prix depuis:2020 jusqua:2023 »
+PREFIX_OPTION = re.compile(r"\b(rarete|rareté|tri|depuis|jusqua|jusqu'a|jusqu'à):(\S+)", re.IGNORECASE)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Helper d'affichage
+# ────────────────────────────────────────────────────────────────────────────────
+def build_set_embed(card_name: str, printings: list[Printing], index: int) -> discord.Embed:
+    p = printings[index]
+    prix = f"€{p.price:.2f}" if p.price is not None else "N/A"
+    embed = discord.Embed(
+        title=f"{card_name} — Set {index + 1}/{len(printings)}",
+        color=discord.Color.green()
+    )
+    embed.add_field(
+        name=f"{p.set_name} ({p.set_code})",
+        value=f"Rareté : {p.rarity}\nPrix : {prix}\nDate TCG : {p.tcg_date or 'Inconnue'}",
+        inline=False
+    )
+    return embed
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🎛️ UI — Pagination interactive des sets
 # ────────────────────────────────────────────────────────────────────────────────
 class SetsPagination(View):
-    """Navigation interactive entre les sets d’une carte."""
+    """Navigation interactive entre les impressions (compactes) d’une carte."""
 
-    def __init__(self, sets: list[dict], card_name: str):
+    def __init__(self, printings: list[Printing], card_name: str):
         super().__init__(timeout=120)
-        self.sets = sets
+        self.printings = printings
         self.index = 0
         self.card_name = card_name
         self.message = None
@@ -37,31 +61,17 @@ class SetsPagination(View):
             await safe_edit(self.message, view=self)
 
     async def update_embed(self, interaction: discord.Interaction):
-        s = self.sets[self.index]
-        prix_cm = s.get("set_price", "N/A")
-        rarity = s.get("set_rarity", "N/A")
-        date = s.get("tcg_date", "Inconnue")
-
-        embed = discord.Embed(
-            title=f"{self.card_name} — Set {self.index + 1}/{len(self.sets)}",
-            color=discord.Color.green()
-        )
-        embed.add_field(
-            name=f"{s.get('set_name', 'Set inconnu')} ({s.get('set_code', '')})",
-            value=f"Rareté : {rarity}\nPrix : €{prix_cm}\nDate TCG : {date}",
-            inline=False
-        )
-
+        embed = build_set_embed(self.card_name, self.printings, self.index)
         await interaction.response.edit_message(embed=embed, view=self)
 
     @discord.ui.button(label="⬅️", style=discord.ButtonStyle.secondary)
     async def prev(self, interaction: discord.Interaction, button: Button):
-        self.index = (self.index - 1) % len(self.sets)
+        self.index = (self.index - 1) % len(self.printings)
         await self.update_embed(interaction)
 
     @discord.ui.button(label="➡️", style=discord.ButtonStyle.secondary)
     async def next(self, interaction: discord.Interaction, button: Button):
-        self.index = (self.index + 1) % len(self.sets)
+        self.index = (self.index + 1) % len(self.printings)
         await self.update_embed(interaction)
 
 
@@ -79,39 +89,49 @@ class Sets(commands.Cog):
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Fonction interne commune
     # ────────────────────────────────────────────────────────────────────────────
-    async def _send_sets(self, channel: discord.abc.Messageable, nom: str):
-        carte, langue, message = await search_card(nom, self.bot.aiohttp_session)
-
-        if message:
-            await safe_send(channel, message)
-            return
+    async def _send_sets(
+        self,
+        channel: discord.abc.Messageable,
+        nom: str,
+        rarete: str | None = None,
+        depuis: str | None = None,
+        jusqua: str | None = None,
+        tri: str = "date",
+    ):
+        # Résolution locale d'abord, API seulement si la carte est inconnue de l'index
+        carte = card_db.find(nom)
+        if not carte:
+            carte, langue, message = await search_card(nom, self.bot.aiohttp_session)
+            if message:
+                await safe_send(channel, message)
+                return
 
         if not carte:
             await safe_send(channel, f"❌ Impossible de trouver la carte `{nom}`.")
             return
 
-        sets = carte.get("card_sets", [])
-        if not sets:
-            await safe_send(channel, "❌ Aucun set disponible pour cette carte.")
+        if carte["id"] in set_index.printings:
+            printings = set_index.card_printings(carte["id"], rarete, depuis, jusqua, tri)
+        else:
+            # Carte absente de l'index local (base en cours de chargement) : sets de la réponse API,
+            # sans date TCG — les filtres de date ne peuvent pas s'appliquer
+            if depuis or jusqua:
+                await safe_send(channel, "⏳ La base des sets se charge encore : filtres de date indisponibles, réessaie dans quelques instants.")
+                return
+            printings = filter_printings([
+                Printing(s.get("set_code", ""), "", s.get("set_name", "Set inconnu"), s.get("set_rarity", "N/A"),
+                         to_float(s.get("set_price")), None)
+                for s in carte.get("card_sets", [])
+            ], rarete, sort=tri)
+
+        if not printings:
+            filtres = rarete or depuis or jusqua
+            await safe_send(channel, "❌ Aucun set ne correspond à ces filtres." if filtres else "❌ Aucun set disponible pour cette carte.")
             return
 
-        # Premier embed
-        s = sets[0]
-        prix_cm = s.get("set_price", "N/A")
-        rarity = s.get("set_rarity", "N/A")
-        date = s.get("tcg_date", "Inconnue")
-
-        embed = discord.Embed(
-            title=f"{carte.get('name', 'Carte inconnue')} — Set 1/{len(sets)}",
-            color=discord.Color.green()
-        )
-        embed.add_field(
-            name=f"{s.get('set_name', 'Set inconnu')} ({s.get('set_code', '')})",
-            value=f"Rareté : {rarity}\nPrix : €{prix_cm}\nDate TCG : {date}",
-            inline=False
-        )
-
-        view = SetsPagination(sets, carte.get("name"))
+        card_name = carte.get("name_fr") or carte.get("name", "Carte inconnue")
+        embed = build_set_embed(card_name, printings, 0)
+        view = SetsPagination(printings, card_name)
         view.message = await safe_send(channel, embed=embed, view=view)
 
     # ────────────────────────────────────────────────────────────────────────────
@@ -121,20 +141,51 @@ class Sets(commands.Cog):
         name="ygosets",
         description="📦 Affiche tous les sets d’une carte avec rareté, prix et date TCG."
     )
-    @app_commands.describe(nom="Nom de la carte")
+    @app_commands.describe(
+        nom="Nom de la carte",
+        rarete="Filtrer par rareté (ex : ultra, secret)",
+        depuis="Date TCG minimale (AAAA ou AAAA-MM-JJ)",
+        jusqua="Date TCG maximale (AAAA ou AAAA-MM-JJ)",
+        tri="Ordre d'affichage"
+    )
+    @app_commands.choices(tri=[
+        app_commands.Choice(name="Date de sortie", value="date"),
+        app_commands.Choice(name="Prix décroissant", value="prix"),
+        app_commands.Choice(name="Code du set", value="code"),
+    ])
     @app_commands.checks.cooldown(rate=1, per=5.0, key=lambda i: i.user.id)
-    async def slash_sets(self, interaction: discord.Interaction, nom: str):
+    async def slash_sets(
+        self,
+        interaction: discord.Interaction,
+        nom: str,
+        rarete: str = None,
+        depuis: str = None,
+        jusqua: str = None,
+        tri: str = "date",
+    ):
         await interaction.response.defer()
-        await self._send_sets(interaction.channel, nom)
+        await self._send_sets(interaction.channel, nom, rarete, depuis, jusqua, tri)
         await interaction.delete_original_response()
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande PREFIX
     # ────────────────────────────────────────────────────────────────────────────
-    @commands.command(name="ygosets")
+    @commands.command(
+        name="ygosets",
+        help="📦 Sets d’une carte. Options : rareté:ultra tri:prix|date|code depuis:2020 jusqua:2023"
+    )
     @commands.cooldown(1, 5.0, commands.BucketType.user)
     async def prefix_sets(self, ctx: commands.Context, *, nom: str):
-        await self._send_sets(ctx.channel, nom)
+        options = {k.lower(): v for k, v in PREFIX_OPTION.findall(nom)}
+        nom = PREFIX_OPTION.sub("", nom).strip()
+        await self._send_sets(
+            ctx.channel,
+            nom,
+            rarete=options.get("rarete") or options.get("rareté"),
+            depuis=options.get("depuis"),
+            jusqua=options.get("jusqua") or options.get("jusqu'a") or options.get("jusqu'à"),
+            tri=options.get("tri", "date").lower(),
+        )
 
 
 # ────────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,110 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygosimilaires.py — Commande /ygosimilaires et !ygosimilaires
+# Objectif :
+#   - Lister les dix cartes les plus proches d'une carte donnée
+#     (effet, archétype, type, race, attribut, niveau)
+# Catégorie : 🃏 Yu-Gi-Oh!
+# Accès : Tous
+# Cooldown : 1 utilisation / 3 secondes / utilisateur
+# Remarques : Similarités calculées sur la base locale (utils/ygo_similar.py).
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.discord_utils import safe_send, safe_respond
+from utils.ygo_banlist import display_name
+from utils.ygo_db import card_db
+from utils.ygo_display import pick_embed_color, translate_card_type
+from utils.ygo_provider import ygo_provider
+from utils.ygo_similar import NEIGHBOURS, card_similarity
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class YGOSimilaires(commands.Cog):
+    """Commande /ygosimilaires et !ygosimilaires — Cartes proches d'une carte"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    def _run(self, carte: str) -> tuple[discord.Embed | None, str]:
+        if not carte.strip():
+            return None, "❌ Indique le nom d'une carte."
+        if not card_similarity.ready:
+            return None, "⏳ La base de cartes se charge encore, réessaie dans quelques instants."
+
+        card = card_db.find(carte)
+        if card is None:
+            matches = ygo_provider.search(carte, 1)
+            card = matches[0] if matches else None
+        if card is None:
+            return None, f"❌ Carte introuvable : `{carte}`."
+
+        neighbours = card_similarity.neighbours(card["id"], NEIGHBOURS)
+        if not neighbours:
+            return None, f"🔍 Aucune carte proche de **{display_name(card)}**."
+
+        lines = []
+        for rank, (card_id, score) in enumerate(neighbours, start=1):
+            other = card_db.get(card_id) or {}
+            lines.append(
+                f"`{rank:>2}.` **{display_name(other)}** — {translate_card_type(other.get('type'))} · {score:.0%}"
+            )
+
+        embed = discord.Embed(
+            title=f"🧬 Cartes proches de {display_name(card)}",
+            description="\n".join(lines),
+            color=pick_embed_color(card.get("type", ""))
+        )
+        image = (card.get("card_images") or [{}])[0].get("image_url_small")
+        if image:
+            embed.set_thumbnail(url=image)
+        embed.set_footer(text="Similarité : texte de l'effet, archétype, type, race, attribut et niveau")
+        return embed, ""
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande SLASH
+    # ────────────────────────────────────────────────────────────────────────────
+    @app_commands.command(
+        name="ygosimilaires",
+        description="Les dix cartes les plus proches d'une carte (effet, archétype, stats)."
+    )
+    @app_commands.describe(carte="Nom de la carte (FR ou EN)")
+    @app_commands.checks.cooldown(rate=1, per=3.0, key=lambda i: i.user.id)
+    async def slash_ygosimilaires(self, interaction: discord.Interaction, carte: str):
+        embed, message = self._run(carte)
+        if message:
+            await safe_respond(interaction, message, ephemeral=True)
+            return
+        await safe_respond(interaction, embed=embed)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande PREFIX
+    # ────────────────────────────────────────────────────────────────────────────
+    @commands.command(
+        name="ygosimilaires",
+        aliases=["ysim"],
+        help="Les dix cartes les plus proches d'une carte (ex. !ygosimilaires Dragon Blanc aux Yeux Bleus)."
+    )
+    @commands.cooldown(1, 3.0, commands.BucketType.user)
+    async def prefix_ygosimilaires(self, ctx: commands.Context, *, carte: str = ""):
+        embed, message = self._run(carte)
+        if message:
+            await safe_send(ctx.channel, message)
+            return
+        await safe_send(ctx.channel, embed=embed)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    cog = YGOSimilaires(bot)
+    for command in cog.get_commands():
+        if not hasattr(command, "category"):
+            command.category = "🃏 Yu-Gi-Oh!"
+    await bot.add_cog(cog)
@@ -1,7 +1,7 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📌 staples.py — Commande interactive /staples et !staples
 # Objectif :
-#   - Récupère les cartes Staples depuis l’API YGOPRODeck
+#   - Lit les cartes Staples depuis la liste partagée (utils/ygo_staples)
 #   - Affiche les résultats avec pagination (20 cartes/page)
 # Catégorie : 🃏 Yu-Gi-Oh!
 # Accès : Tous
@@ -14,10 +14,11 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import aiohttp
 import json
 from pathlib import Path
 from utils.discord_utils import safe_send, safe_respond  # ✅ Utilitaires sécurisés
+from utils.ygo_db import card_db, card_fr
+from utils.ygo_staples import staple_index
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 📖 Chargement du dictionnaire de traduction des types
@@ -105,19 +106,12 @@ class StaplesPagination(discord.ui.View):
 class Staples(commands.Cog):
     """Commande /staples et !staples — Liste des cartes Staples"""
 
-    API_URL = "https://db.ygoprodeck.com/api/v7/cardinfo.php?staple=yes&language=fr"
-
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    async def fetch_staples(self):
-        """Récupère les cartes staples depuis l'API (noms, types et attributs en français)."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.API_URL) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-                return data.get("data", [])
+    def fetch_staples(self) -> list[dict]:
+        """Retourne les cartes staples depuis la mémoire (noms en français, triées par nom)."""
+        return [card_fr(card_db.get(cid)) for cid in staple_index.staples]
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande SLASH
@@ -128,10 +122,9 @@ class Staples(commands.Cog):
     )
     @app_commands.checks.cooldown(1, 5.0, key=lambda i: i.user.id)
     async def slash_staples(self, interaction: discord.Interaction):
-        await safe_respond(interaction, "🔄 Récupération des cartes staples…")
-        staples = await self.fetch_staples()
+        staples = self.fetch_staples()
         if not staples:
-            return await safe_respond(interaction, "❌ Impossible de récupérer les cartes staples.")
+            return await safe_respond(interaction, "❌ Liste des staples indisponible (base de cartes en cours de chargement).")
 
         view = StaplesPagination(staples)
         current = view.get_page_data()
@@ -148,7 +141,7 @@ class Staples(commands.Cog):
             color=discord.Color.blue()
         )
         embed.set_footer(text=f"{len(staples)} cartes au total • {view.per_page} par page")
-        await interaction.edit_original_response(embed=embed, view=view)
+        await safe_respond(interaction, embed=embed, view=view)
 
     # ────────────────────────────────────────────────────────────────────────────
     # 🔹 Commande PREFIX
@@ -156,10 +149,9 @@ class Staples(commands.Cog):
     @commands.command(name="ygostaples")
     @commands.cooldown(1, 5.0, commands.BucketType.user)
     async def prefix_staples(self, ctx: commands.Context):
-        msg = await safe_send(ctx.channel, "🔄 Récupération des cartes staples…")
-        staples = await self.fetch_staples()
+        staples = self.fetch_staples()
         if not staples:
-            return await safe_send(ctx.channel, "❌ Impossible de récupérer les cartes staples.")
+            return await safe_send(ctx.channel, "❌ Liste des staples indisponible (base de cartes en cours de chargement).")
 
         view = StaplesPagination(staples)
         current = view.get_page_data()
@@ -176,7 +168,7 @@ class Staples(commands.Cog):
             color=discord.Color.blue()
         )
         embed.set_footer(text=f"{len(staples)} cartes au total • {view.per_page} par page")
-        await msg.edit(content=None, embed=embed, view=view)
+        await safe_send(ctx.channel, embed=embed, view=view)
 
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔌 Setup du Cog
@@ -0,0 +1,102 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygotexte.py — Commande /ygotexte et !ygotexte
+# Objectif :
+#   - Retrouver une carte à partir d'un morceau de son effet (FR ou EN)
+#   - Classement par pertinence (BM25), expressions exactes entre guillemets
+# Catégorie : 🃏 Yu-Gi-Oh!
+# Accès : Tous
+# Cooldown : 1 utilisation / 3 secondes / utilisateur
+# Remarques : Aucune requête API : l'index vient de utils/ygo_fulltext.py.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.discord_utils import safe_send, safe_respond
+from utils.ygo_banlist import display_name
+from utils.ygo_db import card_db
+from utils.ygo_display import translate_card_type
+from utils.ygo_fulltext import fulltext_index
+
+MAX_RESULTS = 10
+EXTRAIT = 90  # caractères d'effet affichés sous chaque carte
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog principal
+# ────────────────────────────────────────────────────────────────────────────────
+class YGOTexte(commands.Cog):
+    """Commande /ygotexte et !ygotexte — Recherche dans le texte des effets"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    def _run(self, phrase: str) -> tuple[discord.Embed | None, str]:
+        if not phrase.strip():
+            return None, "❌ Donne un morceau d'effet, ex. `piochez 2 cartes` ou `\"special summon\"`."
+        if not fulltext_index.ready:
+            return None, "⏳ La base de cartes se charge encore, réessaie dans quelques instants."
+        results, total = fulltext_index.search(phrase, MAX_RESULTS)
+        if not results:
+            return None, "🔍 Aucun effet ne correspond à cette recherche."
+
+        lines = []
+        for card_id, _score in results:
+            card = card_db.get(card_id) or {}
+            desc = " ".join((card.get("desc_fr") or card.get("desc", "")).split())
+            if len(desc) > EXTRAIT:
+                desc = desc[:EXTRAIT].rsplit(" ", 1)[0] + "…"
+            lines.append(f"**{display_name(card)}** — {translate_card_type(card.get('type'))}\n> {desc}")
+
+        embed = discord.Embed(
+            title=f"📜 Effets contenant : {phrase[:200]}",
+            description="\n".join(lines)[:4096],
+            color=discord.Color.blurple()
+        )
+        embed.set_footer(text=f"{total} cartes trouvées • {len(results)} plus pertinentes affichées")
+        return embed, ""
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande SLASH
+    # ────────────────────────────────────────────────────────────────────────────
+    @app_commands.command(
+        name="ygotexte",
+        description="Retrouve une carte à partir d'un morceau de son effet (FR ou EN)."
+    )
+    @app_commands.describe(phrase="Mots de l'effet ; entre guillemets pour une expression exacte")
+    @app_commands.checks.cooldown(rate=1, per=3.0, key=lambda i: i.user.id)
+    async def slash_ygotexte(self, interaction: discord.Interaction, phrase: str):
+        embed, message = self._run(phrase)
+        if message:
+            await safe_respond(interaction, message, ephemeral=True)
+            return
+        await safe_respond(interaction, embed=embed)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔹 Commande PREFIX
+    # ────────────────────────────────────────────────────────────────────────────
+    @commands.command(
+        name="ygotexte",
+        aliases=["yeffet"],
+        help="Retrouve une carte à partir d'un morceau de son effet (ex. !ygotexte \"piochez 2 cartes\")."
+    )
+    @commands.cooldown(1, 3.0, commands.BucketType.user)
+    async def prefix_ygotexte(self, ctx: commands.Context, *, phrase: str = ""):
+        embed, message = self._run(phrase)
+        if message:
+            await safe_send(ctx.channel, message)
+            return
+        await safe_send(ctx.channel, embed=embed)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup du Cog
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    cog = YGOTexte(bot)
+    for command in cog.get_commands():
+        if not hasattr(command, "category"):
+            command.category = "🃏 Yu-Gi-Oh!"
+    await bot.add_cog(cog)
@@ -0,0 +1,58 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 card_providers_refresh.py — Planificateur commun des catalogues de cartes
+# Objectif : Charger au démarrage l'instantané disque de chaque catalogue
+#            (MTG, One Piece, Lorcana, Pokémon…) puis rafraîchir, toutes les
+#            heures, ceux dont le délai refresh_every est dépassé.
+# Catégorie : Tâches
+# Accès : Interne
+# Remarques : Yu-Gi-Oh! a sa propre tâche (tasks/ygo_db_refresh.py)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+
+from discord.ext import commands, tasks
+
+from utils.card_provider import load_providers
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog de tâche
+# ────────────────────────────────────────────────────────────────────────────────
+class CardProvidersRefresh(commands.Cog):
+    """Maintient les catalogues CardProvider à jour en arrière-plan."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.providers = load_providers()
+        for provider in self.providers.values():
+            if provider.scheduled and not provider.ready:
+                provider.load_snapshot()
+        self.refresh_loop.start()
+
+    def cog_unload(self):
+        self.refresh_loop.cancel()
+
+    @tasks.loop(hours=1)
+    async def refresh_loop(self):
+        for provider in self.providers.values():
+            if not provider.scheduled or (provider.ready and not provider.stale):
+                continue
+            try:
+                await provider.refresh(self.bot.aiohttp_session)
+            except Exception as e:
+                print(f"[{provider.key}] Erreur rafraîchissement : {e}")
+
+    @refresh_loop.before_loop
+    async def before_refresh(self):
+        await self.bot.wait_until_ready()
+        # La session aiohttp est créée dans on_ready
+        while self.bot.aiohttp_session is None:
+            await asyncio.sleep(1)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    await bot.add_cog(CardProvidersRefresh(bot))
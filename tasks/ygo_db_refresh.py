@@ -0,0 +1,68 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_db_refresh.py — Tâche de rafraîchissement de la base Yu-Gi-Oh! locale
+# Objectif : Charger l'instantané disque au démarrage puis vérifier toutes les
+#            6 heures si YGOPRODeck a publié une nouvelle version de sa base.
+#            La base est retéléchargée au moins une fois par jour pour
+#            alimenter l'historique des prix.
+# Catégorie : Tâches
+# Accès : Interne
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import time
+
+from discord.ext import commands, tasks
+
+from utils.ygo_db import card_db
+from utils.ygo_staples import staple_index
+from utils.ygo_prices import day_number, snapshot_prices
+import utils.ygo_sets      # noqa: F401 — index dérivés enregistrés auprès de card_db
+import utils.ygo_banlist   # noqa: F401
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🧠 Cog de tâche
+# ────────────────────────────────────────────────────────────────────────────────
+class YGODatabaseRefresh(commands.Cog):
+    """Maintient card_db à jour en arrière-plan."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        if not card_db.ready:
+            card_db.load_snapshot()
+        self.refresh_loop.start()
+
+    def cog_unload(self):
+        self.refresh_loop.cancel()
+
+    @tasks.loop(hours=6)
+    async def refresh_loop(self):
+        try:
+            # Un téléchargement complet par jour UTC : snapshot_prices range les prix au jour de updated_at
+            force = day_number(card_db.updated_at) != day_number(time.time())
+            await card_db.refresh(self.bot.aiohttp_session, force=force)
+        except Exception as e:
+            print(f"[ygo_db] Erreur rafraîchissement : {e}")
+        try:
+            await asyncio.to_thread(snapshot_prices, card_db)
+        except Exception as e:
+            print(f"[ygo_prices] Erreur instantané des prix : {e}")
+        try:
+            await staple_index.refresh(self.bot.aiohttp_session)
+        except Exception as e:
+            print(f"[ygo_staples] Erreur rafraîchissement : {e}")
+
+    @refresh_loop.before_loop
+    async def before_refresh(self):
+        await self.bot.wait_until_ready()
+        # La session aiohttp est créée dans on_ready
+        while self.bot.aiohttp_session is None:
+            await asyncio.sleep(1)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔌 Setup
+# ────────────────────────────────────────────────────────────────────────────────
+async def setup(bot: commands.Bot):
+    await bot.add_cog(YGODatabaseRefresh(bot))
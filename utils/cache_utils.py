@@ -0,0 +1,53 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 cache_utils.py — Cache mémoire borné avec expiration
+# Objectif : Garder les réponses d'API récentes sans croissance illimitée
+#            (éviction LRU au-delà de maxsize, expiration après ttl secondes)
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+_MISSING = object()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗃️ Cache LRU + TTL
+# ────────────────────────────────────────────────────────────────────────────────
+class TTLCache:
+    """Dictionnaire LRU borné dont les entrées expirent après `ttl` secondes."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
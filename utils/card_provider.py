@@ -0,0 +1,351 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 card_provider.py — Socle commun des catalogues de cartes (tous TCG)
+# Objectif :
+#   - Interface unique : recherche par nom, recherche approximative, tirage
+#     aléatoire, rafraîchissement complet, instantané disque
+#   - Services partagés : cache LRU/TTL, limiteur de débit HTTP, métriques
+#   - Registre des catalogues, parcouru par tasks/card_providers_refresh.py
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Un nouveau TCG = une sous-classe de CardProvider qui implémente
+#             download(), enregistrée via register() et listée dans PROVIDER_MODULES.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import importlib
+import json
+import random
+import time
+from abc import ABC, abstractmethod
+from difflib import SequenceMatcher
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+import aiohttp
+
+from utils.cache_utils import TTLCache
+from utils.http_cache import conditional_json
+from utils.text_utils import NameIndex, normaliser_nom
+
+# Modules qui définissent (et enregistrent) un catalogue
+PROVIDER_MODULES = (
+    "utils.ygo_provider",
+    "utils.mtg_db",
+    "utils.op_db",
+    "utils.lorcana_db",
+    "utils.pokemon_db",
+)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⏱️ Limiteur de débit
+# ────────────────────────────────────────────────────────────────────────────────
+class RateLimiter:
+    """Seau à jetons : au plus `rate` requêtes par seconde, rafales de `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📊 Métriques
+# ────────────────────────────────────────────────────────────────────────────────
+class ProviderMetrics:
+    """Compteurs d'un catalogue : recherches, requêtes HTTP, rafraîchissements."""
+
+    def __init__(self):
+        self.lookups = 0
+        self.hits = 0
+        self.misses = 0
+        self.http_requests = 0
+        self.http_errors = 0
+        self.http_time = 0.0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.last_refresh_duration = 0.0
+
+    def record_lookup(self, found: bool):
+        self.lookups += 1
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def as_dict(self) -> dict:
+        return {
+            **vars(self),
+            "http_avg_ms": round(self.http_time * 1000 / self.http_requests, 1) if self.http_requests else None,
+        }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Catalogue générique
+# ────────────────────────────────────────────────────────────────────────────────
+class CardProvider(ABC):
+    """
+    Catalogue de cartes en mémoire pour un TCG.
+    Les sous-classes renseignent les attributs de classe et implémentent download().
+    """
+
+    key: str = ""                       # identifiant court (« mtg », « op »…)
+    label: str = ""                     # nom affiché
+    command: str = ""                   # commande qui affiche la fiche complète
+    snapshot_path: Path | None = None
+    headers: Mapping[str, str] = MappingProxyType({})  # en-têtes HTTP (lecture seule)
+    name_field: str = "name"
+    id_field: str | None = None         # champ servant d'identifiant unique (optionnel)
+    refresh_every: float = 24 * 3600    # secondes avant qu'un rafraîchissement soit dû
+    scheduled: bool = True              # rafraîchi par le planificateur commun
+    rate: float = 5.0                   # requêtes HTTP / seconde
+    burst: int = 2
+    cache_size: int = 256
+    cache_ttl: float = 3600
+
+    def __init__(self):
+        self.cards: list[dict] = []
+        self.by_id: dict = {}
+        self.version: str | None = None
+        self.updated_at: float = 0.0
+        self.cache = TTLCache(self.cache_size, self.cache_ttl)
+        self.limiter = RateLimiter(self.rate, self.burst)
+        self.metrics = ProviderMetrics()
+        self._names = NameIndex()
+        self._random_pool: list[int] = []
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔌 Points d'extension
+    # ────────────────────────────────────────────────────────────────────────────
+    @abstractmethod
+    async def download(self, session: aiohttp.ClientSession, force: bool = False) -> tuple[list[dict], str | None] | None:
+        """Télécharge le catalogue complet : (cartes compactes, version), ou None s'il n'a pas changé."""
+
+    def name_entries(self, card: dict) -> Iterable[str]:
+        """Noms sous lesquels une carte est indexée."""
+        yield card.get(self.name_field, "")
+
+    def is_random_candidate(self, card: dict) -> bool:
+        return True
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔍 Lecture
+    # ────────────────────────────────────────────────────────────────────────────
+    @property
+    def ready(self) -> bool:
+        return bool(self.cards)
+
+    @property
+    def stale(self) -> bool:
+        return time.time() - self.updated_at > self.refresh_every
+
+    def card_name(self, card: dict) -> str:
+        return card.get(self.name_field, "")
+
+    def card_image(self, card: dict) -> str | None:
+        return card.get("image")
+
+    def search(self, name: str, limit: int = 10) -> list[dict]:
+        return [self.cards[i] for i in self._names.search(name, limit)]
+
+    def find(self, name: str) -> dict | None:
+        """
+        Meilleure correspondance (exact, préfixe, mots, approximatif).
+        Les impressions partageant ce nom sont tirées au hasard.
+        """
+        keys = self._names.search(name, limit=50)
+        card = None
+        if keys:
+            best = normaliser_nom(self.card_name(self.cards[keys[0]]))
+            same_name = [k for k in keys if normaliser_nom(self.card_name(self.cards[k])) == best]
+            card = self.cards[random.choice(same_name or keys[:1])]
+        self.metrics.record_lookup(card is not None)
+        return card
+
+    def random_card(self) -> dict | None:
+        return self.cards[random.choice(self._random_pool)] if self._random_pool else None
+
+    def score(self, query: str, card: dict) -> float:
+        """Similarité 0..1 entre une requête et le nom d'une carte (pour comparer les catalogues)."""
+        return SequenceMatcher(None, normaliser_nom(query), normaliser_nom(self.card_name(card))).ratio()
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🌐 HTTP partagé (limiteur + métriques)
+    # ────────────────────────────────────────────────────────────────────────────
+    async def fetch_json(self, session: aiohttp.ClientSession, url: str, params: dict | None = None):
+        """GET JSON au rythme du limiteur. Retourne None sur 404, lève une erreur sur les autres échecs."""
+        await self.limiter.acquire()
+        start = time.perf_counter()
+        self.metrics.http_requests += 1
+        try:
+            async with session.get(url, params=params, headers=self.headers) as resp:
+                if resp.status == 404:
+                    return None
+                if resp.status != 200:
+                    raise RuntimeError(f"{url} → HTTP {resp.status}")
+                return await resp.json(content_type=None)
+        except Exception:
+            self.metrics.http_errors += 1
+            raise
+        finally:
+            self.metrics.http_time += time.perf_counter() - start
+
+    async def fetch_json_conditional(self, session: aiohttp.ClientSession, url: str, params: dict | None = None):
+        """
+        GET JSON revalidé par ETag / Last-Modified (corps gardé dans utils.http_cache).
+        Retourne (données, changé) ; sur 304 les données sont relues depuis le disque.
+        """
+        await self.limiter.acquire()
+        start = time.perf_counter()
+        self.metrics.http_requests += 1
+        try:
+            return await conditional_json(session, url, params, self.headers)
+        except Exception:
+            self.metrics.http_errors += 1
+            raise
+        finally:
+            self.metrics.http_time += time.perf_counter() - start
+
+    async def cached_json(self, session: aiohttp.ClientSession, url: str, params: dict | None = None):
+        """fetch_json mémorisé dans le cache LRU/TTL du catalogue."""
+        key = (url, tuple(sorted((params or {}).items())))
+        data = self.cache.get(key)
+        if data is None:
+            data = await self.fetch_json(session, url, params)
+            if data is not None:
+                self.cache.set(key, data)
+        return data
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 💾 Instantané disque
+    # ────────────────────────────────────────────────────────────────────────────
+    def load_snapshot(self) -> bool:
+        if self.snapshot_path is None:
+            return False
+        try:
+            with self.snapshot_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"[{self.key}] Instantané illisible : {e}")
+            return False
+
+        self._install(data.get("cards", []), data.get("version"), data.get("updated_at", 0.0))
+        print(f"✅ [{self.key}] {len(self.cards)} cartes chargées depuis {self.snapshot_path}")
+        return True
+
+    def save_snapshot(self):
+        if self.snapshot_path is None:
+            return
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({
+                "version": self.version,
+                "updated_at": self.updated_at,
+                "cards": self.cards,
+            }, f, ensure_ascii=False, separators=(",", ":"))
+        tmp.replace(self.snapshot_path)
+
+    def _install(self, cards: list[dict], version: str | None, updated_at: float):
+        by_id = {}
+        if self.id_field:
+            for card in cards:
+                by_id.setdefault(card.get(self.id_field), card)
+        names = NameIndex((name, i) for i, card in enumerate(cards) for name in self.name_entries(card))
+        pool = [i for i, card in enumerate(cards) if self.is_random_candidate(card)]
+
+        self.cards = cards
+        self.by_id = by_id
+        self._names = names
+        self._random_pool = pool
+        self.version = version
+        self.updated_at = updated_at
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔄 Rafraîchissement
+    # ────────────────────────────────────────────────────────────────────────────
+    async def refresh(self, session: aiohttp.ClientSession, force: bool = False) -> bool:
+        """Retélécharge le catalogue. Retourne True s'il a été remplacé."""
+        async with self._lock:
+            start = time.perf_counter()
+            try:
+                result = await self.download(session, force)
+            except Exception:
+                self.metrics.refresh_errors += 1
+                raise
+            if result is None:
+                # Catalogue distant inchangé : on repousse la prochaine vérification
+                self.updated_at = time.time()
+                return False
+
+            cards, version = result
+            if not cards:
+                self.metrics.refresh_errors += 1
+                raise RuntimeError(f"[{self.key}] Catalogue téléchargé vide")
+            await asyncio.to_thread(self._install, cards, version, time.time())
+            await asyncio.to_thread(self.save_snapshot)
+            self.metrics.refreshes += 1
+            self.metrics.last_refresh_duration = time.perf_counter() - start
+            print(f"✅ [{self.key}] Catalogue rafraîchi : {len(self.cards)} cartes "
+                  f"en {self.metrics.last_refresh_duration:.1f} s")
+            return True
+
+    async def ensure_loaded(self, session: aiohttp.ClientSession):
+        """
+        Premier chargement : instantané disque, sinon téléchargement (attendu).
+        Ensuite, un catalogue périmé reste servi pendant un rafraîchissement en arrière-plan.
+        """
+        if not self.ready:
+            if not self.load_snapshot():
+                await self.refresh(session)
+            return
+        if self.stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._background_refresh(session))
+
+    async def _background_refresh(self, session: aiohttp.ClientSession):
+        try:
+            await self.refresh(session)
+        except Exception as e:
+            print(f"[{self.key}] Erreur rafraîchissement : {e}")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📚 Registre
+# ────────────────────────────────────────────────────────────────────────────────
+PROVIDERS: dict[str, CardProvider] = {}
+
+
+def register(provider: CardProvider) -> CardProvider:
+    PROVIDERS[provider.key] = provider
+    return provider
+
+
+def load_providers() -> dict[str, CardProvider]:
+    """Importe les modules de PROVIDER_MODULES (qui s'enregistrent) et retourne le registre."""
+    for module in PROVIDER_MODULES:
+        importlib.import_module(module)
+    return PROVIDERS
@@ -1,6 +1,6 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 utils/card_utils.py
-# Objectif : Centraliser la recherche de cartes Yu-Gi-Oh! (API YGOPRODeck)
+# Objectif : Centraliser la recherche de cartes Yu-Gi-Oh! (base locale puis API YGOPRODeck)
 # Remarques : Utilise une session aiohttp globale pour éviter les erreurs
 #             "Unclosed client session" et réduire les 429 Too Many Requests
 # ────────────────────────────────────────────────────────────────────────────────
@@ -8,28 +8,86 @@
 # ────────────────────────────────────────────────────────────────────────────────
 # 📦 Imports nécessaires
 # ────────────────────────────────────────────────────────────────────────────────
+import asyncio
 import aiohttp
 import urllib.parse
 import random
 
+from utils.cache_utils import TTLCache
+from utils.text_utils import normaliser_nom
+from utils.ygo_db import CardDatabase, card_db, card_fr
+from utils.ygo_provider import ygo_provider
+from utils.ygo_random import random_buckets
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🚫 Cache des recherches sans résultat
+# ────────────────────────────────────────────────────────────────────────────────
+NEGATIVE_CACHE_SIZE = 1024
+NEGATIVE_CACHE_TTL = 6 * 3600  # secondes
+
+_negative_cache = TTLCache(NEGATIVE_CACHE_SIZE, NEGATIVE_CACHE_TTL)
+_negative_cache_version = {"version": None}
+
+
+def _reset_negative_cache(db: CardDatabase):
+    """Une nouvelle version de la base peut contenir les cartes jusque-là introuvables."""
+    if db.version != _negative_cache_version["version"]:
+        _negative_cache.clear()
+        _negative_cache_version["version"] = db.version
+
+
+card_db.on_refresh(_reset_negative_cache)
+
 # ────────────────────────────────────────────────────────────────────────────────
 # 🔧 Fonctions de recherche avec session partagée
 # ────────────────────────────────────────────────────────────────────────────────
 
+LANGUAGES = ["fr", "de", "it", "pt", ""]  # ordre de priorité ("" = anglais)
+
+
+async def _probe_language(nom_encode: str, lang: str, session: aiohttp.ClientSession) -> dict | None:
+    url = f"https://db.ygoprodeck.com/api/v7/cardinfo.php?name={nom_encode}"
+    if lang:
+        url += f"&language={lang}"
+    async with ygo_provider.limiter:
+        async with session.get(url) as resp:
+            # YGOPRODeck répond 400 quand aucune carte ne correspond
+            if resp.status == 400:
+                return None
+            if resp.status != 200:
+                raise RuntimeError(f"cardinfo.php → HTTP {resp.status}")
+            data = await resp.json()
+    if "data" in data and len(data["data"]) > 0:
+        return data["data"][0]
+    return None
+
+
 async def fetch_card_multilang(nom: str, session: aiohttp.ClientSession) -> tuple[dict | None, str]:
-    """Recherche exacte du nom dans plusieurs langues (fr, de, it, pt, en)."""
+    """
+    Recherche exacte du nom dans plusieurs langues (fr, de, it, pt, en).
+    Toutes les langues sont interrogées en même temps ; la première langue de la
+    liste qui trouve la carte l'emporte et les requêtes restantes sont annulées.
+    """
     nom_encode = urllib.parse.quote(nom)
-    languages = ["fr", "de", "it", "pt", ""]
-    for lang in languages:
-        url = f"https://db.ygoprodeck.com/api/v7/cardinfo.php?name={nom_encode}"
-        if lang:
-            url += f"&language={lang}"
-        async with session.get(url) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                if "data" in data and len(data["data"]) > 0:
-                    return data["data"][0], (lang or "en")
-    return None, "?"
+    probes = [asyncio.create_task(_probe_language(nom_encode, lang, session)) for lang in LANGUAGES]
+    error = None
+    try:
+        for lang, probe in zip(LANGUAGES, probes):
+            try:
+                carte = await probe
+            except Exception as e:
+                print(f"[card_utils] Erreur recherche ({lang or 'en'}) : {e}")
+                error = e
+                continue
+            if carte:
+                return carte, (lang or "en")
+        # Sans résultat, une erreur réseau ne doit pas passer pour « carte inexistante »
+        if error:
+            raise error
+        return None, "?"
+    finally:
+        for probe in probes:
+            probe.cancel()
 
 
 async def fetch_card_fuzzy(nom: str, session: aiohttp.ClientSession) -> list[dict]:
@@ -40,11 +98,21 @@ async def fetch_card_fuzzy(nom: str, session: aiohttp.ClientSession) -> list[dic
         if resp.status == 200:
             data = await resp.json()
             return data.get("data", [])
+        if resp.status != 400:
+            raise RuntimeError(f"cardinfo.php → HTTP {resp.status}")
     return []
 
 
-async def fetch_random_card(session: aiohttp.ClientSession) -> tuple[dict | None, str]:
-    """Récupère une carte aléatoire en français si possible."""
+async def fetch_random_card(session: aiohttp.ClientSession, **filters) -> tuple[dict | None, str]:
+    """
+    Récupère une carte aléatoire en français si possible.
+    Filtres optionnels (type, attribute, level, archetype) : voir utils/ygo_random.py.
+    """
+    if random_buckets.ready:
+        return card_fr(random_buckets.draw(**filters)), "fr"
+    # niveau=0 est un vrai filtre : seul None signifie « non filtré »
+    if any(v is not None for v in filters.values()):
+        return None, "?"
     async with session.get("https://db.ygoprodeck.com/api/v7/cardinfo.php?language=fr") as resp:
         if resp.status != 200:
             return None, "?"
@@ -56,6 +124,37 @@ async def fetch_random_card(session: aiohttp.ClientSession) -> tuple[dict | None
         return card, "fr"
 
 
+# Vue française de card_db, recalculée une fois par rafraîchissement (lecture seule)
+_fr_view = {"cards": []}
+
+
+def _build_fr_view(db: CardDatabase):
+    _fr_view["cards"] = [card_fr(c) for c in db.cards.values()]
+
+
+card_db.on_refresh(_build_fr_view)
+
+
+async def fetch_all_cards_fr(session: aiohttp.ClientSession) -> list[dict]:
+    """
+    Toutes les cartes en français (mêmes champs que cardinfo.php?language=fr).
+    Servies par la base locale ; la réponse complète de l'API n'est chargée
+    que si la base n'est pas encore disponible.
+    """
+    if card_db.ready and _fr_view["cards"]:
+        # Nouvelle liste (les appelants la mélangent), mêmes cartes : les dicts ne sont pas recopiés
+        return list(_fr_view["cards"])
+    try:
+        async with session.get("https://db.ygoprodeck.com/api/v7/cardinfo.php?language=fr") as resp:
+            if resp.status != 200:
+                return []
+            data = await resp.json()
+        return data.get("data", [])
+    except Exception as e:
+        print(f"[card_utils] Erreur chargement des cartes : {e}")
+        return []
+
+
 # ────────────────────────────────────────────────────────────────────────────────
 # 🧠 Fonction principale
 # ────────────────────────────────────────────────────────────────────────────────
@@ -67,14 +166,29 @@ async def search_card(nom: str, session: aiohttp.ClientSession) -> tuple[dict |
       - Fuzzy match si rien trouvé
       - Retourne (carte, langue, message)
     """
-    carte, langue = await fetch_card_multilang(nom, session)
+    # Nom exact anglais ou français : base locale, sans appel API
+    carte, langue = ygo_provider.lookup(nom)
     if carte:
         return carte, langue, ""
 
-    fuzzy = await fetch_card_fuzzy(nom, session)
-    if fuzzy:
-        return fuzzy[0], "fr", ""
+    # Recherche déjà infructueuse récemment : inutile de réinterroger l'API
+    if normaliser_nom(nom) in _negative_cache:
+        return None, "?", f"❌ Désolé, aucune carte trouvée pour `{nom}`."
+
+    try:
+        carte, langue = await fetch_card_multilang(nom, session)
+        if carte:
+            return carte, langue, ""
+
+        fuzzy = await fetch_card_fuzzy(nom, session)
+        if fuzzy:
+            return fuzzy[0], "fr", ""
+    except Exception as e:
+        # Échec réseau : on ne mémorise pas l'absence de résultat
+        print(f"[card_utils] Erreur API pour {nom!r} : {e}")
+        return None, "?", "❌ L'API YGOPRODeck ne répond pas, réessaie dans quelques instants."
 
+    _negative_cache.set(normaliser_nom(nom), True)
     return None, "?", f"❌ Désolé, aucune carte trouvée pour `{nom}`."
 
 
@@ -0,0 +1,144 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 http_cache.py — Téléchargements conditionnels et compressés
+# Objectif :
+#   - Mémoriser par URL les validateurs HTTP (ETag / Last-Modified) et le corps
+#   - Renvoyer If-None-Match / If-Modified-Since et réutiliser le corps sur 304
+#   - Demander des réponses compressées (gzip, deflate, br si disponible)
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Les corps sont stockés dans database/http_cache/, l'index des
+#             validateurs dans database/http_cache/index.json.
+#             aiohttp ne décode « br » que si le paquet Brotli est installé.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
+from urllib.parse import urlencode
+
+import aiohttp
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+CACHE_DIR = Path("database/http_cache")
+INDEX_PATH = CACHE_DIR / "index.json"
+
+_HAS_BROTLI = any(importlib.util.find_spec(m) for m in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate"
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Index des validateurs
+# ────────────────────────────────────────────────────────────────────────────────
+_index: dict[str, dict] | None = None
+_index_lock = asyncio.Lock()
+_key_locks: dict[str, asyncio.Lock] = {}   # une requête à la fois par URL : un seul .tmp écrit à la fois
+
+
+def _load_index() -> dict[str, dict]:
+    global _index
+    if _index is None:
+        try:
+            with INDEX_PATH.open("r", encoding="utf-8") as f:
+                _index = json.load(f)
+        except FileNotFoundError:
+            _index = {}
+        except Exception as e:
+            print(f"[http_cache] Index illisible : {e}")
+            _index = {}
+    return _index
+
+
+def _save_index():
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = INDEX_PATH.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(_index, f, separators=(",", ":"))
+    tmp.replace(INDEX_PATH)
+
+
+def _cache_key(url: str, params: dict | None) -> str:
+    return f"{url}?{urlencode(sorted(params.items()))}" if params else url
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌐 Requêtes conditionnelles
+# ────────────────────────────────────────────────────────────────────────────────
+async def conditional_get(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+) -> tuple[Path | None, bool]:
+    """
+    Télécharge `url` en flux vers le cache disque, sauf si le serveur répond 304.
+    Retourne (fichier du corps, True si le contenu a changé depuis la dernière fois),
+    ou (None, False) sur 404. Lève une erreur sur les autres échecs.
+    """
+    key = _cache_key(url, params)
+    lock = _key_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        return await _conditional_get(session, url, params, headers, key)
+
+
+async def _conditional_get(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: dict | None,
+    headers: dict | None,
+    key: str,
+) -> tuple[Path | None, bool]:
+    index = _load_index()
+    entry = index.get(key, {})
+    body_path = CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.body"
+
+    request_headers = {**(headers or {}), "Accept-Encoding": ACCEPT_ENCODING}
+    if body_path.exists():
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    async with session.get(url, params=params, headers=request_headers) as resp:
+        if resp.status == 304 and body_path.exists():
+            return body_path, False
+        if resp.status == 404:
+            return None, False
+        if resp.status != 200:
+            raise RuntimeError(f"{url} → HTTP {resp.status}")
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = body_path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            async for chunk in resp.content.iter_chunked(1 << 16):
+                f.write(chunk)
+        tmp.replace(body_path)
+        validators = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+    async with _index_lock:
+        index[key] = validators
+        _save_index()
+    return body_path, True
+
+
+async def conditional_json(session: aiohttp.ClientSession, url: str, params: dict | None = None, headers: dict | None = None):
+    """Comme conditional_get, mais retourne (données JSON, changé)."""
+    path, changed = await conditional_get(session, url, params, headers)
+    if path is None:
+        return None, False
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f), changed
+
+
+async def conditional_text(session: aiohttp.ClientSession, url: str, params: dict | None = None, headers: dict | None = None) -> tuple[str, bool]:
+    """Comme conditional_get, mais retourne (texte, changé)."""
+    path, changed = await conditional_get(session, url, params, headers)
+    if path is None:
+        return "", False
+    return path.read_text(encoding="utf-8"), changed
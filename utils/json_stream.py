@@ -0,0 +1,128 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 json_stream.py — Lecture incrémentale de gros fichiers JSON
+# Objectif : Télécharger une grosse réponse JSON directement sur disque, puis
+#            parcourir son tableau élément par élément sans charger tout le
+#            fichier (ni tout l'arbre d'objets) en mémoire
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : S'appuie uniquement sur json.JSONDecoder.raw_decode (stdlib)
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+from pathlib import Path
+from typing import Iterator
+
+import aiohttp
+
+CHUNK_SIZE = 1 << 20  # 1 Mo de texte lu à la fois
+_WHITESPACE = " \t\r\n"
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Parcours d'un tableau JSON
+# ────────────────────────────────────────────────────────────────────────────────
+def iter_json_array(path: Path | str, key: str | None = None, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """
+    Produit un à un les éléments du tableau JSON racine d'un fichier, ou du
+    tableau associé à `key` dans l'objet racine (ex : {"data": [...]}).
+    Le tampon ne contient jamais plus que quelques éléments à la fois.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = f.read(chunk_size)
+        eof = not buf
+        pos = _skip(buf, 0)
+        if key is not None:
+            buf, pos, eof = _seek_key(f, decoder, buf, pos, eof, key, chunk_size, path)
+        if pos >= len(buf) or buf[pos] != "[":
+            raise ValueError(f"{path} : tableau JSON attendu")
+        pos += 1
+
+        while True:
+            pos = _skip(buf, pos, ",")
+            # Recharge le tampon tant qu'on est en fin de données disponibles
+            while pos >= len(buf) and not eof:
+                buf, pos, eof = _refill(f, buf, pos, chunk_size)
+                pos = _skip(buf, pos, ",")
+            if pos >= len(buf):
+                raise ValueError(f"{path} : fin de fichier inattendue")
+            if buf[pos] == "]":
+                return
+
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                buf, pos, eof = _refill(f, buf, pos, chunk_size)
+                continue
+            if end >= len(buf) and not eof:
+                # Un nombre coupé en fin de tampon se décode sans erreur : on relit
+                buf, pos, eof = _refill(f, buf, pos, chunk_size)
+                continue
+            yield item
+            pos = end
+
+
+def _seek_key(f, decoder, buf: str, pos: int, eof: bool, key: str, chunk_size: int, path) -> tuple[str, int, bool]:
+    """Avance jusqu'à la valeur de `key` dans l'objet racine ; les autres valeurs sont sautées."""
+    if pos >= len(buf) or buf[pos] != "{":
+        raise ValueError(f"{path} : objet JSON attendu")
+    pos += 1
+    while True:
+        pos = _skip(buf, pos, ",")
+        if buf[pos:pos + 1] == "}":
+            raise ValueError(f"{path} : clé {key!r} introuvable")
+        try:
+            name, end = decoder.raw_decode(buf, pos)
+            colon = _skip(buf, end)
+            value_pos = _skip(buf, colon + 1)
+            if value_pos >= len(buf):
+                raise json.JSONDecodeError("valeur manquante", buf, colon)
+            if name == key:
+                return buf, value_pos, eof
+            _, value_end = decoder.raw_decode(buf, value_pos)
+            if value_end >= len(buf) and not eof:
+                raise json.JSONDecodeError("valeur coupée", buf, value_end)
+        except json.JSONDecodeError:
+            if eof:
+                raise ValueError(f"{path} : clé {key!r} introuvable")
+            # Paire clé / valeur incomplète : on la relit avec le bloc suivant
+            buf, pos, eof = _refill(f, buf, pos, chunk_size)
+            continue
+        pos = value_end
+
+
+def _skip(buf: str, pos: int, extra: str = "") -> int:
+    chars = _WHITESPACE + extra
+    while pos < len(buf) and buf[pos] in chars:
+        pos += 1
+    return pos
+
+
+def _refill(f, buf: str, pos: int, chunk_size: int) -> tuple[str, int, bool]:
+    """Abandonne la partie déjà lue du tampon et y ajoute un nouveau bloc."""
+    more = f.read(chunk_size)
+    return buf[pos:] + more, 0, not more
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌐 Téléchargement en flux
+# ────────────────────────────────────────────────────────────────────────────────
+async def download_to_file(
+    session: aiohttp.ClientSession,
+    url: str,
+    path: Path,
+    params: dict | None = None,
+    headers: dict | None = None,
+) -> Path:
+    """Écrit la réponse sur disque par blocs, sans jamais la garder entière en mémoire."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    async with session.get(url, params=params, headers=headers) as resp:
+        if resp.status != 200:
+            raise RuntimeError(f"{url} → HTTP {resp.status}")
+        with path.open("wb") as f:
+            async for chunk in resp.content.iter_chunked(1 << 16):
+                f.write(chunk)
+    return path
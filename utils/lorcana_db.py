@@ -0,0 +1,78 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 lorcana_db.py — Catalogue local des cartes Disney Lorcana (lorcana-api.com)
+# Objectif :
+#   - Télécharger toutes les cartes (cards/all, paginé) et les garder en mémoire
+#   - Index de noms exact + approximatif, tableau d'ids pour les tirages aléatoires
+#   - Instantané disque pour repartir sans téléchargement après un redémarrage
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Catalogue CardProvider, rafraîchi une fois par jour
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from pathlib import Path
+
+import aiohttp
+
+from utils.card_provider import CardProvider, register
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌐 Constantes Lorcana
+# ────────────────────────────────────────────────────────────────────────────────
+LORCANA_API_ALL = "https://api.lorcana-api.com/cards/all"
+HEADERS = {"User-Agent": "VaactLorcanaBot/1.0", "Accept": "application/json"}
+PAGE_SIZE = 1000
+MAX_PAGES = 50  # garde-fou contre une pagination qui ne s'arrêterait pas
+
+SNAPSHOT_PATH = Path("database/lorcana_cards.json")
+
+CARD_FIELDS = (
+    "Unique_ID", "Name", "Type", "Cost", "Color", "Rarity", "Set_Name",
+    "Image", "Body_Text", "Flavor_Text",
+)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Catalogue Lorcana
+# ────────────────────────────────────────────────────────────────────────────────
+class LorcanaProvider(CardProvider):
+    """Cartes Lorcana indexées par Unique_ID et par nom."""
+
+    key = "lorcana"
+    label = "Disney Lorcana"
+    command = "lorcarte"
+    snapshot_path = SNAPSHOT_PATH
+    headers = HEADERS
+    name_field = "Name"
+    id_field = "Unique_ID"
+
+    def card_image(self, card: dict) -> str | None:
+        return card.get("Image")
+
+    async def download(self, session: aiohttp.ClientSession, force: bool = False):
+        cards = []
+        seen = set()
+        changed = False
+        for page in range(1, MAX_PAGES + 1):
+            data, page_changed = await self.fetch_json_conditional(session, LORCANA_API_ALL, {"pagesize": PAGE_SIZE, "page": page})
+            changed |= page_changed
+            if not data:
+                break
+            for c in data:
+                # Quelques cartes n'ont pas d'Unique_ID : on retombe sur le nom
+                uid = c.get("Unique_ID") or c.get("Name")
+                if c.get("Name") and uid not in seen:
+                    seen.add(uid)
+                    cards.append({k: c[k] for k in CARD_FIELDS if c.get(k) is not None})
+            if len(data) < PAGE_SIZE:
+                break
+        # Toutes les pages revalidées en 304 : le catalogue en mémoire est à jour
+        if not force and self.ready and not changed:
+            return None
+        return cards, None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+lorcana_db = register(LorcanaProvider())
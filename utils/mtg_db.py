@@ -0,0 +1,125 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 mtg_db.py — Miroir local des cartes Magic: The Gathering (Scryfall)
+# Objectif :
+#   - Télécharger le fichier bulk « oracle_cards » de Scryfall (1 entrée / carte)
+#   - Le compacter aux champs utilisés par /mtgcarte et /mtgpendu
+#   - Indexer les noms (exact, préfixe, approximatif) et tirer des cartes au hasard
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Catalogue CardProvider, vérifié une fois par jour par le
+#             planificateur commun (Scryfall régénère ses fichiers bulk quotidiennement).
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+from pathlib import Path
+
+import aiohttp
+
+from utils.card_provider import CardProvider, register
+from utils.json_stream import download_to_file, iter_json_array
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌐 Constantes Scryfall
+# ────────────────────────────────────────────────────────────────────────────────
+SCRYFALL_API = "https://api.scryfall.com"
+BULK_URL = f"{SCRYFALL_API}/bulk-data/oracle-cards"
+HEADERS = {"User-Agent": "VaactMagicBot/1.0", "Accept": "application/json"}
+
+SNAPSHOT_PATH = Path("database/mtg_cards.json")
+DOWNLOAD_PATH = Path("database/mtg_oracle_cards.download")
+
+CARD_FIELDS = ("name", "mana_cost", "type_line", "oracle_text", "set", "set_name", "rarity", "colors", "artist")
+
+# Objets qui ne sont pas de vraies cartes jouables : exclus des tirages aléatoires
+NON_GAME_LAYOUTS = {
+    "token", "double_faced_token", "emblem", "art_series", "vanguard",
+    "scheme", "planar", "augment", "host",
+}
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Compaction d'une carte brute
+# ────────────────────────────────────────────────────────────────────────────────
+def compact_card(raw: dict) -> dict:
+    """
+    Réduit une carte Scryfall aux champs affichés, en gardant la même forme
+    que l'API (image_uris.normal) pour que les embeds acceptent les deux.
+    Les cartes double face reprennent le texte et l'image de leurs faces.
+    """
+    card = {k: raw[k] for k in CARD_FIELDS if raw.get(k) is not None}
+    faces = raw.get("card_faces") or []
+
+    if "oracle_text" not in card and faces:
+        card["oracle_text"] = "\n—\n".join(f.get("oracle_text", "") for f in faces if f.get("oracle_text"))
+    if not card.get("mana_cost") and faces:
+        card["mana_cost"] = " // ".join(f["mana_cost"] for f in faces if f.get("mana_cost"))
+    if "colors" not in card and faces:
+        card["colors"] = sorted({c for f in faces for c in f.get("colors", [])})
+    if "artist" not in card and faces and faces[0].get("artist"):
+        card["artist"] = faces[0]["artist"]
+
+    image = (raw.get("image_uris") or (faces[0].get("image_uris") if faces else None) or {}).get("normal")
+    if image:
+        card["image_uris"] = {"normal": image}
+    if raw.get("layout") in NON_GAME_LAYOUTS:
+        card["non_game"] = True
+    return card
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Catalogue Scryfall
+# ────────────────────────────────────────────────────────────────────────────────
+class MTGProvider(CardProvider):
+    """Cartes oracle Scryfall (une entrée par carte, sans réimpressions)."""
+
+    key = "mtg"
+    label = "Magic: The Gathering"
+    command = "mtgcarte"
+    snapshot_path = SNAPSHOT_PATH
+    headers = HEADERS
+    rate = 10.0  # Scryfall demande 50 à 100 ms entre deux requêtes
+
+    def name_entries(self, card: dict):
+        name = card.get("name", "")
+        yield name
+        # « Delver of Secrets // Insectile Aberration » : chaque face est aussi indexée
+        if " // " in name:
+            yield from name.split(" // ")
+
+    def card_image(self, card: dict) -> str | None:
+        return (card.get("image_uris") or {}).get("normal")
+
+    def is_random_candidate(self, card: dict) -> bool:
+        return not card.get("non_game")
+
+    async def download(self, session: aiohttp.ClientSession, force: bool = False):
+        """
+        Télécharge oracle_cards si Scryfall a publié un nouveau fichier.
+        Le fichier (~150 Mo) est écrit sur disque en flux puis lu élément par élément.
+        """
+        meta = await self.fetch_json(session, BULK_URL)
+        if not meta:
+            raise RuntimeError(f"{BULK_URL} → introuvable")
+        version = meta.get("updated_at")
+        if not force and self.ready and version == self.version:
+            return None
+
+        await self.limiter.acquire()
+        try:
+            await download_to_file(session, meta["download_uri"], DOWNLOAD_PATH, headers=HEADERS)
+            cards = await asyncio.to_thread(_read_bulk, DOWNLOAD_PATH)
+        finally:
+            DOWNLOAD_PATH.unlink(missing_ok=True)
+        return cards, version
+
+
+def _read_bulk(path: Path) -> list[dict]:
+    cards = [compact_card(raw) for raw in iter_json_array(path) if raw.get("name")]
+    cards.sort(key=lambda c: c["name"])
+    return cards
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+mtg_db = register(MTGProvider())
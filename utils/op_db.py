@@ -0,0 +1,65 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 op_db.py — Catalogue local des cartes One Piece TCG (OPTCG API)
+# Objectif :
+#   - Garder en mémoire toutes les cartes de tous les sets (allSetCards)
+#   - Les servir sans téléchargement via un index de noms normalisés
+#   - Repartir d'un instantané disque après un redémarrage
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Catalogue CardProvider avec une durée de vie de 12 h. Passé ce
+#             délai, il reste servi tel quel pendant un rafraîchissement.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from pathlib import Path
+
+import aiohttp
+
+from utils.card_provider import CardProvider, register
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌐 Constantes API
+# ────────────────────────────────────────────────────────────────────────────────
+OPTCG_API_ALL = "https://www.optcgapi.com/api/allSetCards"
+HEADERS = {"User-Agent": "VaactOPTCGBot/1.0", "Accept": "application/json"}
+
+SNAPSHOT_PATH = Path("database/op_cards.json")
+
+CARD_FIELDS = (
+    "card_name", "card_set_id", "set_name", "set_id", "card_cost", "card_power",
+    "card_type", "sub_types", "rarity", "attribute", "card_text", "card_image",
+)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Catalogue One Piece
+# ────────────────────────────────────────────────────────────────────────────────
+class OPProvider(CardProvider):
+    """Cartes One Piece de tous les sets, impressions alternatives comprises."""
+
+    key = "op"
+    label = "One Piece"
+    command = "opcarte"
+    snapshot_path = SNAPSHOT_PATH
+    headers = HEADERS
+    name_field = "card_name"
+    refresh_every = 12 * 3600
+
+    def card_image(self, card: dict) -> str | None:
+        return card.get("card_image")
+
+    async def download(self, session: aiohttp.ClientSession, force: bool = False):
+        data, changed = await self.fetch_json_conditional(session, OPTCG_API_ALL)
+        if not force and self.ready and not changed:
+            return None
+        cards = [
+            {k: c.get(k) for k in CARD_FIELDS if c.get(k) is not None}
+            for c in data or [] if c.get("card_name")
+        ]
+        return cards, None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+op_db = register(OPProvider())
@@ -0,0 +1,68 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 pokemon_db.py — Index local des cartes Pokémon TCG (tcgdex)
+# Objectif :
+#   - Garder la liste abrégée de toutes les cartes (id, nom, set, image)
+#     en mémoire et sur disque, rafraîchie une fois par jour
+#   - Rechercher par nom dans cet index sans appel API
+#   - Mettre en cache (LRU + TTL) les fiches détaillées déjà demandées
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Catalogue CardProvider ; les fiches passent par son cache commun
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from pathlib import Path
+
+import aiohttp
+
+from utils.card_provider import CardProvider, register
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌐 Constantes tcgdex
+# ────────────────────────────────────────────────────────────────────────────────
+BASE_URL = "https://api.tcgdex.net/v2/en"
+
+SNAPSHOT_PATH = Path("database/pokemon_cards.json")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Index abrégé + cache de fiches
+# ────────────────────────────────────────────────────────────────────────────────
+class PokemonProvider(CardProvider):
+    """Fiches abrégées tcgdex indexées par id et par nom, fiches complètes en cache."""
+
+    key = "pokemon"
+    label = "Pokémon"
+    command = "pcarte"
+    snapshot_path = SNAPSHOT_PATH
+    id_field = "id"
+    cache_size = 512
+    cache_ttl = 24 * 3600
+
+    def card_image(self, card: dict) -> str | None:
+        # tcgdex donne l'adresse de base de l'image, sans qualité ni extension
+        return f"{card['image']}/high.png" if card.get("image") else None
+
+    async def get_detail(self, session: aiohttp.ClientSession, card_id: str) -> dict | None:
+        """Fiche complète d'une carte, servie par le cache LRU/TTL quand c'est possible."""
+        return await self.cached_json(session, f"{BASE_URL}/cards/{card_id}")
+
+    async def download(self, session: aiohttp.ClientSession, force: bool = False):
+        data = await self.fetch_json(session, f"{BASE_URL}/cards")
+        briefs = [
+            {
+                "id": c["id"],
+                "name": c["name"],
+                # « swsh3-136 » → set « swsh3 »
+                "set": c["id"].rsplit("-", 1)[0],
+                "image": c.get("image"),
+            }
+            for c in data or [] if c.get("id") and c.get("name")
+        ]
+        return briefs, None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+pokemon_db = register(PokemonProvider())
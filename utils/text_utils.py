@@ -0,0 +1,138 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 text_utils.py — Normalisation de texte pour les index locaux
+# Objectif : Fournir une clé de recherche stable (sans accents, casse ni ponctuation)
+#            et un index de noms réutilisable (exact / préfixe / approximatif)
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import re
+import unicodedata
+from bisect import bisect_left
+from difflib import get_close_matches
+from typing import Hashable, Iterable
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Fonctions de normalisation
+# ────────────────────────────────────────────────────────────────────────────────
+def normaliser_nom(texte: str) -> str:
+    """Supprime accents, casse et ponctuation : « Dragon Blanc aux Yeux Bleus » → « dragon blanc aux yeux bleus »."""
+    if not texte:
+        return ""
+    nfkd = unicodedata.normalize("NFKD", texte)
+    sans_accents = "".join(c for c in nfkd if not unicodedata.combining(c)).lower()
+    return _NON_ALNUM.sub(" ", sans_accents).strip()
+
+
+def tokens(texte: str) -> list[str]:
+    """Découpe un texte normalisé en mots."""
+    return normaliser_nom(texte).split()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔍 Index de noms (exact + préfixe + mots + approximatif)
+# ────────────────────────────────────────────────────────────────────────────────
+class NameIndex:
+    """
+    Index de noms normalisés → clés (ids, positions…).
+    Recherche par ordre de priorité : exact, préfixe, tous les mots, approximatif (difflib).
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, Hashable]] = ()):
+        self._exact: dict[str, list] = {}
+        for name, key in entries:
+            norm = normaliser_nom(name)
+            if norm:
+                keys = self._exact.setdefault(norm, [])
+                if key not in keys:
+                    keys.append(key)
+        self._sorted = sorted(self._exact)
+        self._tokens: dict[str, set[str]] = {}
+        for norm in self._sorted:
+            for tok in norm.split():
+                self._tokens.setdefault(tok, set()).add(norm)
+        self._sorted_tokens = sorted(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def exact(self, query: str) -> list:
+        return list(self._exact.get(normaliser_nom(query), []))
+
+    def _prefix(self, sorted_list: list[str], prefix: str) -> list[str]:
+        pos = bisect_left(sorted_list, prefix)
+        out = []
+        while pos < len(sorted_list) and sorted_list[pos].startswith(prefix):
+            out.append(sorted_list[pos])
+            pos += 1
+        return out
+
+    def search(self, query: str, limit: int = 10, cutoff: float = 0.6) -> list:
+        """Retourne au plus `limit` clés, de la meilleure à la moins bonne correspondance."""
+        norm = normaliser_nom(query)
+        if not norm:
+            return []
+
+        found: list[str] = []
+        seen: set[str] = set()
+
+        def add(names):
+            for n in names:
+                if n not in seen:
+                    seen.add(n)
+                    found.append(n)
+
+        if norm in self._exact:
+            add([norm])
+
+        if len(found) < limit:
+            add(self._prefix(self._sorted, norm)[:limit])
+
+        words = norm.split()
+        if len(found) < limit:
+            candidates: set[str] | None = None
+            for i, word in enumerate(words):
+                if i == len(words) - 1:
+                    names = set()
+                    for tok in self._prefix(self._sorted_tokens, word):
+                        names |= self._tokens[tok]
+                else:
+                    names = self._tokens.get(word, set())
+                candidates = names if candidates is None else candidates & names
+                if not candidates:
+                    break
+            if candidates:
+                add(sorted(candidates, key=len))
+
+        if len(found) < limit:
+            # Approximatif : restreint aux noms dont un mot commence comme un mot de la requête
+            # (jamais toute la liste : une recherche abandonnée ne doit pas occuper un thread longtemps)
+            pool: set[str] = set()
+            for word in words:
+                for tok in self._prefix(self._sorted_tokens, word[:3]):
+                    pool |= self._tokens[tok]
+            if pool:
+                add(get_close_matches(norm, pool, n=limit, cutoff=cutoff))
+
+        if len(found) < limit:
+            # Mot à mot : « zorro » → « zoro » dans « roronoa zoro »
+            candidates = None
+            for word in words:
+                close = get_close_matches(word, self._prefix(self._sorted_tokens, word[:1]), n=5, cutoff=0.75)
+                names = set().union(*(self._tokens[tok] for tok in close)) if close else set()
+                candidates = names if candidates is None else candidates & names
+                if not candidates:
+                    break
+            if candidates:
+                add(sorted(candidates, key=len))
+
+        keys = list(dict.fromkeys(key for n in found for key in self._exact[n]))
+        return keys[:limit]
+
+    def best(self, query: str):
+        keys = self.search(query, limit=1)
+        return keys[0] if keys else None
@@ -0,0 +1,136 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 vaact_classement.py — Classement du tournoi VAACT (Google Sheets)
+# Objectif :
+#   - Garder en mémoire le classement déjà analysé (joueur, points)
+#   - Le servir immédiatement, même périmé, et le rafraîchir en arrière-plan
+#   - Repartir de la dernière copie valide sur disque si la feuille est injoignable
+#   - Historiser chaque nouveau classement (utils/vaact_history.py)
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : URL de la feuille CSV dans la variable d'environnement
+#             VAACT_CLASSEMENT_SHEET.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import csv
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+import aiohttp
+
+from utils.http_cache import conditional_text
+from utils.vaact_history import record_snapshot
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+CLASSEMENT_PATH = Path("database/vaact_classement.json")
+CLASSEMENT_TTL = 120  # secondes avant de revalider la feuille
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Analyse du CSV
+# ────────────────────────────────────────────────────────────────────────────────
+def parse_classement(text: str) -> list[tuple[str, str]]:
+    """Lignes (joueur, points) de la feuille : colonne C = joueur, colonne F = points."""
+    rows = list(csv.reader(io.StringIO(text)))
+    classement = []
+    for row in rows[2:]:  # on saute les 2 premières lignes
+        if len(row) < 6 or not row[2].strip():
+            break
+        classement.append((row[2].strip(), row[5].strip() or "0"))
+    return classement
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Cache du classement
+# ────────────────────────────────────────────────────────────────────────────────
+class ClassementStore:
+    def __init__(self, path: Path = CLASSEMENT_PATH, ttl: float = CLASSEMENT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.url = os.getenv("VAACT_CLASSEMENT_SHEET")
+        self.classement: list[tuple[str, str]] = []
+        self.fetched_at = 0.0
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.classement)
+
+    @property
+    def stale(self) -> bool:
+        return time.time() - self.fetched_at > self.ttl
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 💾 Dernière copie valide
+    # ────────────────────────────────────────────────────────────────────────────
+    def load(self) -> bool:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"[vaact_classement] Copie disque illisible : {e}")
+            return False
+        self.classement = [tuple(entry) for entry in data.get("classement", [])]
+        self.fetched_at = data.get("fetched_at", 0.0)
+        return self.ready
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"fetched_at": self.fetched_at, "classement": self.classement}, f, ensure_ascii=False)
+        tmp.replace(self.path)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔄 Rafraîchissement
+    # ────────────────────────────────────────────────────────────────────────────
+    async def refresh(self, session: aiohttp.ClientSession) -> bool:
+        """Relit la feuille. En cas d'échec, la copie courante reste servie."""
+        async with self._lock:
+            try:
+                text, changed = await conditional_text(session, self.url)
+            except Exception as e:
+                print(f"[vaact_classement] Feuille injoignable : {e}")
+                return False
+            self.fetched_at = time.time()
+            if not changed and self.ready:
+                return True
+            classement = parse_classement(text)
+            if not classement:
+                print("[vaact_classement] Feuille vide ou illisible, copie précédente conservée")
+                return False
+            self.classement = classement
+            await asyncio.to_thread(self.save)
+            await asyncio.to_thread(record_snapshot, classement, self.fetched_at)
+            return True
+
+    def _refresh_in_background(self, session: aiohttp.ClientSession):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.refresh(session))
+
+    async def get(self, session: aiohttp.ClientSession) -> list[tuple[str, str]]:
+        """
+        Classement à afficher, sans attendre Google dès qu'une copie existe
+        (mémoire ou disque) : une copie périmée est servie et revalidée en arrière-plan.
+        """
+        if not self.ready:
+            self.load()
+        if not self.ready:
+            await self.refresh(session)
+        elif self.stale:
+            self._refresh_in_background(session)
+        return self.classement
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+classement_store = ClassementStore()
@@ -0,0 +1,216 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 vaact_deck_stats.py — Analyse des listes de decks VAACT (data/decks/*.json)
+# Objectif :
+#   - Résoudre en une passe les noms anglais des listes en ids de card_db
+#   - Précalculer les statistiques : types, attributs, courbe de niveaux,
+#     cartes hors limite (banlist TCG) et prix total
+#   - Mémoriser le résultat par empreinte de fichier (et version de card_db)
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Un fichier de deck = {"deck": [...], "extra": [...], "side": [...]},
+#             une entrée par exemplaire. Le fichier d'un duelliste est
+#             <duelliste>.json, ou <duelliste>_<niveau>.json pour un niveau précis.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import hashlib
+import json
+import threading
+from collections import Counter
+from pathlib import Path
+
+from utils.text_utils import normaliser_nom
+from utils.ygo_banlist import BAN_LIMITS, banlist_store
+from utils.ygo_db import CardDatabase, card_db
+from utils.ygo_prices import card_price
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+DECKS_DIR = Path("data/decks")
+STATS_PATH = Path("database/vaact_deck_stats.json")
+
+SECTIONS = ("deck", "extra", "side")
+BAN_FORMAT = "tcg"
+STATS_FORMAT = 2   # à incrémenter quand compute_stats change : les entrées en cache sont recalculées
+
+
+def deck_slug(texte: str) -> str:
+    """« Jaden Yuki Manga » → « jaden_yuki_manga »."""
+    return "_".join(normaliser_nom(texte).split())
+
+
+def card_kind(card: dict) -> str:
+    t = card.get("type", "")
+    if "Spell" in t:
+        return "Magie"
+    if "Trap" in t:
+        return "Piège"
+    return "Monstre"
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Résolution et statistiques
+# ────────────────────────────────────────────────────────────────────────────────
+def resolve_names(names: list[str]) -> dict[str, int | None]:
+    """
+    Nom → id pour chaque nom distinct (nom anglais ou français exact, normalisé).
+    Pas de correspondance approximative : une faute de frappe compterait une autre
+    carte dans les statistiques et la banlist ; le nom est signalé non reconnu.
+    """
+    resolved = {}
+    for name in set(names):
+        card = card_db.find(name)
+        resolved[name] = card["id"] if card else None
+    return resolved
+
+
+def compute_stats(sections: dict[str, list[str]]) -> dict:
+    names = [n for section in SECTIONS for n in sections.get(section, [])]
+    ids = resolve_names(names)
+
+    counts = {section: len(sections.get(section, [])) for section in SECTIONS}
+    kinds, attributes, levels = Counter(), Counter(), Counter()
+    copies = Counter()
+    price = 0.0
+    for section in SECTIONS:
+        for name in sections.get(section, []):
+            card = card_db.get(ids[name]) if ids[name] is not None else None
+            if card is None:
+                continue
+            copies[card["id"]] += 1
+            price += card_price(card)
+            if section != "deck":
+                continue
+            kinds[card_kind(card)] += 1
+            if card.get("attribute"):
+                attributes[card["attribute"]] += 1
+            if "level" in card and card_kind(card) == "Monstre":
+                levels[card["level"]] += 1
+
+    violations = []
+    for card_id, n in copies.items():
+        status = banlist_store.status(card_id, BAN_FORMAT)
+        if status in BAN_LIMITS and n > BAN_LIMITS[status]:
+            violations.append({"id": card_id, "status": status, "copies": n})
+
+    return {
+        "ids": {section: [ids[n] for n in sections.get(section, [])] for section in SECTIONS},
+        "unresolved": sorted(n for n, i in ids.items() if i is None),
+        "counts": counts,
+        "kinds": dict(kinds.most_common()),
+        "attributes": dict(attributes.most_common()),
+        "levels": {str(lvl): n for lvl, n in sorted(levels.items())},
+        "violations": violations,
+        "price": round(price, 2),
+    }
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Cache par fichier
+# ────────────────────────────────────────────────────────────────────────────────
+class DeckStatsCache:
+    """
+    Statistiques précalculées des listes. Les calculs et l'écriture disque ne se
+    font que dans build() (thread de card_db ou asyncio.to_thread), sous verrou ;
+    les commandes ne font que lire `entries`, remplacé d'un bloc.
+    """
+
+    def __init__(self, decks_dir: Path = DECKS_DIR, path: Path = STATS_PATH):
+        self.decks_dir = decks_dir
+        self.path = path
+        self.entries: dict[str, dict] = {}   # nom de fichier → {hash, db_version, format, stats}
+        self._db_version: str | None = None  # version de card_db au dernier chargement effectif
+        self._lock = threading.Lock()
+
+    def load(self):
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"[vaact_deck_stats] Cache illisible : {e}")
+
+    def _save(self, entries: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, separators=(",", ":"))
+        tmp.replace(self.path)
+
+    def _update(self, file: Path, entries: dict) -> bool:
+        """Recalcule un fichier si lui ou card_db a changé. Retourne True si l'entrée a changé."""
+        try:
+            raw = file.read_bytes()
+        except OSError:
+            return False
+        digest = hashlib.sha1(raw).hexdigest()
+        entry = entries.get(file.name)
+        if (entry and entry["hash"] == digest and entry["db_version"] == self._db_version
+                and entry.get("format") == STATS_FORMAT):
+            return False
+        try:
+            sections = json.loads(raw) if raw.strip() else {}
+        except ValueError as e:
+            print(f"[vaact_deck_stats] {file.name} illisible : {e}")
+            sections = {}
+        stats = compute_stats(sections) if any(sections.get(s) for s in SECTIONS) else None
+        entries[file.name] = {"hash": digest, "db_version": self._db_version, "format": STATS_FORMAT, "stats": stats}
+        return True
+
+    def build(self, db: CardDatabase | None = None):
+        """
+        Précalcule toutes les listes. Appelé à chaque chargement de card_db (dont
+        la version n'est retenue qu'ici) ou sans argument pour relire data/decks/.
+        """
+        with self._lock:
+            if db is not None:
+                self._db_version = db.version
+            if self._db_version is None or not card_db.ready:
+                return
+            entries = dict(self.entries)
+            present = set()
+            changed = False
+            for file in sorted(self.decks_dir.glob("*.json")):
+                present.add(file.name)
+                changed |= self._update(file, entries)
+            for name in set(entries) - present:
+                del entries[name]
+                changed = True
+            self.entries = entries
+            if changed:
+                self._save(entries)
+
+    async def refresh(self):
+        """Relit data/decks/ hors de la boucle (fichiers ajoutés ou modifiés)."""
+        try:
+            await asyncio.to_thread(self.build)
+        except Exception as e:
+            print(f"[vaact_deck_stats] Erreur recalcul des listes : {e}")
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔎 Lecture (sans calcul ni accès disque)
+    # ────────────────────────────────────────────────────────────────────────────
+    def stats(self, file_name: str) -> dict | None:
+        entry = self.entries.get(file_name)
+        return entry["stats"] if entry else None
+
+    def deck_file(self, duelliste: str, niveau: str | None = None) -> str | None:
+        """Liste d'un duelliste : d'abord propre au niveau, sinon générique."""
+        candidates = [f"{deck_slug(duelliste)}_{deck_slug(niveau)}"] if niveau else []
+        candidates.append(deck_slug(duelliste))
+        entries = self.entries
+        for stem in candidates:
+            if f"{stem}.json" in entries:
+                return f"{stem}.json"
+        return None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+deck_stats = DeckStatsCache()
+deck_stats.load()
+card_db.on_refresh(deck_stats.build)
@@ -0,0 +1,116 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 vaact_decks.py — Catalogue partagé des decks VAACT (data/deck_data.json)
+# Objectif :
+#   - Lire deck_data.json une seule fois pour /vaact_deck et /vaact_randeck
+#   - Précalculer saison → duelliste → niveau et un tableau plat de tirages
+#   - Mémoriser les options des menus déroulants
+#   - Recharger le fichier dès que sa date de modification change
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+import os
+import random
+
+import discord
+
+DECK_JSON_PATH = os.path.join("data", "deck_data.json")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Catalogue
+# ────────────────────────────────────────────────────────────────────────────────
+class DeckCatalogue:
+    def __init__(self, path: str = DECK_JSON_PATH):
+        self.path = path
+        self._mtime: float | None = None
+        self.data: dict = {}
+        self.saisons: list[str] = []                        # ordre du fichier
+        self.duellistes: dict[str, list[str]] = {}          # saison → duellistes triés
+        self.niveaux: dict[tuple[str, str], dict] = {}      # (saison, duelliste) → {niveau: liens}
+        # Une entrée par (saison, duelliste, niveau) : un duelliste à 2 niveaux a 2 chances
+        self.picks: list[tuple[str, str, str, dict]] = []
+        self._options: dict[tuple, list[discord.SelectOption]] = {}
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔄 Chargement à chaud
+    # ────────────────────────────────────────────────────────────────────────────
+    def ensure_fresh(self) -> bool:
+        """Recharge le fichier si sa date de modification a changé. Retourne True si des données sont disponibles."""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError as e:
+            if self._mtime is None:
+                print(f"[vaact_decks] Fichier introuvable : {e}")
+            return bool(self.data)
+        if mtime != self._mtime:
+            self._load(mtime)
+        return bool(self.data)
+
+    def _load(self, mtime: float):
+        # Une date déjà vue n'est relue qu'une fois, valide ou non : le prochain enregistrement la changera
+        self._mtime = mtime
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._build(data)
+        except Exception as e:
+            # Fichier en cours d'écriture ou invalide : l'ancienne version reste servie
+            print(f"[vaact_decks] Erreur chargement JSON : {e}")
+
+    def _build(self, data: dict):
+        duellistes, niveaux, picks = {}, {}, []
+        for saison, persos in data.items():
+            duellistes[saison] = sorted(persos)
+            for duelliste, infos in persos.items():
+                deck = infos.get("deck", {})
+                niveaux[(saison, duelliste)] = deck
+                if not isinstance(deck, dict):
+                    continue
+                for niveau, liens in deck.items():
+                    if isinstance(liens, dict) and liens:
+                        picks.append((saison, duelliste, niveau, liens))
+        self.data = data
+        self.saisons = list(data)
+        self.duellistes = duellistes
+        self.niveaux = niveaux
+        self.picks = picks
+        self._options = {}
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔎 Lecture
+    # ────────────────────────────────────────────────────────────────────────────
+    def deck(self, saison: str, duelliste: str):
+        return self.niveaux.get((saison, duelliste), {})
+
+    def random_pick(self) -> tuple[str, str, str, dict] | None:
+        return random.choice(self.picks) if self.picks else None
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🎛️ Options des menus (mémorisées jusqu'au prochain rechargement)
+    # ────────────────────────────────────────────────────────────────────────────
+    def saison_options(self, selected: str | None) -> list[discord.SelectOption]:
+        key = ("saison", selected)
+        if key not in self._options:
+            self._options[key] = [
+                discord.SelectOption(label=s, value=s, default=(s == selected))
+                for s in self.saisons
+            ]
+        return self._options[key]
+
+    def duelliste_options(self, saison: str, selected: str | None) -> list[discord.SelectOption]:
+        key = ("duelliste", saison, selected)
+        if key not in self._options:
+            self._options[key] = [
+                discord.SelectOption(label=d, value=d, default=(d == selected))
+                for d in self.duellistes.get(saison, [])
+            ]
+        return self._options[key]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+deck_catalogue = DeckCatalogue()
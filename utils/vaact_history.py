@@ -0,0 +1,221 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 vaact_history.py — Historique du classement VAACT (SQLite local)
+# Objectif :
+#   - Comparer chaque nouveau classement au précédent et n'enregistrer que les
+#     joueurs dont le rang ou les points ont changé
+#   - Servir l'historique d'un joueur et les flèches de progression par requêtes
+#     indexées, sans relire de CSV
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Une ligne d'historique = (joueur, instantané, rang, points) ; un
+#             joueur absent d'un instantané a gardé sa dernière valeur connue.
+#             standing_latest suit chaque joueur encore présent sur la feuille :
+#             s'il pointe vers un instantané plus ancien, le joueur en est sorti.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import os
+import sqlite3
+import time
+
+from utils.init_db import DB_DIR
+from utils.text_utils import NameIndex, normaliser_nom
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+HISTORY_DB_PATH = os.path.join(DB_DIR, "vaact_classement.db")
+
+
+def to_points(value: str) -> float:
+    """Points de la feuille (« 12 », « 12,5 », vide) en nombre."""
+    try:
+        return float(str(value).replace(",", ".").strip() or 0)
+    except ValueError:
+        return 0.0
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Stockage SQLite
+# ────────────────────────────────────────────────────────────────────────────────
+def get_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(HISTORY_DB_PATH)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS players (
+            player_id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            norm TEXT NOT NULL UNIQUE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS snapshots (
+            snapshot INTEGER PRIMARY KEY,
+            taken_at REAL NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS standing_history (
+            player_id INTEGER NOT NULL,
+            snapshot INTEGER NOT NULL,
+            rank INTEGER NOT NULL,
+            points REAL NOT NULL,
+            PRIMARY KEY (player_id, snapshot)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS standing_latest (
+            player_id INTEGER PRIMARY KEY,
+            snapshot INTEGER NOT NULL,
+            rank INTEGER NOT NULL,
+            points REAL NOT NULL,
+            prev_rank INTEGER
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_standing_latest_snapshot ON standing_latest (snapshot)")
+    return conn
+
+
+def _player_ids(conn: sqlite3.Connection, names: list[str]) -> dict[str, int]:
+    """Identifiant de chaque joueur (créé au besoin), indexé par nom normalisé."""
+    conn.executemany(
+        "INSERT OR IGNORE INTO players (name, norm) VALUES (?, ?)",
+        [(name, normaliser_nom(name)) for name in names]
+    )
+    ids = {norm: pid for pid, norm in conn.execute("SELECT player_id, norm FROM players")}
+    # Le nom affiché suit la dernière orthographe de la feuille
+    conn.executemany(
+        "UPDATE players SET name = ? WHERE player_id = ? AND name != ?",
+        [(name, ids[normaliser_nom(name)], name) for name in names]
+    )
+    return ids
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📸 Enregistrement d'un classement
+# ────────────────────────────────────────────────────────────────────────────────
+def record_snapshot(classement: list[tuple[str, str]], taken_at: float | None = None) -> int:
+    """
+    Compare le classement au dernier enregistré et ajoute les lignes qui ont changé.
+    Un classement identique n'ouvre pas d'instantané. Retourne le nombre de lignes écrites.
+    """
+    taken_at = time.time() if taken_at is None else taken_at
+    current: dict[str, tuple[str, int, float]] = {}
+    for rank, (name, pts) in enumerate(classement, start=1):
+        norm = normaliser_nom(name)
+        if norm and norm not in current:
+            current[norm] = (name, rank, to_points(pts))
+    if not current:
+        return 0
+
+    conn = get_conn()
+    try:
+        with conn:
+            ids = _player_ids(conn, [name for name, _, _ in current.values()])
+            latest = {
+                pid: (snapshot, rank, points)
+                for pid, snapshot, rank, points in conn.execute(
+                    "SELECT player_id, snapshot, rank, points FROM standing_latest"
+                )
+            }
+            last_snapshot = conn.execute("SELECT MAX(snapshot) FROM snapshots").fetchone()[0] or 0
+
+            history_rows = []
+            for norm, (_, rank, points) in current.items():
+                previous = latest.get(ids[norm])
+                if previous and previous[0] == last_snapshot and previous[1:] == (rank, points):
+                    continue
+                history_rows.append((ids[norm], rank, points))
+
+            # Joueurs sortis de la feuille depuis le dernier instantané
+            current_ids = {ids[norm] for norm in current}
+            gone = any(
+                snapshot == last_snapshot and pid not in current_ids
+                for pid, (snapshot, _, _) in latest.items()
+            )
+            if not history_rows and not gone:
+                return 0
+
+            snapshot = last_snapshot + 1
+            conn.execute("INSERT INTO snapshots VALUES (?, ?)", (snapshot, taken_at))
+            conn.executemany(
+                "INSERT INTO standing_history VALUES (?, ?, ?, ?)",
+                [(pid, snapshot, rank, points) for pid, rank, points in history_rows]
+            )
+            # Rang précédent = rang au dernier instantané (None pour un nouveau joueur)
+            conn.executemany(
+                "INSERT OR REPLACE INTO standing_latest VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        ids[norm], snapshot, rank, points,
+                        latest[ids[norm]][1] if ids[norm] in latest else None,
+                    )
+                    for norm, (_, rank, points) in current.items()
+                ]
+            )
+        print(f"✅ [vaact_history] Instantané {snapshot} : {len(history_rows)} changements")
+        return len(history_rows)
+    finally:
+        conn.close()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📈 Lecture
+# ────────────────────────────────────────────────────────────────────────────────
+def rank_changes() -> dict[str, int | None]:
+    """
+    Rang précédent de chaque joueur du dernier instantané, indexé par nom normalisé
+    (None = nouveau venu). Sert aux flèches ▲ / ▼ du classement ; vide tant
+    qu'il n'existe qu'un seul instantané (aucune comparaison possible).
+    """
+    conn = get_conn()
+    try:
+        if (conn.execute("SELECT MAX(snapshot) FROM snapshots").fetchone()[0] or 0) < 2:
+            return {}
+        return {
+            norm: prev_rank
+            for norm, prev_rank in conn.execute("""
+                SELECT p.norm, l.prev_rank
+                FROM standing_latest l JOIN players p USING (player_id)
+                WHERE l.snapshot = (SELECT MAX(snapshot) FROM snapshots)
+            """)
+        }
+    finally:
+        conn.close()
+
+
+def find_player(query: str) -> tuple[int, str] | None:
+    """Joueur le plus proche de `query` (exact, préfixe puis approximatif)."""
+    conn = get_conn()
+    try:
+        players = conn.execute("SELECT player_id, name FROM players").fetchall()
+    finally:
+        conn.close()
+    names = dict(players)
+    player_id = NameIndex((name, pid) for pid, name in players).best(query)
+    return (player_id, names[player_id]) if player_id is not None else None
+
+
+def player_on_sheet(player_id: int) -> bool:
+    """True si le joueur figure dans le dernier classement enregistré."""
+    conn = get_conn()
+    try:
+        row = conn.execute("""
+            SELECT l.snapshot = (SELECT MAX(snapshot) FROM snapshots)
+            FROM standing_latest l WHERE l.player_id = ?
+        """, (player_id,)).fetchone()
+        return bool(row and row[0])
+    finally:
+        conn.close()
+
+
+def player_history(player_id: int) -> list[tuple[float, int, float]]:
+    """Évolutions du joueur, de la plus ancienne à la plus récente : [(date, rang, points)]."""
+    conn = get_conn()
+    try:
+        return conn.execute("""
+            SELECT s.taken_at, h.rank, h.points
+            FROM standing_history h JOIN snapshots s USING (snapshot)
+            WHERE h.player_id = ?
+            ORDER BY h.snapshot
+        """, (player_id,)).fetchall()
+    finally:
+        conn.close()
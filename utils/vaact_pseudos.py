@@ -0,0 +1,131 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 vaact_pseudos.py — Attribution des pseudos VAACT officiels
+# Objectif :
+#   - Table vaact_claims (pseudo unique, un pseudo par joueur) dans profil.db
+#   - Attribution en une seule requête atomique : deux modals simultanés ne
+#     peuvent pas obtenir le même pseudo
+#   - Liste triée des pseudos libres tenue à jour à chaque attribution
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : profil.vaact_name est mis à jour dans la même transaction, pour
+#             /profil et l'éditeur admin (qui passe aussi par claim/release).
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+import os
+import sqlite3
+from bisect import insort
+
+from utils.vaact_utils import DB_PATH
+
+PSEUDOS_JSON_PATH = os.path.join("data", "vaact_pseudos.json")
+NO_PSEUDO = "Non défini"
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Registre des pseudos
+# ────────────────────────────────────────────────────────────────────────────────
+class PseudoClaims:
+    # Résultats de claim()
+    CLAIMED = "claimed"
+    ALREADY_YOURS = "already_yours"
+    TAKEN = "taken"
+    UNKNOWN = "unknown"
+
+    def __init__(self, db_path=DB_PATH, json_path: str = PSEUDOS_JSON_PATH):
+        self.db_path = db_path
+        with open(json_path, "r", encoding="utf-8") as f:
+            self.all_pseudos: list[str] = sorted(json.load(f), key=str.lower)
+        self._official = set(self.all_pseudos)
+        self.by_user: dict[str, str] = {}
+        self.available: list[str] = []   # pseudos libres, triés sans tenir compte de la casse
+        self._load()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS vaact_claims (
+                pseudo TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL UNIQUE
+            )
+        """)
+        return conn
+
+    def _load(self):
+        """Charge les attributions (reprises une fois depuis profil.vaact_name) et calcule les pseudos libres."""
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = self._connect()
+        try:
+            with conn:
+                has_profil = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'profil'"
+                ).fetchone()
+                if has_profil:
+                    # Pseudos choisis avant l'existence de vaact_claims (le premier trouvé l'emporte)
+                    conn.execute("""
+                        INSERT OR IGNORE INTO vaact_claims (pseudo, user_id)
+                        SELECT vaact_name, user_id FROM profil WHERE vaact_name != ?
+                    """, (NO_PSEUDO,))
+            self.by_user = {user_id: pseudo for pseudo, user_id in conn.execute("SELECT pseudo, user_id FROM vaact_claims")}
+        finally:
+            conn.close()
+        taken = set(self.by_user.values())
+        self.available = [p for p in self.all_pseudos if p not in taken]
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # ✍️ Attribution
+    # ────────────────────────────────────────────────────────────────────────────
+    def claim(self, user_id: int | str, pseudo: str) -> str:
+        """
+        Attribue `pseudo` à `user_id` (en libérant son ancien pseudo).
+        La contrainte UNIQUE tranche entre deux demandes simultanées.
+        """
+        user_id = str(user_id)
+        if pseudo not in self._official:
+            return self.UNKNOWN
+        if self.by_user.get(user_id) == pseudo:
+            return self.ALREADY_YOURS
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("""
+                    INSERT INTO vaact_claims (pseudo, user_id) VALUES (?, ?)
+                    ON CONFLICT (user_id) DO UPDATE SET pseudo = excluded.pseudo
+                """, (pseudo, user_id))
+                conn.execute("UPDATE profil SET vaact_name = ? WHERE user_id = ?", (pseudo, user_id))
+        except sqlite3.IntegrityError:
+            return self.TAKEN
+        finally:
+            conn.close()
+
+        previous = self.by_user.get(user_id)
+        self.by_user[user_id] = pseudo
+        if pseudo in self.available:
+            self.available.remove(pseudo)
+        if previous in self._official:
+            insort(self.available, previous, key=str.lower)
+        return self.CLAIMED
+
+    def release(self, user_id: int | str) -> str | None:
+        """Retire son pseudo à `user_id` (profil.vaact_name repasse à « Non défini ») et le remet en liste."""
+        user_id = str(user_id)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM vaact_claims WHERE user_id = ?", (user_id,))
+                conn.execute("UPDATE profil SET vaact_name = ? WHERE user_id = ?", (NO_PSEUDO, user_id))
+        finally:
+            conn.close()
+
+        previous = self.by_user.pop(user_id, None)
+        if previous in self._official and previous not in self.available:
+            insort(self.available, previous, key=str.lower)
+        return previous
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+pseudo_claims = PseudoClaims()
@@ -0,0 +1,129 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ydk.py — Lecture et analyse des fichiers de deck .ydk
+# Objectif :
+#   - Lire un .ydk ligne par ligne (#main, #extra, !side) depuis un flux HTTP
+#   - Résoudre tous les codes en une passe sur card_db (artworks alternatifs compris)
+#   - Vérifier la légalité TCG / OCG / GOAT avec les instantanés de banlist_store
+#   - Compter les cartes et additionner les prix, sans appel API par carte
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+from collections import Counter
+
+import aiohttp
+
+from utils.ygo_banlist import BAN_LIMITS, FORMATS, banlist_store
+from utils.ygo_db import CardDatabase, card_db
+from utils.ygo_prices import card_price
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+MAX_YDK_BYTES = 64 * 1024  # un .ydk fait quelques Ko ; au-delà ce n'en est pas un
+
+SECTION_MARKERS = {"#main": "main", "#extra": "extra", "!side": "side"}
+SECTION_LIMITS = {"main": (40, 60), "extra": (0, 15), "side": (0, 15)}
+MAX_COPIES = 3
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔁 Codes des artworks alternatifs → id principal
+# ────────────────────────────────────────────────────────────────────────────────
+# Remplacé d'un bloc à chaque rafraîchissement (thread de card_db) : jamais vu vide ou à moitié rempli
+_alias = {"map": {}}
+
+
+def _build_alias(db: CardDatabase):
+    alias: dict[int, int] = {}
+    for card_id, card in db.cards.items():
+        for img in card.get("card_images", []):
+            if img.get("id") and img["id"] != card_id:
+                alias[img["id"]] = card_id
+    _alias["map"] = alias
+
+
+card_db.on_refresh(_build_alias)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📥 Lecture
+# ────────────────────────────────────────────────────────────────────────────────
+def parse_ydk_lines(lines) -> dict[str, list[int]]:
+    """Codes de chaque section ; les commentaires et lignes invalides sont ignorés."""
+    sections = {"main": [], "extra": [], "side": []}
+    current = "main"
+    for line in lines:
+        line = line.strip()
+        if line in SECTION_MARKERS:
+            current = SECTION_MARKERS[line]
+        elif line.isdigit():
+            sections[current].append(int(line))
+    return sections
+
+
+async def read_ydk(session: aiohttp.ClientSession, url: str) -> dict[str, list[int]]:
+    """Télécharge et lit un .ydk en flux, ligne par ligne."""
+    lines = []
+    size = 0
+    async with session.get(url) as resp:
+        if resp.status != 200:
+            raise RuntimeError(f"Pièce jointe → HTTP {resp.status}")
+        async for raw in resp.content:
+            size += len(raw)
+            if size > MAX_YDK_BYTES:
+                raise ValueError("Fichier trop volumineux pour un .ydk")
+            lines.append(raw.decode("utf-8", errors="ignore"))
+    return parse_ydk_lines(lines)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔎 Analyse
+# ────────────────────────────────────────────────────────────────────────────────
+def analyze_deck(sections: dict[str, list[int]]) -> dict:
+    """
+    Résout les codes et retourne :
+      cards (id → carte), counts, unknown (codes introuvables), copies (id → total),
+      legality {format: [problèmes]}, price (€, Cardmarket).
+    """
+    alias = _alias["map"]
+    resolved = {code: alias.get(code, code) for code in {c for codes in sections.values() for c in codes}}
+    cards = {cid: card_db.get(cid) for cid in set(resolved.values())}
+    unknown = sorted(code for code, cid in resolved.items() if cards.get(cid) is None)
+
+    ids = {section: [resolved[c] for c in codes if cards.get(resolved[c])] for section, codes in sections.items()}
+    copies = Counter(cid for section in ids.values() for cid in section)
+
+    common = []
+    for section, (low, high) in SECTION_LIMITS.items():
+        n = len(sections[section])
+        if not low <= n <= high:
+            common.append(f"{section.capitalize()} : {n} cartes (attendu {low}–{high})")
+    for cid, n in copies.items():
+        if n > MAX_COPIES:
+            common.append(f"{_name(cards[cid])} ×{n} (max {MAX_COPIES})")
+
+    legality = {}
+    for fmt in FORMATS:
+        problems = list(common)
+        for cid, n in copies.items():
+            status = banlist_store.status(cid, fmt)
+            if status in BAN_LIMITS and n > BAN_LIMITS[status]:
+                problems.append(f"{_name(cards[cid])} ×{n} ({status})")
+        legality[fmt] = problems
+
+    price = sum(card_price(cards[cid]) * n for cid, n in copies.items())
+    return {
+        "cards": {cid: c for cid, c in cards.items() if c},
+        "ids": ids,
+        "counts": {section: len(codes) for section, codes in sections.items()},
+        "unknown": unknown,
+        "copies": copies,
+        "legality": legality,
+        "price": round(price, 2),
+    }
+
+
+def _name(card: dict) -> str:
+    return card.get("name_fr") or card.get("name", "?")
+
@@ -0,0 +1,143 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_banlist.py — Instantanés versionnés des banlists TCG / OCG / GOAT
+# Objectif :
+#   - Extraire de card_db le statut de chaque carte pour chaque format
+#   - Conserver un historique versionné sur disque (database/banlists.json)
+#   - Calculer les changements entre deux versions
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Une nouvelle version n'est créée que si la liste a réellement changé
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from utils.ygo_db import CardDatabase, card_db
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+FORMATS = {"tcg": "ban_tcg", "ocg": "ban_ocg", "goat": "ban_goat"}
+STATUS_ORDER = {"Banned": 0, "Limited": 1, "Semi-Limited": 2}
+STATUS_FR = {"Banned": "Interdite", "Limited": "Limitée", "Semi-Limited": "Semi-limitée"}
+BAN_LIMITS = {"Banned": 0, "Limited": 1, "Semi-Limited": 2}   # exemplaires autorisés par statut
+
+HISTORY_PATH = Path("database/banlists.json")
+MAX_VERSIONS = 12
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Stockage des instantanés
+# ────────────────────────────────────────────────────────────────────────────────
+class BanlistStore:
+    """Historique des banlists par format : {format: [{version, date, db_version, entries}]}."""
+
+    def __init__(self, path: Path = HISTORY_PATH):
+        self.path = path
+        self.snapshots: dict[str, list[dict]] = {fmt: [] for fmt in FORMATS}
+        self._sorted: dict[str, list[tuple[int, str]]] = {fmt: [] for fmt in FORMATS}
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 💾 Persistance
+    # ────────────────────────────────────────────────────────────────────────────
+    def load(self):
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"[ygo_banlist] Historique illisible : {e}")
+            return
+        for fmt in FORMATS:
+            self.snapshots[fmt] = [
+                {**snap, "entries": {int(k): v for k, v in snap.get("entries", {}).items()}}
+                for snap in data.get(fmt, [])
+            ]
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(self.snapshots, f, ensure_ascii=False, separators=(",", ":"))
+        tmp.replace(self.path)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔧 Construction depuis card_db
+    # ────────────────────────────────────────────────────────────────────────────
+    def build(self, db: CardDatabase):
+        changed = False
+        for fmt, key in FORMATS.items():
+            entries = {
+                card_id: card["banlist_info"][key]
+                for card_id, card in db.cards.items()
+                if card.get("banlist_info", {}).get(key)
+            }
+            history = self.snapshots[fmt]
+            if not history or history[-1]["entries"] != entries:
+                history.append({
+                    "version": (history[-1]["version"] + 1) if history else 1,
+                    "date": datetime.now(timezone.utc).date().isoformat(),
+                    "db_version": db.version,
+                    "entries": entries,
+                })
+                del history[:-MAX_VERSIONS]
+                changed = True
+
+            # Liste triée (statut puis nom affiché) prête pour la pagination
+            self._sorted[fmt] = sorted(
+                entries.items(),
+                key=lambda kv: (STATUS_ORDER.get(kv[1], 9), display_name(db.get(kv[0])).lower())
+            )
+
+        if changed:
+            self.save()
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔍 Lecture
+    # ────────────────────────────────────────────────────────────────────────────
+    def latest(self, fmt: str) -> dict | None:
+        history = self.snapshots.get(fmt) or []
+        return history[-1] if history else None
+
+    def status(self, card_id: int, fmt: str) -> str | None:
+        """Statut d'une carte dans la dernière version ('Banned', 'Limited', 'Semi-Limited' ou None)."""
+        snap = self.latest(fmt)
+        return snap["entries"].get(int(card_id)) if snap else None
+
+    def sorted_entries(self, fmt: str) -> list[tuple[int, str]]:
+        return self._sorted.get(fmt, [])
+
+    def diff(self, fmt: str) -> dict | None:
+        """
+        Compare les deux dernières versions d'un format.
+        Retourne {old, new, added, removed, changed} ou None s'il n'y a qu'une version.
+        """
+        history = self.snapshots.get(fmt) or []
+        if len(history) < 2:
+            return None
+        old, new = history[-2], history[-1]
+        before, after = old["entries"], new["entries"]
+        return {
+            "old": old,
+            "new": new,
+            "added": [(cid, after[cid]) for cid in after if cid not in before],
+            "removed": [(cid, before[cid]) for cid in before if cid not in after],
+            "changed": [(cid, before[cid], after[cid]) for cid in after if cid in before and before[cid] != after[cid]],
+        }
+
+
+def display_name(card: dict | None) -> str:
+    if not card:
+        return "Carte inconnue"
+    return card.get("name_fr") or card.get("name", "Carte inconnue")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+banlist_store = BanlistStore()
+banlist_store.load()
+card_db.on_refresh(banlist_store.build)
@@ -0,0 +1,227 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_db.py — Base de cartes Yu-Gi-Oh! locale
+# Objectif : Télécharger la base YGOPRODeck (EN + FR + sets), la compacter,
+#            la garder en mémoire et en faire un instantané sur disque
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Rafraîchie périodiquement par tasks/ygo_db_refresh.py.
+#             Les index (sets, banlists…) s'abonnent via card_db.on_refresh().
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+import aiohttp
+
+from utils.http_cache import conditional_get, conditional_json
+from utils.json_stream import iter_json_array
+from utils.text_utils import normaliser_nom
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌐 Constantes YGOPRODeck
+# ────────────────────────────────────────────────────────────────────────────────
+API_BASE = "https://db.ygoprodeck.com/api/v7"
+CARDINFO_URL = f"{API_BASE}/cardinfo.php"
+CARDSETS_URL = f"{API_BASE}/cardsets.php"
+DBVER_URL = f"{API_BASE}/checkDBVer.php"
+
+SNAPSHOT_PATH = Path("database/ygo_cards.json")
+
+# Champs conservés pour chaque carte (le reste de la réponse API est ignoré)
+CARD_FIELDS = (
+    "id", "name", "type", "frameType", "desc", "race", "attribute", "atk", "def",
+    "level", "linkval", "linkmarkers", "scale", "archetype", "genesys_points",
+)
+CARD_SET_FIELDS = ("set_name", "set_code", "set_rarity", "set_price")
+CARD_IMAGE_FIELDS = ("id", "image_url", "image_url_small", "image_url_cropped")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Compaction d'une carte brute
+# ────────────────────────────────────────────────────────────────────────────────
+def compact_card(raw: dict) -> dict:
+    """Réduit une carte de l'API aux seuls champs utilisés par le bot."""
+    card = {k: raw[k] for k in CARD_FIELDS if raw.get(k) is not None}
+    card["card_sets"] = [
+        {k: s.get(k) for k in CARD_SET_FIELDS}
+        for s in raw.get("card_sets", [])
+    ]
+    card["card_images"] = [
+        {k: img.get(k) for k in CARD_IMAGE_FIELDS}
+        for img in raw.get("card_images", [])
+    ]
+    card["card_prices"] = raw.get("card_prices", [{}])[:1] or [{}]
+    card["banlist_info"] = raw.get("banlist_info", {})
+    return card
+
+
+def card_fr(card: dict | None) -> dict | None:
+    """Copie d'une carte avec name/desc en français (comme l'API avec language=fr)."""
+    if not card:
+        return None
+    return {**card, "name": card.get("name_fr") or card.get("name"), "desc": card.get("desc_fr") or card.get("desc")}
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Base de cartes en mémoire
+# ────────────────────────────────────────────────────────────────────────────────
+class CardDatabase:
+    """Cartes YGOPRODeck indexées par id, avec noms/descriptions FR fusionnés."""
+
+    def __init__(self, snapshot_path: Path = SNAPSHOT_PATH):
+        self.snapshot_path = snapshot_path
+        self.cards: dict[int, dict] = {}
+        self.sets: list[dict] = []
+        self.version: str | None = None
+        self.updated_at: float = 0.0
+        self._by_name: dict[str, int] = {}
+        self._listeners: list[Callable[["CardDatabase"], None]] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.cards)
+
+    def get(self, card_id: int) -> dict | None:
+        return self.cards.get(int(card_id))
+
+    def find(self, name: str) -> dict | None:
+        """Recherche exacte (normalisée) sur le nom anglais ou français."""
+        card_id = self._by_name.get(normaliser_nom(name))
+        return self.cards.get(card_id) if card_id is not None else None
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔔 Abonnements des index dérivés
+    # ────────────────────────────────────────────────────────────────────────────
+    def on_refresh(self, callback: Callable[["CardDatabase"], None]):
+        """Enregistre un callback appelé après chaque chargement (et immédiatement si déjà prêt)."""
+        self._listeners.append(callback)
+        if self.ready:
+            callback(self)
+
+    def _notify(self):
+        for callback in self._listeners:
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"[ygo_db] Erreur reconstruction index {getattr(callback, '__qualname__', callback)} : {e}")
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 💾 Instantané disque
+    # ────────────────────────────────────────────────────────────────────────────
+    def load_snapshot(self) -> bool:
+        """Charge l'instantané disque s'il existe. Retourne True si des cartes ont été chargées."""
+        try:
+            with self.snapshot_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"[ygo_db] Instantané illisible : {e}")
+            return False
+
+        self._install(data.get("cards", []), data.get("sets", []), data.get("version"), data.get("updated_at", 0.0))
+        print(f"✅ [ygo_db] {len(self.cards)} cartes chargées depuis {self.snapshot_path} (version {self.version})")
+        return True
+
+    def save_snapshot(self):
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({
+                "version": self.version,
+                "updated_at": self.updated_at,
+                "sets": self.sets,
+                "cards": list(self.cards.values()),
+            }, f, ensure_ascii=False, separators=(",", ":"))
+        tmp.replace(self.snapshot_path)
+
+    def _install(self, cards: list[dict], sets: list[dict], version: str | None, updated_at: float):
+        # Noms anglais prioritaires, puis noms français
+        by_name: dict[str, int] = {}
+        for key in ("name", "name_fr"):
+            for c in cards:
+                if c.get(key):
+                    by_name.setdefault(normaliser_nom(c[key]), c["id"])
+        self.cards = {c["id"]: c for c in cards}
+        self._by_name = by_name
+        self.sets = sets
+        self.version = version
+        self.updated_at = updated_at
+        self._notify()
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔄 Rafraîchissement depuis l'API
+    # ────────────────────────────────────────────────────────────────────────────
+    async def fetch_version(self, session: aiohttp.ClientSession) -> str | None:
+        async with session.get(DBVER_URL) as resp:
+            if resp.status != 200:
+                return None
+            data = await resp.json(content_type=None)
+        if isinstance(data, list) and data:
+            return str(data[0].get("database_version"))
+        return None
+
+    async def refresh(self, session: aiohttp.ClientSession, force: bool = False) -> bool:
+        """
+        Télécharge la base complète si la version distante a changé.
+        Retourne True si la base a été remplacée.
+        """
+        async with self._lock:
+            version = await self.fetch_version(session)
+            if not force and self.ready and version and version == self.version:
+                return False
+
+            # Les deux réponses cardinfo.php (plusieurs dizaines de Mo) partent sur
+            # disque, compressées en transit et revalidées par ETag / Last-Modified,
+            # puis sont relues carte par carte : le pic mémoire reste proche de la
+            # taille de la base compacte finale.
+            en_path, en_changed = await conditional_get(session, CARDINFO_URL)
+            fr_path, fr_changed = await conditional_get(session, CARDINFO_URL, {"language": "fr"})
+            sets, sets_changed = await conditional_json(session, CARDSETS_URL)
+            if en_path is None or fr_path is None:
+                raise RuntimeError("cardinfo.php → HTTP 404")
+            if not force and self.ready and not (en_changed or fr_changed or sets_changed):
+                # Rien de neuf malgré un numéro de version différent : on le retient
+                self.version = version
+                self.updated_at = time.time()
+                return False
+            cards = await asyncio.to_thread(_read_cards, en_path, fr_path)
+            if not cards:
+                raise RuntimeError("Réponse cardinfo.php vide")
+
+            await asyncio.to_thread(self._install, cards, sets or [], version, time.time())
+            await asyncio.to_thread(self.save_snapshot)
+            print(f"✅ [ygo_db] Base rafraîchie : {len(self.cards)} cartes (version {self.version})")
+            return True
+
+
+def _read_cards(en_path: Path, fr_path: Path) -> list[dict]:
+    """
+    Lit les réponses cardinfo.php téléchargées, carte par carte : seuls les
+    noms / descriptions FR sont gardés, puis chaque carte anglaise est compactée
+    dès sa lecture et reçoit son name_fr / desc_fr.
+    """
+    fr_by_id = {
+        c["id"]: (c.get("name"), c.get("desc"))
+        for c in iter_json_array(fr_path, key="data") if "id" in c
+    }
+    cards = []
+    for raw in iter_json_array(en_path, key="data"):
+        card = compact_card(raw)
+        name_fr, desc_fr = fr_by_id.pop(card["id"], (None, None))
+        if name_fr:
+            card["name_fr"] = name_fr
+        if desc_fr:
+            card["desc_fr"] = desc_fr
+        cards.append(card)
+    return cards
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+card_db = CardDatabase()
@@ -0,0 +1,76 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_display.py — Traductions et couleurs d'affichage des cartes Yu-Gi-Oh!
+# Objectif :
+#   - Charger data/cardinfofr.json (emojis, traductions, couleurs par type)
+#   - Traduire type, attribut et race d'une carte pour les embeds
+#   - Choisir la couleur d'embed selon le type de carte
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+from pathlib import Path
+
+import discord
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎨 Chargement décorations et couleurs
+# ────────────────────────────────────────────────────────────────────────────────
+CARDINFO_PATH = Path("data/cardinfofr.json")
+try:
+    with CARDINFO_PATH.open("r", encoding="utf-8") as f:
+        CARDINFO = json.load(f)
+except FileNotFoundError:
+    print("[ERREUR] Fichier data/cardinfofr.json introuvable.")
+    CARDINFO = {}
+
+ATTRIBUT_EMOJI = CARDINFO.get("ATTRIBUT_EMOJI", {})
+TYPE_EMOJI = CARDINFO.get("TYPE_EMOJI", {})
+TYPE_TRANSLATION = CARDINFO.get("TYPE_TRANSLATION", {})
+SPELL_RACE_TRANSLATION = CARDINFO.get("SPELL_RACE_TRANSLATION", {})
+TRAP_RACE_TRANSLATION = CARDINFO.get("TRAP_RACE_TRANSLATION", {})
+TYPE_COLOR = {}
+for key, hex_code in CARDINFO.get("TYPE_COLOR", {}).items():
+    try:
+        TYPE_COLOR[key] = discord.Color.from_str(hex_code)
+    except Exception:
+        TYPE_COLOR[key] = discord.Color.dark_grey()
+TYPE_COLOR.setdefault("default", discord.Color.dark_grey())
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🔧 Helpers pour formatage
+# ────────────────────────────────────────────────────────────────────────────────
+def translate_card_type(type_str: str) -> str:
+    if not type_str:
+        return "Inconnu"
+    t = type_str.lower()
+    for eng, fr in TYPE_TRANSLATION.items():
+        if eng in t:
+            return fr
+    return type_str
+
+def pick_embed_color(type_str: str) -> discord.Color:
+    if not type_str:
+        return TYPE_COLOR.get("default")
+    priority_keys = ["fusion","ritual","synchro","xyz","link","pendulum","spell","trap","token","monster"]
+    t = type_str.lower()
+    for key in priority_keys:
+        if key in t and key in TYPE_COLOR:
+            return TYPE_COLOR[key]
+    return TYPE_COLOR.get("default")
+
+def format_attribute(attr: str) -> str:
+    return ATTRIBUT_EMOJI.get(attr.upper(), attr) if attr else "?"
+
+def format_race(race: str, type_raw: str) -> str:
+    if not race:
+        return "?"
+    t = type_raw.lower()
+    if "spell" in t:
+        return SPELL_RACE_TRANSLATION.get(race, race)
+    if "trap" in t:
+        return TRAP_RACE_TRANSLATION.get(race, race)
+    return TYPE_EMOJI.get(race, race)
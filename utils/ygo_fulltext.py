@@ -0,0 +1,264 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_fulltext.py — Recherche plein texte dans les effets des cartes (BM25)
+# Objectif :
+#   - Index inversé positionnel sur les textes anglais et français de card_db
+#     (accents retirés, racinisation légère)
+#   - Classement BM25 et requêtes d'expression exacte entre guillemets
+#   - Index reconstruit une fois par version de card_db et conservé sur disque
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Les postings sont des tableaux NumPy contigus (un bloc par terme),
+#             chargés tels quels depuis database/ygo_fulltext.npz.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from utils.text_utils import normaliser_nom
+from utils.ygo_db import CardDatabase, card_db
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+INDEX_PATH = Path("database/ygo_fulltext.npz")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Terminaisons retirées (une seule, la plus longue) : « piochez », « pioche », « pioches » → « pioch »
+SUFFIXES = ("ements", "ement", "ations", "ation", "isez", "ire", "ing", "ees", "ez", "er", "ee", "es", "ed", "e", "s", "x")
+MIN_STEM = 3
+
+# Mots vides ignorés hors des expressions exactes
+STOPWORDS = {
+    "le", "la", "les", "l", "de", "des", "du", "d", "un", "une", "et", "a", "au", "aux", "en",
+    "ce", "cet", "cette", "ces", "qui", "que", "se", "sa", "son", "ses", "votre", "vos", "vous",
+    "the", "of", "to", "and", "an", "in", "on", "this", "that", "your", "you", "is", "it",
+}
+
+_PHRASE = re.compile(r'"([^"]+)"')
+
+
+def stem(token: str) -> str:
+    if token.isdigit():
+        return token
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM:
+            return token[:-len(suffix)]
+    return token
+
+
+def analyze(text: str) -> list[str]:
+    """Texte brut → racines, dans l'ordre (accents et ponctuation retirés)."""
+    return [stem(t) for t in normaliser_nom(text).split()]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Index inversé
+# ────────────────────────────────────────────────────────────────────────────────
+class Postings(NamedTuple):
+    version: str | None
+    ids: np.ndarray            # ligne → id de carte
+    doc_len: np.ndarray
+    avg_len: float
+    terms: dict[str, int]      # racine → numéro de terme
+    term_ptr: np.ndarray       # terme → tranche de postings
+    post_doc: np.ndarray
+    post_tf: np.ndarray
+    pos_ptr: np.ndarray        # posting → tranche de positions
+    positions: np.ndarray
+
+
+EMPTY_POSTINGS = Postings(
+    None, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32), 1.0, {},
+    np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32),
+    np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32),
+)
+ARRAYS = ("ids", "doc_len", "term_ptr", "post_doc", "post_tf", "pos_ptr", "positions")
+
+
+class FullTextIndex:
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = path
+        # Remplacé d'un bloc par build() : une recherche lit toujours un index cohérent
+        self.index = EMPTY_POSTINGS
+
+    @property
+    def ready(self) -> bool:
+        return len(self.index.ids) > 0
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔧 Construction
+    # ────────────────────────────────────────────────────────────────────────────
+    def build(self, db: CardDatabase):
+        """Recharge l'index disque s'il correspond à cette version de card_db, sinon le reconstruit."""
+        loaded = self.load(db)
+        if loaded is not None:
+            self.index = loaded
+            return
+        cards = sorted(db.cards.values(), key=lambda c: c["id"])
+        terms: dict[str, int] = {}
+        term_col, doc_col, pos_col = [], [], []
+        doc_len = np.zeros(len(cards), dtype=np.float32)
+        for row, card in enumerate(cards):
+            # Anglais puis français ; le trou d'une position empêche une expression de chevaucher les deux
+            en = analyze(card.get("desc", ""))
+            fr = analyze(card.get("desc_fr", ""))
+            words = en + [""] + fr
+            for pos, word in enumerate(words):
+                if word:
+                    term_col.append(terms.setdefault(word, len(terms)))
+                    pos_col.append(pos)
+            doc_col.extend([row] * (len(en) + len(fr)))
+            doc_len[row] = len(en) + len(fr)
+
+        term_arr = np.asarray(term_col, dtype=np.int64)
+        doc_arr = np.asarray(doc_col, dtype=np.int64)
+        pos_arr = np.asarray(pos_col, dtype=np.int32)
+        order = np.lexsort((pos_arr, doc_arr, term_arr))
+        term_arr, doc_arr, pos_arr = term_arr[order], doc_arr[order], pos_arr[order]
+
+        # Un posting par couple (terme, carte) ; ses positions sont contiguës
+        key = term_arr * len(cards) + doc_arr
+        starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        post_term = term_arr[starts]
+        pos_ptr = np.r_[starts, len(pos_arr)].astype(np.int64)
+
+        index = Postings(
+            version=db.version,
+            ids=np.fromiter((c["id"] for c in cards), dtype=np.int64, count=len(cards)),
+            doc_len=doc_len,
+            avg_len=float(doc_len.mean()) if len(cards) else 1.0,
+            terms=terms,
+            term_ptr=np.searchsorted(post_term, np.arange(len(terms) + 1)).astype(np.int64),
+            post_doc=doc_arr[starts].astype(np.int32),
+            post_tf=np.diff(pos_ptr).astype(np.float32),
+            pos_ptr=pos_ptr,
+            positions=pos_arr,
+        )
+        self.index = index
+        self.save(index)
+        print(f"✅ [ygo_fulltext] Index construit : {len(terms)} termes, {len(index.post_doc)} postings")
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 💾 Sauvegarde disque
+    # ────────────────────────────────────────────────────────────────────────────
+    def save(self, index: Postings):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            np.savez(
+                f,
+                meta=np.array(json.dumps({"version": index.version, "terms": list(index.terms)})),
+                **{name: getattr(index, name) for name in ARRAYS},
+            )
+        tmp.replace(self.path)
+
+    def load(self, db: CardDatabase) -> Postings | None:
+        """Index disque de cette version de card_db, ou None s'il manque ou est périmé."""
+        try:
+            with np.load(self.path) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta["version"] != db.version or len(data["ids"]) != len(db.cards):
+                    return None
+                arrays = {name: data[name] for name in ARRAYS}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[ygo_fulltext] Index illisible : {e}")
+            return None
+
+        doc_len = arrays["doc_len"]
+        return Postings(
+            version=meta["version"],
+            avg_len=float(doc_len.mean()) if len(doc_len) else 1.0,
+            terms={term: i for i, term in enumerate(meta["terms"])},
+            **arrays,
+        )
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔍 Recherche
+    # ────────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _postings(index: Postings, term: str) -> slice:
+        t = index.terms.get(term)
+        if t is None:
+            return slice(0, 0)
+        return slice(index.term_ptr[t], index.term_ptr[t + 1])
+
+    def _phrase_rows(self, index: Postings, words: list[str]) -> np.ndarray:
+        """Lignes contenant les racines `words` côte à côte."""
+        spans = [self._postings(index, w) for w in words]
+        if any(s.start == s.stop for s in spans):
+            return np.empty(0, dtype=np.int32)
+        # Lignes contenant tous les mots, en partant du plus rare
+        rows = None
+        for span in sorted(spans, key=lambda s: s.stop - s.start):
+            docs = index.post_doc[span]
+            rows = docs if rows is None else np.intersect1d(rows, docs, assume_unique=True)
+        if len(words) == 1 or not len(rows):
+            return rows
+
+        starts = None
+        for offset, span in enumerate(spans):
+            # Postings du mot restreints aux lignes candidates, puis leurs positions
+            docs = index.post_doc[span]
+            kept = np.flatnonzero(np.isin(docs, rows, assume_unique=True)) + span.start
+            tf = index.post_tf[kept].astype(np.int64)
+            first = np.repeat(index.pos_ptr[kept] - np.r_[0, np.cumsum(tf)[:-1]], tf)
+            pos = index.positions[first + np.arange(len(first))].astype(np.int64) - offset
+            # Couples (ligne, début d'expression) encodés en un entier
+            keys = np.repeat(index.post_doc[kept].astype(np.int64), tf) << 32 | (pos & 0xFFFFFFFF)
+            starts = keys if starts is None else np.intersect1d(starts, keys, assume_unique=True)
+            if not len(starts):
+                break
+        return np.unique(starts >> 32)
+
+    def search(self, query: str, limit: int = 10) -> tuple[list[tuple[int, float]], int]:
+        """
+        Cartes les plus pertinentes (id, score BM25) et nombre total de correspondances.
+        Les passages entre guillemets doivent apparaître tels quels.
+        """
+        index = self.index   # un seul instantané pour toute la requête
+        phrases = [analyze(p) for p in _PHRASE.findall(query)]
+        phrases = [p for p in phrases if p]
+        loose = [w for w in normaliser_nom(_PHRASE.sub(" ", query)).split() if w not in STOPWORDS]
+        words = set(map(stem, loose)) | {w for p in phrases for w in p}
+        if not words or not len(index.ids):
+            return [], 0
+
+        n_docs = len(index.ids)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * index.doc_len / index.avg_len)
+        scores = np.zeros(n_docs, dtype=np.float32)
+        for word in words:
+            span = self._postings(index, word)
+            df = span.stop - span.start
+            if not df:
+                continue
+            idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+            rows, tf = index.post_doc[span], index.post_tf[span]
+            scores[rows] += idf * tf * (BM25_K1 + 1) / (tf + norm[rows])
+
+        mask = scores > 0
+        for phrase in phrases:
+            allowed = np.zeros(n_docs, dtype=bool)
+            allowed[self._phrase_rows(index, phrase)] = True
+            mask &= allowed
+
+        rows = np.flatnonzero(mask)
+        if len(rows) > limit:
+            rows = rows[np.argpartition(-scores[rows], limit)[:limit]]
+        rows = rows[np.argsort(-scores[rows], kind="stable")]
+        return [(int(index.ids[r]), float(scores[r])) for r in rows], int(mask.sum())
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+fulltext_index = FullTextIndex()
+card_db.on_refresh(fulltext_index.build)
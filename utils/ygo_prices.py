@@ -0,0 +1,198 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_prices.py — Historique des prix Yu-Gi-Oh! (SQLite local)
+# Objectif :
+#   - Photographier les prix de toutes les cartes à chaque rafraîchissement de card_db
+#   - Stocker une série compacte par carte et par vendeur (1 ligne / jour, en deltas)
+#   - Calculer tendances 7 / 30 / 90 jours et min / max sans appel API
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Les prix sont stockés en centimes. Une ligne n'est écrite que si le
+#             prix a changé depuis le dernier jour enregistré (delta nul implicite).
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import os
+import sqlite3
+import time
+
+from utils.init_db import DB_DIR
+from utils.ygo_db import CardDatabase
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+PRIX_DB_PATH = os.path.join(DB_DIR, "prix.db")
+
+# (clé card_prices, libellé, devise) — l'index dans la liste sert d'identifiant vendeur
+VENDORS = [
+    ("cardmarket_price", "Cardmarket", "€"),
+    ("tcgplayer_price", "TCGPlayer", "$"),
+    ("ebay_price", "eBay", "$"),
+    ("amazon_price", "Amazon", "$"),
+    ("coolstuffinc_price", "CoolStuffInc", "$"),
+]
+TREND_WINDOWS = (7, 30, 90)
+
+
+def day_number(timestamp: float | None = None) -> int:
+    """Numéro de jour UTC (jours depuis l'epoch)."""
+    return int((time.time() if timestamp is None else timestamp) // 86400)
+
+
+def card_price(card: dict) -> float:
+    """Prix Cardmarket d'une carte (0 si absent ou illisible)."""
+    try:
+        return float((card.get("card_prices") or [{}])[0].get("cardmarket_price") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def to_cents(price) -> int | None:
+    try:
+        return round(float(price) * 100)
+    except (TypeError, ValueError):
+        return None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Stockage SQLite
+# ────────────────────────────────────────────────────────────────────────────────
+def get_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(PRIX_DB_PATH)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS price_history (
+            card_id INTEGER NOT NULL,
+            vendor INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            delta INTEGER NOT NULL,
+            PRIMARY KEY (card_id, vendor, day)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS price_latest (
+            card_id INTEGER NOT NULL,
+            vendor INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            cents INTEGER NOT NULL,
+            PRIMARY KEY (card_id, vendor)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS price_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+    return conn
+
+
+def snapshot_prices(db: CardDatabase) -> int:
+    """
+    Ajoute les prix de card_db au jour de son dernier téléchargement.
+    Ne fait rien si ce jour a déjà été enregistré. Retourne le nombre de lignes écrites.
+    """
+    if not db.ready or not db.updated_at:
+        return 0
+    day = day_number(db.updated_at)
+
+    conn = get_conn()
+    try:
+        row = conn.execute("SELECT value FROM price_meta WHERE key = 'last_day'").fetchone()
+        if row and int(row[0]) >= day:
+            return 0
+
+        latest = {
+            (card_id, vendor): cents
+            for card_id, vendor, cents in conn.execute("SELECT card_id, vendor, cents FROM price_latest")
+        }
+
+        history_rows = []
+        latest_rows = []
+        for card_id, card in db.cards.items():
+            prices = (card.get("card_prices") or [{}])[0]
+            for vendor, (key, _, _) in enumerate(VENDORS):
+                cents = to_cents(prices.get(key))
+                if cents is None:
+                    continue
+                previous = latest.get((card_id, vendor))
+                if previous == cents:
+                    continue
+                history_rows.append((card_id, vendor, day, cents - (previous or 0)))
+                latest_rows.append((card_id, vendor, day, cents))
+
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO price_history VALUES (?, ?, ?, ?)", history_rows)
+            conn.executemany("INSERT OR REPLACE INTO price_latest VALUES (?, ?, ?, ?)", latest_rows)
+            conn.execute("INSERT OR REPLACE INTO price_meta VALUES ('last_day', ?)", (str(day),))
+        print(f"✅ [ygo_prices] Instantané du jour {day} : {len(history_rows)} changements de prix")
+        return len(history_rows)
+    finally:
+        conn.close()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📈 Lecture et statistiques
+# ────────────────────────────────────────────────────────────────────────────────
+def price_series(card_id: int, days: int = max(TREND_WINDOWS), today: int | None = None) -> dict[int, list[tuple[int, int]]]:
+    """
+    Reconstruit, pour chaque vendeur, la série [(jour, centimes)] sur la fenêtre demandée.
+    Le premier point est le prix au début de la fenêtre, les suivants sont les changements.
+    """
+    today = day_number() if today is None else today
+    start = today - days
+    conn = get_conn()
+    try:
+        latest = dict(conn.execute(
+            "SELECT vendor, cents FROM price_latest WHERE card_id = ?", (card_id,)
+        ).fetchall())
+        deltas: dict[int, list[tuple[int, int]]] = {}
+        for vendor, day, delta in conn.execute(
+            "SELECT vendor, day, delta FROM price_history WHERE card_id = ? AND day > ? ORDER BY vendor, day",
+            (card_id, start)
+        ):
+            deltas.setdefault(vendor, []).append((day, delta))
+    finally:
+        conn.close()
+
+    series = {}
+    for vendor, current in latest.items():
+        changes = deltas.get(vendor, [])
+        # Prix au début de la fenêtre = dernier prix − somme des deltas postérieurs
+        value = current - sum(d for _, d in changes)
+        points = [(start, value)] if value else []
+        for day, delta in changes:
+            value += delta
+            points.append((day, value))
+        series[vendor] = points
+    return series
+
+
+def price_stats(card_id: int, today: int | None = None) -> dict[int, dict]:
+    """
+    Pour chaque vendeur : prix actuel, variation (%) sur 7/30/90 jours, min et max sur 90 jours.
+    Retourne {vendeur: {"current", "trends": {fenêtre: % ou None}, "min", "max"}}.
+    """
+    today = day_number() if today is None else today
+    series = price_series(card_id, max(TREND_WINDOWS), today)
+    stats = {}
+    for vendor, points in series.items():
+        if not points:
+            continue
+        current = points[-1][1]
+
+        trends = {}
+        for window in TREND_WINDOWS:
+            start = today - window
+            # Prix en vigueur au début de la fenêtre (dernier point ≤ start, sinon premier connu)
+            before = [v for d, v in points if d <= start]
+            reference = before[-1] if before else None
+            trends[window] = round((current - reference) * 100 / reference, 1) if reference else None
+
+        values = [v for _, v in points if v > 0]
+        stats[vendor] = {
+            "current": current,
+            "trends": trends,
+            "min": min(values) if values else None,
+            "max": max(values) if values else None,
+        }
+    return stats
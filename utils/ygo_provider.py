@@ -0,0 +1,97 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_provider.py — Catalogue Yu-Gi-Oh! branché sur le socle CardProvider
+# Objectif : Exposer card_db (noms EN + FR) avec la même interface que les autres
+#            TCG : recherche par nom, approximative, tirage aléatoire
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : card_db garde son propre cycle (tasks/ygo_db_refresh.py : version
+#             YGOPRODeck, prix, staples) ; ce catalogue se reconstruit à chaque
+#             rafraîchissement de card_db et n'est pas planifié à part.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import aiohttp
+
+from utils.card_provider import CardProvider, register
+from utils.text_utils import normaliser_nom
+from utils.ygo_db import CardDatabase, card_db, card_fr
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗄️ Catalogue Yu-Gi-Oh!
+# ────────────────────────────────────────────────────────────────────────────────
+class YGOProvider(CardProvider):
+    """Vue CardProvider de card_db, indexée sur les noms anglais et français."""
+
+    key = "ygo"
+    label = "Yu-Gi-Oh!"
+    command = "ygocarte"
+    id_field = "id"
+    scheduled = False
+    rate = 15.0  # YGOPRODeck tolère 20 requêtes / seconde
+    burst = 5
+
+    def __init__(self, db: CardDatabase):
+        super().__init__()
+        self.db = db
+        db.on_refresh(self._on_db_refresh)
+
+    def _on_db_refresh(self, db: CardDatabase):
+        self._install(list(db.cards.values()), db.version, db.updated_at)
+
+    def name_entries(self, card: dict):
+        yield card.get("name", "")
+        if card.get("name_fr"):
+            yield card["name_fr"]
+
+    def card_name(self, card: dict) -> str:
+        return card.get("name_fr") or card.get("name", "")
+
+    def card_image(self, card: dict) -> str | None:
+        images = card.get("card_images") or [{}]
+        return images[0].get("image_url")
+
+    def score(self, query: str, card: dict) -> float:
+        # La requête peut viser le nom anglais comme le nom français
+        return max(
+            super().score(query, {"name": card.get("name", "")}),
+            super().score(query, {"name": card.get("name_fr", "")}),
+        )
+
+    def lookup(self, name: str) -> tuple[dict | None, str]:
+        """
+        Recherche exacte façon API : (carte, langue). En français si le nom
+        demandé est le nom français, sinon la carte anglaise d'origine.
+        """
+        card = self.db.find(name)
+        self.metrics.record_lookup(card is not None)
+        if not card:
+            return None, "?"
+        if card.get("name_fr") and normaliser_nom(card["name_fr"]) == normaliser_nom(name):
+            return card_fr(card), "fr"
+        return card, "en"
+
+    def random_fr(self) -> dict | None:
+        card = self.random_card()
+        return card_fr(card) if card else None
+
+    # Le snapshot et le téléchargement sont ceux de card_db
+    async def download(self, session: aiohttp.ClientSession, force: bool = False):
+        # card_db installe ses cartes lui-même ; ce catalogue suit via _on_db_refresh
+        await self.db.refresh(session, force=force)
+        return None
+
+    def load_snapshot(self) -> bool:
+        return self.db.ready or self.db.load_snapshot()
+
+    def save_snapshot(self):
+        pass
+
+    async def refresh(self, session: aiohttp.ClientSession, force: bool = False) -> bool:
+        return await self.db.refresh(session, force=force)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+ygo_provider = register(YGOProvider(card_db))
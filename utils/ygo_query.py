@@ -0,0 +1,275 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_query.py — Recherche avancée de cartes Yu-Gi-Oh! (colonnes NumPy)
+# Objectif :
+#   - Ranger card_db en colonnes (attribut, type, race, ATK/DEF, niveau/rang/lien,
+#     archétype, statut banlist, texte) reconstruites à chaque rafraîchissement
+#   - Évaluer une petite syntaxe de requête par masques booléens NumPy
+#     (ex. « attribut:DARK race:dragon atk>=2500 niveau<=8 »)
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Les colonnes suivent l'ordre alphabétique des noms affichés : un
+#             masque donne directement des résultats triés.
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from utils.text_utils import normaliser_nom
+from utils.ygo_banlist import banlist_store   # importé avant : son instantané est à jour quand build() s'exécute
+from utils.ygo_db import CardDatabase, card_db
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Vocabulaire de la requête
+# ────────────────────────────────────────────────────────────────────────────────
+KEY_ALIASES = {
+    "attribut": "attribute", "attr": "attribute", "attribute": "attribute",
+    "race": "race",
+    "type": "type",
+    "atk": "atk", "def": "def",
+    "niveau": "level", "niv": "level", "level": "level", "lvl": "level",
+    "rang": "rank", "rank": "rank",
+    "lien": "link", "link": "link",
+    "archetype": "archetype", "arch": "archetype",
+    "tcg": "tcg", "ocg": "ocg", "goat": "goat",
+    "texte": "text", "text": "text", "desc": "text",
+    "nom": "name", "name": "name",
+}
+NUMERIC_KEYS = ("atk", "def", "level", "rank", "link")
+BAN_KEYS = ("tcg", "ocg", "goat")
+
+ATTRIBUTES_FR = {
+    "tenebres": "DARK", "lumiere": "LIGHT", "terre": "EARTH", "eau": "WATER",
+    "feu": "FIRE", "vent": "WIND", "divin": "DIVINE",
+}
+# Mot-clé de type (FR ou EN) → fragment du champ « type » anglais
+TYPE_KEYWORDS = {
+    "monstre": "monster", "monster": "monster",
+    "magie": "spell", "spell": "spell",
+    "piege": "trap", "trap": "trap",
+    "fusion": "fusion", "synchro": "synchro", "xyz": "xyz",
+    "lien": "link", "link": "link",
+    "rituel": "ritual", "ritual": "ritual",
+    "pendule": "pendulum", "pendulum": "pendulum",
+    "effet": "effect", "effect": "effect",
+    "normal": "normal",
+    "syntoniseur": "tuner", "tuner": "tuner",
+    "flip": "flip", "toon": "toon", "union": "union",
+    "gemeau": "gemini", "gemini": "gemini",
+    "esprit": "spirit", "spirit": "spirit",
+    "jeton": "token", "token": "token",
+}
+BAN_CODES = {"Semi-Limited": 1, "Limited": 2, "Banned": 3}
+BAN_VALUES = {
+    "libre": 0, "ok": 0, "autorisee": 0, "unlimited": 0,
+    "semi": 1, "semilimitee": 1, "semilimited": 1,
+    "limitee": 2, "limited": 2,
+    "interdite": 3, "banned": 3, "ban": 3,
+}
+
+_TOKEN = re.compile(
+    r'(?P<key>[^\s:<>=!"]+)\s*(?P<op>>=|<=|!=|=|:|>|<)\s*(?P<val>"[^"]*"|\S+)'
+    r'|(?P<word>"[^"]*"|\S+)'
+)
+_RANGE = re.compile(r"^(\d+)-(\d+)$")
+
+
+class QueryError(ValueError):
+    """Requête invalide ; le message est affiché tel quel à l'utilisateur."""
+
+
+def _race_aliases() -> dict[str, str]:
+    """Noms de races français (data/cardinfofr.json) → nom anglais de l'API."""
+    try:
+        with Path("data/cardinfofr.json").open("r", encoding="utf-8") as f:
+            info = json.load(f)
+    except Exception:
+        return {}
+    aliases = {}
+    for table in ("TYPE_EMOJI", "SPELL_RACE_TRANSLATION", "TRAP_RACE_TRANSLATION"):
+        for en, fr in info.get(table, {}).items():
+            aliases.setdefault(normaliser_nom(fr), en)
+    return aliases
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Colonnes
+# ────────────────────────────────────────────────────────────────────────────────
+class Columns(NamedTuple):
+    ids: np.ndarray
+    numeric: dict[str, np.ndarray]
+    codes: dict[str, np.ndarray]         # attribute / race / type / archetype
+    vocab: dict[str, list[str]]
+    ban: dict[str, np.ndarray]
+    names: list[str]                     # noms EN + FR normalisés
+    texts: list[str]                     # textes EN + FR normalisés
+
+
+EMPTY_COLUMNS = Columns(np.empty(0, dtype=np.int64), {}, {}, {}, {}, [], [])
+
+
+class CardColumns:
+    def __init__(self):
+        # Remplacé d'un bloc par build() : une recherche lit toujours un jeu de colonnes cohérent
+        self.columns = EMPTY_COLUMNS
+        self._race_aliases = _race_aliases()
+
+    def __len__(self) -> int:
+        return len(self.columns.ids)
+
+    @property
+    def ready(self) -> bool:
+        return len(self.columns.ids) > 0
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔧 Construction depuis card_db
+    # ────────────────────────────────────────────────────────────────────────────
+    def build(self, db: CardDatabase):
+        cards = sorted(db.cards.values(), key=lambda c: normaliser_nom(c.get("name_fr") or c["name"]))
+        n = len(cards)
+
+        def categorical(field: str) -> tuple[np.ndarray, list[str]]:
+            vocab: dict[str, int] = {"": 0}
+            codes = np.fromiter((vocab.setdefault(c.get(field) or "", len(vocab)) for c in cards), dtype=np.int32, count=n)
+            return codes, list(vocab)
+
+        def number(values) -> np.ndarray:
+            return np.fromiter((-1 if v is None else int(v) for v in values), dtype=np.int32, count=n)
+
+        is_xyz = [("XYZ" in c.get("type", "")) for c in cards]
+        is_link = [("Link" in c.get("type", "")) for c in cards]
+        numeric = {
+            "atk": number(c.get("atk") for c in cards),
+            "def": number(None if link else c.get("def") for c, link in zip(cards, is_link)),
+            "level": number(None if xyz or link else c.get("level") for c, xyz, link in zip(cards, is_xyz, is_link)),
+            "rank": number(c.get("level") if xyz else None for c, xyz in zip(cards, is_xyz)),
+            "link": number(c.get("linkval") for c in cards),
+        }
+
+        codes, vocab = {}, {}
+        for field in ("attribute", "race", "type", "archetype"):
+            codes[field], vocab[field] = categorical(field)
+
+        # Statuts de la dernière version de banlist_store, comme /ygobanlist et /carte
+        ban = {}
+        for fmt in BAN_KEYS:
+            snap = banlist_store.latest(fmt)
+            statuses = snap["entries"] if snap else {}
+            ban[fmt] = np.fromiter((BAN_CODES.get(statuses.get(c["id"]), 0) for c in cards), dtype=np.int8, count=n)
+
+        self.columns = Columns(
+            ids=np.fromiter((c["id"] for c in cards), dtype=np.int64, count=n),
+            numeric=numeric, codes=codes, vocab=vocab, ban=ban,
+            names=[normaliser_nom(c["name"]) + " | " + normaliser_nom(c.get("name_fr", "")) for c in cards],
+            texts=[normaliser_nom(c.get("desc", "")) + " | " + normaliser_nom(c.get("desc_fr", "")) for c in cards],
+        )
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔍 Filtres élémentaires
+    # ────────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _vocab_mask(cols: Columns, field: str, predicate) -> np.ndarray:
+        matching = [i for i, value in enumerate(cols.vocab[field]) if value and predicate(value)]
+        return np.isin(cols.codes[field], matching)
+
+    @staticmethod
+    def _contains(texts: list[str], needle: str, candidates: np.ndarray) -> np.ndarray:
+        """Lignes candidates dont le texte contient `needle` (évalué en dernier, sur les seules candidates)."""
+        mask = np.zeros(len(texts), dtype=bool)
+        rows = np.flatnonzero(candidates)
+        if needle and len(rows):
+            mask[rows[[needle in texts[i] for i in rows]]] = True
+        return mask
+
+    def _filter(self, cols: Columns, key: str, op: str, value: str, candidates: np.ndarray) -> np.ndarray:
+        if key in NUMERIC_KEYS:
+            column = cols.numeric[key]
+            known = column >= 0
+            if op == ":" and _RANGE.match(value):
+                low, high = map(int, _RANGE.match(value).groups())
+                return known & (column >= low) & (column <= high)
+            if not value.isdigit():
+                raise QueryError(f"`{key}` attend un nombre (ex. `{key}>=2000`).")
+            number = int(value)
+            return known & {
+                ":": column == number, "=": column == number, "!=": column != number,
+                ">=": column >= number, "<=": column <= number,
+                ">": column > number, "<": column < number,
+            }[op]
+
+        if op not in (":", "=", "!="):
+            raise QueryError(f"`{key}` ne s'utilise qu'avec `:` (ex. `{key}:valeur`).")
+        norm = normaliser_nom(value)
+
+        if key == "attribute":
+            attr = ATTRIBUTES_FR.get(norm, norm.upper())
+            mask = self._vocab_mask(cols, "attribute", lambda v: v == attr)
+        elif key == "race":
+            # « rapide » → « jeu rapide » → Quick-Play
+            alias = self._race_aliases.get(norm) or next(
+                (en for fr, en in self._race_aliases.items() if norm in fr.split()), norm
+            )
+            race = normaliser_nom(alias)
+            mask = self._vocab_mask(cols, "race", lambda v: normaliser_nom(v) == race)
+        elif key == "type":
+            fragment = TYPE_KEYWORDS.get(norm, norm)
+            mask = self._vocab_mask(cols, "type", lambda v: fragment in v.lower())
+        elif key == "archetype":
+            mask = self._vocab_mask(cols, "archetype", lambda v: norm in normaliser_nom(v))
+        elif key in BAN_KEYS:
+            code = BAN_VALUES.get(norm.replace(" ", ""))
+            if code is None:
+                raise QueryError(f"`{key}` attend interdite, limitee, semi ou libre.")
+            mask = cols.ban[key] == code
+        elif key == "text":
+            mask = self._contains(cols.texts, norm, candidates)
+        else:  # name
+            mask = self._contains(cols.names, norm, candidates)
+        return ~mask if op == "!=" else mask
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🧮 Requête complète
+    # ────────────────────────────────────────────────────────────────────────────
+    def search(self, query: str) -> list[int]:
+        """Ids des cartes qui satisfont tous les critères, triés par nom affiché."""
+        terms = parse_query(query)
+        if not terms:
+            raise QueryError("Requête vide.")
+        # Les filtres de texte passent en dernier : ils ne lisent que les lignes restantes
+        terms.sort(key=lambda t: t[0] in ("text", "name"))
+        cols = self.columns   # un seul instantané pour toute la requête
+        mask = np.ones(len(cols.ids), dtype=bool)
+        for key, op, value in terms:
+            mask &= self._filter(cols, key, op, value, mask)
+            if not mask.any():
+                break
+        return cols.ids[mask].tolist()
+
+
+def parse_query(query: str) -> list[tuple[str, str, str]]:
+    """
+    « attribut:DARK atk>=2500 texte:"pioche 2" dragon » →
+    [("attribute", ":", "DARK"), ("atk", ">=", "2500"), ("text", ":", "pioche 2"), ("name", ":", "dragon")]
+    Les mots sans clé cherchent dans le nom.
+    """
+    terms = []
+    for m in _TOKEN.finditer(query or ""):
+        if m.group("word"):
+            terms.append(("name", ":", m.group("word").strip('"')))
+            continue
+        key = KEY_ALIASES.get(normaliser_nom(m.group("key")))
+        if key is None:
+            raise QueryError(f"Critère inconnu : `{m.group('key')}`.")
+        terms.append((key, m.group("op"), m.group("val").strip('"')))
+    return terms
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+card_columns = CardColumns()
+card_db.on_refresh(card_columns.build)
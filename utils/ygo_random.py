@@ -0,0 +1,155 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_random.py — Tirages aléatoires filtrés dans card_db
+# Objectif :
+#   - Tableaux d'ids précalculés par groupe de type, attribut, niveau/rang et
+#     archétype, reconstruits à chaque rafraîchissement de card_db
+#   - Tirage filtré = un index aléatoire dans un tableau (combinaisons de
+#     filtres intersectées une fois puis mémorisées)
+#   - Lecture des filtres « attribut:LIGHT niveau:4 » pour /ygocarte random
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import random
+import re
+from collections import defaultdict
+from typing import NamedTuple
+
+import numpy as np
+
+from utils.text_utils import normaliser_nom
+from utils.ygo_db import CardDatabase, card_db
+from utils.ygo_query import ATTRIBUTES_FR, QueryError
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Filtres reconnus
+# ────────────────────────────────────────────────────────────────────────────────
+FILTER_ALIASES = {
+    "type": "type", "groupe": "type",
+    "attribut": "attribute", "attr": "attribute", "attribute": "attribute",
+    "niveau": "level", "niv": "level", "level": "level", "lvl": "level", "rang": "level", "rank": "level",
+    "archetype": "archetype", "arch": "archetype",
+}
+TYPE_GROUPS = {
+    "monstre": "monster", "monster": "monster",
+    "magie": "spell", "spell": "spell",
+    "piege": "trap", "trap": "trap",
+    "jeton": "token", "token": "token",
+    "competence": "skill", "skill": "skill",
+}
+
+MAX_COMBOS = 256   # combinaisons de filtres mémorisées par version de card_db
+
+_FILTER = re.compile(r'([^\s:=]+)\s*[:=]\s*("[^"]*"|\S+)')
+
+
+def type_group(card: dict) -> str:
+    """Groupe de type d'une carte : monster, spell, trap, token ou skill."""
+    t = card.get("type", "")
+    if "Token" in t:
+        return "token"
+    if "Skill" in t:
+        return "skill"
+    if "Spell" in t:
+        return "spell"
+    if "Trap" in t:
+        return "trap"
+    return "monster"
+
+
+def parse_filters(text: str) -> dict[str, str]:
+    """« attribut:LIGHT niveau:4 » → {"attribute": "LIGHT", "level": "4"}."""
+    filters = {}
+    for key, value in _FILTER.findall(text or ""):
+        field = FILTER_ALIASES.get(normaliser_nom(key))
+        if field is None:
+            raise QueryError(f"Filtre inconnu : `{key}` (type, attribut, niveau, archetype).")
+        filters[field] = value.strip('"')
+    return filters
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🎲 Seaux de tirage
+# ────────────────────────────────────────────────────────────────────────────────
+class Buckets(NamedTuple):
+    all: np.ndarray
+    buckets: dict[tuple[str, str], np.ndarray]
+    combos: dict[tuple, np.ndarray]   # filtres combinés → ids, calculés au premier tirage
+
+
+class RandomBuckets:
+    def __init__(self):
+        # Remplacé d'un bloc par build() : un tirage ne mélange jamais deux versions de card_db
+        self.state = Buckets(np.empty(0, dtype=np.int64), {}, {})
+
+    @property
+    def ready(self) -> bool:
+        return len(self.state.all) > 0
+
+    def build(self, db: CardDatabase):
+        groups: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for card_id, card in db.cards.items():
+            groups[("type", type_group(card))].append(card_id)
+            if card.get("attribute"):
+                groups[("attribute", card["attribute"])].append(card_id)
+            if card.get("level") is not None:
+                groups[("level", str(card["level"]))].append(card_id)
+            if card.get("archetype"):
+                groups[("archetype", normaliser_nom(card["archetype"]))].append(card_id)
+
+        self.state = Buckets(
+            all=np.sort(np.fromiter(db.cards, dtype=np.int64, count=len(db.cards))),
+            buckets={key: np.sort(np.asarray(ids, dtype=np.int64)) for key, ids in groups.items()},
+            combos={},
+        )
+
+    def _key(self, field: str, value) -> tuple[str, str]:
+        """Valeur saisie → clé de seau (FR ou EN, sans accents ni casse)."""
+        norm = normaliser_nom(str(value))
+        if field == "type":
+            group = TYPE_GROUPS.get(norm)
+            if group is None:
+                raise QueryError("`type` attend monstre, magie, piege, jeton ou competence.")
+            return field, group
+        if field == "attribute":
+            return field, ATTRIBUTES_FR.get(norm, norm.upper())
+        if field == "level":
+            if not norm.isdigit():
+                raise QueryError("`niveau` attend un nombre (ex. `niveau:4`).")
+            return field, str(int(norm))
+        return field, norm
+
+    def ids(self, **filters) -> np.ndarray:
+        """Ids des cartes qui satisfont tous les filtres (type, attribute, level, archetype)."""
+        state = self.state   # un seul instantané pour tout le calcul
+        keys = tuple(sorted(self._key(f, v) for f, v in filters.items() if v not in (None, "")))
+        if not keys:
+            return state.all
+        # Valeur inconnue (archétype mal tapé…) : aucun résultat, rien à mémoriser
+        if any(k not in state.buckets for k in keys):
+            return state.all[:0]
+        combo = state.combos.get(keys)
+        if combo is None:
+            arrays = sorted((state.buckets[k] for k in keys), key=len)
+            combo = arrays[0]
+            for other in arrays[1:]:
+                combo = np.intersect1d(combo, other, assume_unique=True)
+            if len(state.combos) >= MAX_COMBOS:
+                state.combos.clear()
+            state.combos[keys] = combo
+        return combo
+
+    def draw(self, **filters) -> dict | None:
+        """Carte tirée au hasard parmi celles qui satisfont les filtres, ou None."""
+        ids = self.ids(**filters)
+        if not len(ids):
+            return None
+        return card_db.get(int(ids[random.randrange(len(ids))]))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+random_buckets = RandomBuckets()
+card_db.on_refresh(random_buckets.build)
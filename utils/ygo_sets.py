@@ -0,0 +1,318 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_sets.py — Index local des sets / boosters Yu-Gi-Oh!
+# Objectif :
+#   - code de set → set
+#   - recherche normalisée par nom de set
+#   - set → cartes avec leur rareté (set_rarity)
+#   - pools de raretés précalculés pour des tirages de booster réalistes
+#   - id de carte → impressions compactes (code, rareté, prix, date TCG)
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Reconstruit automatiquement à chaque rafraîchissement de card_db
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import random
+from bisect import bisect_left
+from typing import NamedTuple
+
+from utils.text_utils import normaliser_nom
+from utils.ygo_db import CardDatabase, card_db
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 💎 Raretés
+# ────────────────────────────────────────────────────────────────────────────────
+# Classes de rareté, de la plus rare à la plus commune.
+# Chaque entrée : (classe, mots-clés présents dans set_rarity)
+RARITY_CLASSES = [
+    ("premium", ("starlight", "ghost", "collector", "ultimate", "10000", "quarter century", "platinum")),
+    ("secret", ("secret",)),
+    ("ultra", ("ultra",)),
+    ("super", ("super rare", "holographic")),
+    ("rare", ("rare",)),
+]
+DEFAULT_RARITY_CLASS = "common"
+
+# Emplacement « brillant » d'un booster : probabilités de chaque classe
+FOIL_SLOT_WEIGHTS = {
+    "premium": 1 / 288,
+    "secret": 1 / 12,
+    "ultra": 1 / 6,
+    "super": 1 - (1 / 288 + 1 / 12 + 1 / 6),
+}
+# Ordre de repli quand un set n'a pas la classe tirée
+FALLBACK_ORDER = ["premium", "secret", "ultra", "super", "rare", "common"]
+
+
+def rarity_class(set_rarity: str) -> str:
+    """Range une rareté YGOPRODeck (« Ultra Rare », « Starlight Rare »…) dans une classe."""
+    r = (set_rarity or "").lower()
+    if "short print" in r:
+        return DEFAULT_RARITY_CLASS
+    for classe, keywords in RARITY_CLASSES:
+        if any(k in r for k in keywords):
+            return classe
+    return DEFAULT_RARITY_CLASS
+
+
+def booster_slots(num_cards: int) -> list[str]:
+    """Répartition des emplacements : communes, puis une rare, puis une brillante."""
+    if num_cards <= 1:
+        return ["foil"]
+    if num_cards == 2:
+        return ["common", "foil"]
+    return ["common"] * (num_cards - 2) + ["rare", "foil"]
+
+class Printing(NamedTuple):
+    """Impression d'une carte dans un set (ex : LOB-EN001, Ultra Rare)."""
+    set_code: str        # code complet de l'impression (« LOB-EN001 »)
+    set_key: str         # code du set dans by_code (« LOB »)
+    set_name: str
+    rarity: str
+    price: float | None
+    tcg_date: str | None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Index des sets
+# ────────────────────────────────────────────────────────────────────────────────
+class SetIndex:
+    """Index en mémoire construit à partir de card_db (cartes + cardsets.php)."""
+
+    def __init__(self):
+        self.by_code: dict[str, dict] = {}
+        self.cards_by_set: dict[str, list[tuple[int, str]]] = {}
+        self.printings: dict[int, list[Printing]] = {}
+        self.pools: dict[str, dict[str, list[tuple[int, str]]]] = {}
+        self._code_by_name: dict[str, str] = {}
+        self._code_by_norm: dict[str, str] = {}
+        self._token_index: dict[str, set[str]] = {}
+        self._sorted_tokens: list[str] = []
+        self._openable: list[str] = []
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._openable)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔧 Construction
+    # ────────────────────────────────────────────────────────────────────────────
+    def build(self, db: CardDatabase):
+        by_code: dict[str, dict] = {}
+        code_by_name: dict[str, str] = {}
+        for s in db.sets:
+            code = (s.get("set_code") or "").upper()
+            name = s.get("set_name")
+            if not code or not name:
+                continue
+            meta = {
+                "set_code": code,
+                "set_name": name,
+                "num_of_cards": s.get("num_of_cards"),
+                "tcg_date": s.get("tcg_date"),
+                "set_image": s.get("set_image"),
+            }
+            # Plusieurs sets peuvent partager un code : on garde le premier
+            by_code.setdefault(code, meta)
+            code_by_name.setdefault(name, code)
+
+        cards_by_set: dict[str, list[tuple[int, str]]] = {}
+        printings: dict[int, list[Printing]] = {}
+        for card in db.cards.values():
+            seen = set()
+            card_printings = []
+            for s in card.get("card_sets", []):
+                name = s.get("set_name")
+                code = code_by_name.get(name)
+                if not code:
+                    # Set absent de cardsets.php : code déduit du préfixe (« LOB-EN001 » → « LOB »)
+                    code = (s.get("set_code") or "").split("-")[0].upper()
+                    if not code:
+                        continue
+                    by_code.setdefault(code, {"set_code": code, "set_name": name, "num_of_cards": None, "tcg_date": None, "set_image": None})
+                    code_by_name.setdefault(name, code)
+                card_printings.append(Printing(
+                    s.get("set_code") or code,
+                    code,
+                    name or by_code[code]["set_name"],
+                    s.get("set_rarity") or "Common",
+                    to_float(s.get("set_price")),
+                    by_code[code].get("tcg_date"),
+                ))
+                key = (code, s.get("set_rarity"))
+                if key in seen:
+                    continue
+                seen.add(key)
+                cards_by_set.setdefault(code, []).append((card["id"], s.get("set_rarity") or "Common"))
+            if card_printings:
+                printings[card["id"]] = card_printings
+
+        pools: dict[str, dict[str, list[tuple[int, str]]]] = {}
+        for code, entries in cards_by_set.items():
+            pool: dict[str, list[tuple[int, str]]] = {}
+            for card_id, rarity in entries:
+                pool.setdefault(rarity_class(rarity), []).append((card_id, rarity))
+            pools[code] = pool
+
+        token_index: dict[str, set[str]] = {}
+        code_by_norm: dict[str, str] = {}
+        for code, meta in by_code.items():
+            norm = normaliser_nom(meta["set_name"])
+            code_by_norm.setdefault(norm, code)
+            for tok in norm.split():
+                token_index.setdefault(tok, set()).add(code)
+
+        self.by_code = by_code
+        self.cards_by_set = cards_by_set
+        self.printings = printings
+        self.pools = pools
+        self._code_by_name = code_by_name
+        self._code_by_norm = code_by_norm
+        self._token_index = token_index
+        self._sorted_tokens = sorted(token_index)
+        self._openable = [code for code in cards_by_set if code in by_code]
+        print(f"✅ [ygo_sets] {len(self._openable)} sets indexés")
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔍 Recherche
+    # ────────────────────────────────────────────────────────────────────────────
+    def find(self, query: str) -> dict | None:
+        """Trouve un set par code exact, nom exact normalisé, puis par mots du nom."""
+        if not query:
+            return None
+        code = query.strip().upper()
+        if code in self.by_code and code in self.cards_by_set:
+            return self.by_code[code]
+
+        norm = normaliser_nom(query)
+        if norm in self._code_by_norm:
+            return self.by_code[self._code_by_norm[norm]]
+
+        words = norm.split()
+        if not words:
+            return None
+        # Intersection des codes contenant chaque mot (le dernier mot peut être un préfixe)
+        candidates: set[str] | None = None
+        for i, word in enumerate(words):
+            if i == len(words) - 1:
+                codes = set()
+                pos = bisect_left(self._sorted_tokens, word)
+                while pos < len(self._sorted_tokens) and self._sorted_tokens[pos].startswith(word):
+                    codes |= self._token_index[self._sorted_tokens[pos]]
+                    pos += 1
+            else:
+                codes = self._token_index.get(word, set())
+            candidates = codes if candidates is None else candidates & codes
+            if not candidates:
+                return None
+
+        openable = [c for c in candidates if c in self.cards_by_set]
+        if not openable:
+            return None
+        best = min(openable, key=lambda c: (not normaliser_nom(self.by_code[c]["set_name"]).startswith(norm),
+                                            len(self.by_code[c]["set_name"])))
+        return self.by_code[best]
+
+    def random_set(self) -> dict | None:
+        if not self._openable:
+            return None
+        return self.by_code[random.choice(self._openable)]
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🎴 Ouverture de booster
+    # ────────────────────────────────────────────────────────────────────────────
+    def _pick_class(self, pool: dict[str, list[tuple[int, str]]], wanted: str) -> str | None:
+        """Retourne la classe demandée si le set la possède, sinon la plus proche disponible."""
+        if pool.get(wanted):
+            return wanted
+        idx = FALLBACK_ORDER.index(wanted)
+        # D'abord vers les classes plus communes, puis vers les plus rares
+        for classe in FALLBACK_ORDER[idx + 1:] + FALLBACK_ORDER[:idx][::-1]:
+            if pool.get(classe):
+                return classe
+        return None
+
+    def open_booster(self, set_code: str, num_cards: int = 5) -> list[tuple[int, str]]:
+        """Tire num_cards cartes d'un set selon des emplacements de rareté. Retourne [(id, set_rarity)]."""
+        pool = self.pools.get(set_code, {})
+        if not pool:
+            return []
+
+        foil_classes, foil_weights = zip(*FOIL_SLOT_WEIGHTS.items())
+        pulled: list[tuple[int, str]] = []
+        used: set[int] = set()
+        for slot in booster_slots(num_cards):
+            wanted = random.choices(foil_classes, weights=foil_weights, k=1)[0] if slot == "foil" else slot
+            classe = self._pick_class(pool, wanted)
+            if classe is None:
+                break
+            entries = pool[classe]
+            card_id, rarity = random.choice(entries)
+            # Évite les doublons dans un même booster quand le pool le permet
+            for _ in range(3):
+                if card_id not in used:
+                    break
+                card_id, rarity = random.choice(entries)
+            used.add(card_id)
+            pulled.append((card_id, rarity))
+        return pulled
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 📦 Impressions d'une carte
+    # ────────────────────────────────────────────────────────────────────────────
+    def card_printings(
+        self,
+        card_id: int,
+        rarity: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        sort: str = "date",
+    ) -> list[Printing]:
+        """Impressions d'une carte, filtrées et triées (voir filter_printings)."""
+        return filter_printings(self.printings.get(int(card_id), []), rarity, date_from, date_to, sort)
+
+
+def filter_printings(
+    printings: list[Printing],
+    rarity: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    sort: str = "date",
+) -> list[Printing]:
+    """
+    Filtre et trie des impressions.
+    - rarity : sous-chaîne de la rareté (« ultra », « secret »…)
+    - date_from / date_to : bornes ISO (« 2020 », « 2020-05 », « 2020-05-01 »)
+    - sort : « date », « prix » (décroissant) ou « code »
+    """
+    result = printings
+    if rarity:
+        r = normaliser_nom(rarity)
+        result = [p for p in result if r in normaliser_nom(p.rarity)]
+    if date_from:
+        result = [p for p in result if p.tcg_date and p.tcg_date >= date_from]
+    if date_to:
+        # « 2020 » doit inclure toute l'année 2020
+        upper = date_to + "\uffff"
+        result = [p for p in result if p.tcg_date and p.tcg_date <= upper]
+
+    if sort == "prix":
+        return sorted(result, key=lambda p: -(p.price or 0))
+    if sort == "code":
+        return sorted(result, key=lambda p: p.set_code)
+    return sorted(result, key=lambda p: p.tcg_date or "9999")
+
+
+def to_float(value) -> float | None:
+    """Prix texte de l'API (« 1.23 ») → float, None si absent ou invalide."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+set_index = SetIndex()
+card_db.on_refresh(set_index.build)
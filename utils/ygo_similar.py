@@ -0,0 +1,177 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_similar.py — Cartes similaires (TF-IDF creux sur les effets)
+# Objectif :
+#   - Matrice creuse (CSR + CSC en tableaux NumPy) : TF-IDF des effets
+#     + caractéristiques catégorielles (archétype, type, race, attribut, niveau)
+#   - Voisins par produits scalaires creux vectorisés, mémorisés par carte
+#   - Table de voisins réutilisée par les quiz (ygodescription, ygoillustration)
+#     pour choisir des leurres crédibles
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# Remarques : Les termes et leurs fréquences viennent des postings de
+#             utils/ygo_fulltext.py (même découpage, rien n'est retokenisé).
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import random
+from typing import NamedTuple
+
+import numpy as np
+
+from utils.ygo_db import CardDatabase, card_db
+from utils.ygo_fulltext import fulltext_index
+
+# ────────────────────────────────────────────────────────────────────────────────
+# ⚙️ Constantes
+# ────────────────────────────────────────────────────────────────────────────────
+# Poids des caractéristiques catégorielles face au bloc texte (norme 1)
+FEATURE_WEIGHTS = {"archetype": 0.8, "type": 0.4, "race": 0.3, "attribute": 0.3, "level": 0.2}
+NEIGHBOURS = 10
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Matrice de similarité
+# ────────────────────────────────────────────────────────────────────────────────
+class Matrix(NamedTuple):
+    ids: np.ndarray
+    row_of: dict[int, int]
+    # CSR : ligne → (colonnes, poids)
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    # CSC : colonne → (lignes, poids)
+    col_ptr: np.ndarray
+    col_len: np.ndarray
+    col_rows: np.ndarray
+    col_data: np.ndarray
+    cache: dict[int, list[tuple[int, float]]]   # voisins déjà calculés pour cette matrice
+
+
+def _empty_matrix() -> Matrix:
+    return Matrix(
+        np.empty(0, dtype=np.int64), {},
+        np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32),
+        np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32),
+        np.empty(0, dtype=np.float32), {},
+    )
+
+
+class CardSimilarity:
+    def __init__(self):
+        # Remplacée d'un bloc par build() : un calcul de voisins lit toujours une matrice cohérente
+        self.matrix = _empty_matrix()
+
+    @property
+    def ready(self) -> bool:
+        return len(self.matrix.ids) > 0
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔧 Construction
+    # ────────────────────────────────────────────────────────────────────────────
+    def build(self, db: CardDatabase):
+        ft = fulltext_index.index
+        if not len(ft.ids) or len(ft.ids) != len(db.cards):
+            print("[ygo_similar] Index plein texte indisponible, similarités non calculées")
+            return
+        n_docs, n_terms = len(ft.ids), len(ft.terms)
+
+        # Bloc texte : (1 + log tf) · idf, normalisé par ligne
+        df = np.diff(ft.term_ptr)
+        idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+        text_rows = ft.post_doc.astype(np.int64)
+        text_cols = np.repeat(np.arange(n_terms, dtype=np.int64), df)
+        text_data = (1 + np.log(ft.post_tf)) * idf[text_cols]
+        norms = np.sqrt(np.bincount(text_rows, text_data ** 2, minlength=n_docs))
+        text_data = text_data / np.maximum(norms, 1e-9)[text_rows]
+
+        # Bloc catégoriel : une colonne par valeur distincte
+        features: dict[tuple[str, str], int] = {}
+        cat_rows, cat_cols, cat_data = [], [], []
+        for row, card_id in enumerate(ft.ids.tolist()):
+            card = db.cards[card_id]
+            for field, weight in FEATURE_WEIGHTS.items():
+                value = card.get(field)
+                if value in (None, ""):
+                    continue
+                cat_rows.append(row)
+                cat_cols.append(n_terms + features.setdefault((field, str(value)), len(features)))
+                cat_data.append(weight)
+
+        rows = np.concatenate([text_rows, np.asarray(cat_rows, dtype=np.int64)])
+        cols = np.concatenate([text_cols, np.asarray(cat_cols, dtype=np.int64)])
+        data = np.concatenate([text_data, np.asarray(cat_data, dtype=np.float32)]).astype(np.float32)
+        norms = np.sqrt(np.bincount(rows, data ** 2, minlength=n_docs))
+        data /= np.maximum(norms, 1e-9)[rows].astype(np.float32)
+        n_cols = n_terms + len(features)
+
+        csr = np.lexsort((cols, rows))
+        csc = np.lexsort((rows, cols))
+        col_ptr = np.searchsorted(cols[csc], np.arange(n_cols + 1)).astype(np.int64)
+        self.matrix = Matrix(
+            ids=ft.ids,
+            row_of={card_id: row for row, card_id in enumerate(ft.ids.tolist())},
+            indptr=np.searchsorted(rows[csr], np.arange(n_docs + 1)).astype(np.int64),
+            indices=cols[csr].astype(np.int32),
+            data=data[csr],
+            col_ptr=col_ptr,
+            col_len=np.diff(col_ptr),
+            col_rows=rows[csc].astype(np.int32),
+            col_data=data[csc],
+            cache={},
+        )
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔍 Voisins
+    # ────────────────────────────────────────────────────────────────────────────
+    def neighbours(self, card_id: int, k: int = NEIGHBOURS) -> list[tuple[int, float]]:
+        """Les `k` cartes les plus proches (id, similarité cosinus), la carte elle-même exclue."""
+        m = self.matrix   # un seul instantané pour tout le calcul
+        cached = m.cache.get(card_id)
+        if cached is not None and len(cached) >= k:
+            return cached[:k]
+        row = m.row_of.get(card_id)
+        # Il faut au moins une autre carte à comparer
+        if row is None or len(m.ids) < 2:
+            return []
+
+        # Produit de la ligne avec toute la matrice, via les colonnes non nulles de la ligne
+        cols = m.indices[m.indptr[row]:m.indptr[row + 1]]
+        weights = m.data[m.indptr[row]:m.indptr[row + 1]]
+        starts, counts = m.col_ptr[cols], m.col_len[cols]
+        offsets = np.repeat(starts - np.r_[0, np.cumsum(counts)[:-1]], counts) + np.arange(counts.sum())
+        scores = np.bincount(
+            m.col_rows[offsets],
+            m.col_data[offsets] * np.repeat(weights, counts),
+            minlength=len(m.ids)
+        )
+        scores[row] = -1.0
+
+        # Jamais plus de candidats que de cartes autres que celle-ci
+        size = min(max(k, NEIGHBOURS), len(scores) - 1)
+        best = np.argpartition(-scores, size - 1)[:size]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        result = [(int(m.ids[r]), float(scores[r])) for r in best if scores[r] > 0]
+        m.cache[card_id] = result
+        return result[:k]
+
+    def distractors(self, card_id: int, k: int = 3, pool: int = NEIGHBOURS) -> list[int]:
+        """
+        `k` ids tirés parmi les `pool` voisins les plus proches, de noms distincts
+        de la carte et entre eux : des leurres crédibles pour un quiz.
+        """
+        card = card_db.get(card_id) or {}
+        names = {card.get("name")}
+        candidates = []
+        for other_id, _score in self.neighbours(card_id, pool):
+            name = (card_db.get(other_id) or {}).get("name")
+            if name not in names:
+                names.add(name)
+                candidates.append(other_id)
+        return random.sample(candidates, min(k, len(candidates)))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+card_similarity = CardSimilarity()
+card_db.on_refresh(card_similarity.build)
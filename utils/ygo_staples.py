@@ -0,0 +1,108 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# 📌 ygo_staples.py — Liste des staples partagée (YGOPRODeck staple=yes)
+# Objectif :
+#   - Télécharger la liste des staples une fois par rafraîchissement
+#   - Matérialiser un set d'ids staples + un tableau d'ids non-staples
+#   - Servir /ygostaples et le minijeu « staple ou pas » sans requête HTTP
+# Catégorie : 🧠 Utils
+# Accès : Tous
+# ────────────────────────────────────────────────────────────────────────────────
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 📦 Imports nécessaires
+# ────────────────────────────────────────────────────────────────────────────────
+import json
+import random
+from pathlib import Path
+
+import aiohttp
+
+from utils.ygo_db import CARDINFO_URL, CardDatabase, card_db
+
+STAPLES_PATH = Path("database/ygo_staples.json")
+
+# Types exclus du tirage « non staple » (pas de vraies cartes jouables)
+EXCLUDED_TYPES = ("Token", "Skill Card")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🗂️ Index des staples
+# ────────────────────────────────────────────────────────────────────────────────
+class StapleIndex:
+    def __init__(self, path: Path = STAPLES_PATH):
+        self.path = path
+        self.staple_ids: set[int] = set()
+        self.staples: list[int] = []        # triés par nom affiché
+        self.non_staples: list[int] = []
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.staples) and bool(self.non_staples)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 💾 Persistance
+    # ────────────────────────────────────────────────────────────────────────────
+    def load(self):
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                self.staple_ids = set(json.load(f))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"[ygo_staples] Fichier illisible : {e}")
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(sorted(self.staple_ids), f)
+        tmp.replace(self.path)
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔄 Rafraîchissement (1 requête)
+    # ────────────────────────────────────────────────────────────────────────────
+    async def refresh(self, session: aiohttp.ClientSession) -> bool:
+        async with session.get(CARDINFO_URL, params={"staple": "yes"}) as resp:
+            if resp.status != 200:
+                return False
+            data = await resp.json(content_type=None)
+        ids = {c["id"] for c in data.get("data", []) if "id" in c}
+        if not ids:
+            return False
+        if ids != self.staple_ids:
+            self.staple_ids = ids
+            self.save()
+        self.build(card_db)
+        return True
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🔧 Construction des tableaux
+    # ────────────────────────────────────────────────────────────────────────────
+    def build(self, db: CardDatabase):
+        staple_ids = self.staple_ids
+        self.staples = sorted(
+            (cid for cid in staple_ids if cid in db.cards),
+            key=lambda cid: (db.cards[cid].get("name_fr") or db.cards[cid]["name"]).lower()
+        )
+        self.non_staples = [
+            cid for cid, card in db.cards.items()
+            if cid not in staple_ids and card.get("type") not in EXCLUDED_TYPES
+        ]
+
+    # ────────────────────────────────────────────────────────────────────────────
+    # 🎲 Tirages
+    # ────────────────────────────────────────────────────────────────────────────
+    def is_staple(self, card_id: int) -> bool:
+        return int(card_id) in self.staple_ids
+
+    def random_staple(self) -> int | None:
+        return random.choice(self.staples) if self.staples else None
+
+    def random_non_staple(self) -> int | None:
+        return random.choice(self.non_staples) if self.non_staples else None
+
+# ────────────────────────────────────────────────────────────────────────────────
+# 🌍 Instance partagée
+# ────────────────────────────────────────────────────────────────────────────────
+staple_index = StapleIndex()
+staple_index.load()
+card_db.on_refresh(staple_index.build)